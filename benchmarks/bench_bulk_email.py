@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+
+"""
+Bulk email validation (src/bulk_validation.py).
+
+Times validate_emails with and without its LRU cache on data where most
+addresses repeat, and validate_email_file on a temporary file of the same
+addresses with 1, 2 and 4 worker processes.
+
+Usage: python -m benchmarks.bench_bulk_email [--emails N] [--distinct N]
+"""
+import argparse
+import os
+import random
+import tempfile
+from functools import partial
+
+from benchmarks.common import best_time, report
+from src.bulk_validation import validate_email_file, validate_emails
+from src.white_box import validate_email
+
+
+def main(argv=None):
+    """
+    Command line entry point.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--emails", type=int, default=1_000_000)
+    parser.add_argument("--distinct", type=int, default=10_000)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(0)
+    distinct = [
+        f"user{index}@example.com" if index % 10 else f"user{index}"
+        for index in range(args.distinct)
+    ]
+    emails = rng.choices(distinct, k=args.emails)
+
+    seconds, expected = best_time(lambda: list(map(validate_email, emails)))
+    report("map(validate_email)", len(emails), seconds, "emails")
+    seconds, results = best_time(lambda: list(validate_emails(emails)))
+    assert results == expected
+    report("validate_emails", len(emails), seconds, "emails")
+    seconds, results = best_time(
+        lambda: list(validate_emails(emails, cache_size=args.distinct))
+    )
+    assert results == expected
+    report("validate_emails (cached)", len(emails), seconds, "emails")
+
+    with tempfile.NamedTemporaryFile(
+        "w", suffix=".txt", delete=False, encoding="utf-8"
+    ) as emails_file:
+        emails_file.writelines(email + "\n" for email in emails)
+    try:
+        for workers in (1, 2, 4):
+            seconds, results = best_time(
+                partial(validate_email_file, emails_file.name, workers=workers)
+            )
+            assert list(results) == expected
+            label = f"validate_email_file, {workers} workers"
+            report(label, len(emails), seconds, "emails")
+    finally:
+        os.remove(emails_file.name)
+
+
+if __name__ == "__main__":
+    main()
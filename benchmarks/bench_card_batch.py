@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+
+"""
+Card batch validation throughput (src/card_batch.py).
+
+Usage: python -m benchmarks.bench_card_batch [--cards N]
+"""
+import argparse
+import os
+import random
+import tempfile
+
+from benchmarks.common import best_time, report
+from src.card_batch import (
+    DEFAULT_BIN_TABLE,
+    validate_card_buffer,
+    validate_card_file,
+    validate_cards,
+)
+
+
+def make_cards(count, seed=0):
+    """
+    Random 16-digit Visa-like card numbers with a valid Luhn check digit.
+    """
+    rng = random.Random(seed)
+    cards = []
+    for _ in range(count):
+        digits = [4] + [rng.randrange(10) for _ in range(14)]
+        total = 0
+        for position, digit in enumerate(reversed(digits)):
+            if position % 2 == 0:
+                digit = digit * 2 - 9 if digit > 4 else digit * 2
+            total += digit
+        digits.append(-total % 10)
+        cards.append("".join(map(str, digits)).encode())
+    return cards
+
+
+def main(argv=None):
+    """
+    Command line entry point.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--cards", type=int, default=300_000)
+    args = parser.parse_args(argv)
+
+    cards = make_cards(args.cards)
+    buffer = b"\n".join(cards)
+
+    seconds, results = best_time(lambda: validate_cards(cards))
+    assert all(results)
+    report("validate_cards (Luhn)", len(cards), seconds, "cards")
+
+    seconds, results = best_time(lambda: validate_cards(cards, DEFAULT_BIN_TABLE))
+    assert all(results)
+    report("validate_cards (Luhn + BIN)", len(cards), seconds, "cards")
+
+    seconds, results = best_time(lambda: validate_card_buffer(buffer))
+    assert all(results)
+    report("validate_card_buffer", len(cards), seconds, "cards")
+
+    handle, path = tempfile.mkstemp(suffix=".txt")
+    try:
+        with os.fdopen(handle, "wb") as cards_file:
+            cards_file.write(buffer + b"\n")
+        seconds, (bitmap, rows) = best_time(lambda: validate_card_file(path))
+        assert rows == len(cards) and bitmap.count(0xFF) == len(cards) // 8
+        report("validate_card_file (mmap)", len(cards), seconds, "cards")
+    finally:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
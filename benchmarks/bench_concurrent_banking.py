@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+"""
+Stress test of concurrent transfers (src/concurrent_banking.py).
+
+Runs random transfers between funded accounts on 1, 2, 4 and 8 threads,
+checks that no money was created or destroyed, and reports the throughput
+at each thread count.
+
+Usage: python -m benchmarks.bench_concurrent_banking [--transfers N]
+"""
+import argparse
+import random
+import threading
+import time
+
+from benchmarks.common import report
+from src.concurrent_banking import ConcurrentBankingSystem
+
+TRANSFER_TYPES = ("regular", "express", "scheduled")
+
+
+def run(accounts, transfers, threads):
+    """
+    Runs `transfers` random transfers split over `threads` threads.
+    Returns the elapsed seconds.
+    """
+    banking_system = ConcurrentBankingSystem(quiet=True)
+    names = [f"account{index}" for index in range(accounts)]
+    for name in names:
+        banking_system.open_account(name, 1_000_000)
+    banking_system.logged_in_users.update(names)
+    before = sum(account.balance for account in banking_system.accounts.values())
+
+    def worker(seed):
+        rng = random.Random(seed)
+        transfer = banking_system.transfer
+        for _ in range(transfers // threads):
+            sender, receiver = rng.sample(names, 2)
+            transfer(sender, receiver, rng.randint(1, 100), rng.choice(TRANSFER_TYPES))
+
+    workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    start = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    after = sum(account.balance for account in banking_system.accounts.values())
+    if abs(after - before) > 1e-6 * before:
+        raise SystemExit(f"Money not conserved: {before} -> {after}")
+    return elapsed
+
+
+def main(argv=None):
+    """
+    Command line entry point.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--accounts", type=int, default=64)
+    parser.add_argument("--transfers", type=int, default=80_000)
+    args = parser.parse_args(argv)
+
+    for threads in (1, 2, 4, 8):
+        seconds = run(args.accounts, args.transfers, threads)
+        count = args.transfers // threads * threads
+        report(f"{threads} thread(s)", count, seconds, "transfers")
+
+
+if __name__ == "__main__":
+    main()
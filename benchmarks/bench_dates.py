@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+
+"""
+Calendar-correct date validation (src/white_box.py, src/bulk_validation.py).
+
+validate_date looks each (year, month) up in the precomputed DAYS_IN_MONTH
+table; it is compared with building a datetime.date, the usual way to check
+a date, and validate_dates with the same check over year, month and day
+columns.
+
+Usage: python -m benchmarks.bench_dates [--dates N]
+"""
+import argparse
+import datetime
+import random
+from functools import partial
+
+from benchmarks.common import best_time, report
+from src.bulk_validation import validate_dates
+from src.white_box import DATE_MAX_YEAR, DATE_MIN_YEAR, validate_date
+
+
+def datetime_validate_date(year, month, day):
+    """
+    validate_date through datetime.date.
+    """
+    if not DATE_MIN_YEAR <= year <= DATE_MAX_YEAR:
+        return "Invalid Date"
+    try:
+        datetime.date(year, month, day)
+    except ValueError:
+        return "Invalid Date"
+    return "Valid Date"
+
+
+def main(argv=None):
+    """
+    Command line entry point.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--dates", type=int, default=500_000)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(0)
+    years = [rng.randint(1890, 2110) for _ in range(args.dates)]
+    months = [rng.randint(0, 13) for _ in range(args.dates)]
+    days = [rng.randint(0, 32) for _ in range(args.dates)]
+
+    seconds, expected = best_time(
+        lambda: list(map(datetime_validate_date, years, months, days))
+    )
+    report("datetime.date", args.dates, seconds, "dates")
+    seconds, results = best_time(lambda: list(map(validate_date, years, months, days)))
+    assert results == expected
+    report("validate_date", args.dates, seconds, "dates")
+    seconds, flags = best_time(partial(validate_dates, years, months, days))
+    assert flags == [result == "Valid Date" for result in expected]
+    report("validate_dates", args.dates, seconds, "dates")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+
+"""
+Elevator dispatch wait times and simulation speed (src/elevator_dispatch.py).
+
+Replays the same random stream of calls through simulate() with 1, 2, 4 and
+8 cars, and reports the average and longest wait of the calls next to how
+many calls per second of wall-clock time the simulation handles.
+
+Usage: python -m benchmarks.bench_elevators [--calls N] [--floors N]
+"""
+import argparse
+import random
+from functools import partial
+
+from benchmarks.common import best_time
+from src.elevator_dispatch import simulate
+
+
+def random_calls(count, floors, rate, rng):
+    """
+    `count` calls arriving `rate` per time unit on average, half of them
+    from the ground floor.
+    """
+    calls = []
+    now = 0.0
+    for _ in range(count):
+        now += rng.expovariate(rate)
+        floor = 0 if rng.random() < 0.5 else rng.randrange(floors)
+        destination = rng.choice([other for other in range(floors) if other != floor])
+        calls.append((now, floor, destination))
+    return calls
+
+
+def main(argv=None):
+    """
+    Command line entry point.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=50_000)
+    parser.add_argument("--floors", type=int, default=20)
+    parser.add_argument("--rate", type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    calls = random_calls(args.calls, args.floors, args.rate, random.Random(0))
+    for elevators in (1, 2, 4, 8):
+        seconds, result = best_time(
+            partial(simulate, calls, elevators=elevators, floors=args.floors)
+        )
+        if result.calls != len(calls):
+            raise SystemExit(f"{len(calls) - result.calls} calls never picked up")
+        print(
+            f"{elevators} car(s)  average wait {result.average_wait:8.1f}"
+            f"  max wait {result.max_wait:9.1f}"
+            f"  {len(calls) / seconds:>10,.0f} calls/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+
+"""
+Interval-table functions against the ladders they replaced (src/white_box.py).
+
+The ladders below are the original implementations, kept here as the
+reference; categorize_product is compared on whole prices, where the old
+gaps between its buckets do not matter.
+
+Usage: python -m benchmarks.bench_intervals [--calls N]
+"""
+import argparse
+import random
+from functools import partial
+
+from benchmarks.common import best_time
+from src import white_box
+
+
+def get_grade(score):
+    """Original get_grade ladder."""
+    if score >= 90:
+        return "A"
+    if score >= 80:
+        return "B"
+    if score >= 70:
+        return "C"
+    return "F"
+
+
+def categorize_product(price):
+    """Original categorize_product ladder."""
+    if 10 <= price <= 50:
+        return "Category A"
+    if 51 <= price <= 100:
+        return "Category B"
+    if 101 <= price <= 200:
+        return "Category C"
+    return "Category D"
+
+
+def verify_age(age):
+    """Original verify_age ladder."""
+    if 18 <= age <= 65:
+        return "Eligible"
+    return "Not Eligible"
+
+
+def calculate_quantity_discount(quantity):
+    """Original calculate_quantity_discount ladder."""
+    if 1 <= quantity <= 5:
+        return "No Discount"
+    if 6 <= quantity <= 10:
+        return "5% Discount"
+    return "10% Discount"
+
+
+def check_file_size(size_in_bytes):
+    """Original check_file_size ladder."""
+    if 0 <= size_in_bytes <= 1048576:
+        return "Valid File Size"
+    return "Invalid File Size"
+
+
+def classify_all(function, numbers):
+    """
+    Calls `function` on every number.
+    """
+    return list(map(function, numbers))
+
+
+def main(argv=None):
+    """
+    Command line entry point.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=200_000)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(0)
+    cases = (
+        (get_grade, [rng.uniform(0, 100) for _ in range(args.calls)]),
+        (categorize_product, [rng.randrange(0, 250) for _ in range(args.calls)]),
+        (verify_age, [rng.randrange(0, 100) for _ in range(args.calls)]),
+        (calculate_quantity_discount, [rng.randrange(20) for _ in range(args.calls)]),
+        (check_file_size, [rng.randrange(2 << 20) for _ in range(args.calls)]),
+    )
+    for ladder, numbers in cases:
+        table = getattr(white_box, ladder.__name__)
+        if classify_all(ladder, numbers) != classify_all(table, numbers):
+            raise SystemExit(f"{ladder.__name__}: results differ from the ladder")
+        ladder_time, _ = best_time(partial(classify_all, ladder, numbers), repeat=7)
+        table_time, _ = best_time(partial(classify_all, table, numbers), repeat=7)
+        print(
+            f"{ladder.__name__:<30} ladder {ladder_time * 1000:6.1f} ms"
+            f"  table {table_time * 1000:6.1f} ms  {table_time / ladder_time:.2f}x"
+        )
+
+    classify = white_box._PRODUCT_CATEGORY_CODES  # pylint: disable=protected-access
+    prices = cases[1][1]
+    seconds, _ = best_time(lambda: classify.classify_many(prices), repeat=7)
+    print(f"{'categorize_products (batch)':<30} {seconds * 1000:6.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
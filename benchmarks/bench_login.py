@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+
+"""
+Login throughput with cold and warm credential caches (src/credentials.py).
+
+A cold login pays the full PBKDF2 hash; a warm one is answered from the
+VerifiedCredentialCache.
+
+Usage: python -m benchmarks.bench_login [--users N] [--iterations N]
+"""
+import argparse
+
+from benchmarks.common import best_time, report
+from src.credentials import CredentialStore, VerifiedCredentialCache
+from src.white_box import authenticate_user
+
+
+def main(argv=None):
+    """
+    Command line entry point.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--iterations", type=int, default=100_000)
+    parser.add_argument("--warm-logins", type=int, default=100_000)
+    args = parser.parse_args(argv)
+
+    users = {f"user{index}": f"password{index}" for index in range(args.users)}
+    store = CredentialStore(
+        users,
+        iterations=args.iterations,
+        cache=VerifiedCredentialCache(maxsize=args.users),
+    )
+
+    def log_in_all():
+        return [store.verify(user, password) for user, password in users.items()]
+
+    seconds, results = best_time(log_in_all, repeat=1)
+    assert all(results)
+    report("cold cache", len(users), seconds, "logins")
+
+    credentials = list(users.items()) * -(-args.warm_logins // len(users))
+    credentials = credentials[: args.warm_logins]
+    seconds, results = best_time(
+        lambda: [store.verify(user, password) for user, password in credentials]
+    )
+    assert all(results)
+    report("warm cache", len(credentials), seconds, "logins")
+
+    seconds, _ = best_time(
+        lambda: [authenticate_user(user, password) for user, password in credentials]
+    )
+    report("authenticate_user (non-admin)", len(credentials), seconds, "logins")
+
+
+if __name__ == "__main__":
+    main()
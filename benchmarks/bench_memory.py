@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+
+"""
+Memory per record of products and bank accounts (src/white_box.py).
+
+Compares a plain class with a per-instance __dict__, the slotted Product
+and BankAccount, and the columnar ProductCatalog. The names and prices are
+created up front, so only the records themselves are measured.
+
+Usage: python -m benchmarks.bench_memory [--records N]
+"""
+import argparse
+
+from benchmarks.common import allocated_bytes
+from src.white_box import BankAccount, Product, ProductCatalog
+
+
+class PlainRecord:  # pylint: disable=too-few-public-methods
+    """
+    Two-field record with a per-instance __dict__, the old layout.
+    """
+
+    def __init__(self, name, value):
+        self.name = name
+        self.value = value
+
+
+def main(argv=None):
+    """
+    Command line entry point.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--records", type=int, default=200_000)
+    args = parser.parse_args(argv)
+
+    names = [f"product-{index}" for index in range(args.records)]
+    prices = [index * 0.01 for index in range(args.records)]
+
+    def catalog():
+        products = ProductCatalog()
+        for name, price in zip(names, prices):
+            products.add_product(name, price)
+        return products
+
+    layouts = (
+        ("plain class", lambda: list(map(PlainRecord, names, prices))),
+        ("Product (__slots__)", lambda: list(map(Product, names, prices))),
+        ("BankAccount (__slots__)", lambda: list(map(BankAccount, names, prices))),
+        ("ProductCatalog", catalog),
+    )
+    for label, build in layouts:
+        size, _ = allocated_bytes(build)
+        print(f"{label:<32} {size / args.records:>8.1f} bytes/record")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+
+"""
+Order totals and discounts in float, Decimal and integer cents (src/money.py).
+
+The float and cents rows run calculate_order_total and
+calculate_total_discount in their two money modes. The repository has no
+Decimal mode, so the Decimal rows use the reference functions below, which
+round each discounted line to the cent like the cents mode.
+
+Usage: python -m benchmarks.bench_money [--orders N]
+"""
+import argparse
+import random
+from decimal import ROUND_HALF_UP, Decimal
+
+from benchmarks.common import best_time, report
+from src.money import MONEY_CENTS, MONEY_FLOAT
+from src.white_box import calculate_order_total, calculate_total_discount
+
+CENT = Decimal("0.01")
+TIER_RATES = (Decimal(1), Decimal("0.95"), Decimal("0.9"))
+
+
+def decimal_order_total(items):
+    """
+    calculate_order_total for Decimal prices, rounding each line to the cent.
+    """
+    total_price = Decimal(0)
+    for item in items:
+        quantity = item["quantity"]
+        rate = TIER_RATES[0 if quantity <= 5 else 1 if quantity <= 10 else 2]
+        line_price = rate * quantity * item["price"]
+        total_price += line_price.quantize(CENT, ROUND_HALF_UP)
+    return total_price
+
+
+def decimal_total_discount(total_amount):
+    """
+    calculate_total_discount for a Decimal amount, rounded to the cent.
+    """
+    if total_amount <= 100:
+        return Decimal(0)
+    rate = Decimal("0.1") if total_amount <= 500 else Decimal("0.2")
+    return (rate * total_amount).quantize(CENT, ROUND_HALF_UP)
+
+
+def with_prices(orders, convert):
+    """
+    Copies the orders with every price in cents passed through `convert`.
+    """
+    return [
+        [
+            {"quantity": item["quantity"], "price": convert(item["price"])}
+            for item in items
+        ]
+        for items in orders
+    ]
+
+
+def main(argv=None):
+    """
+    Command line entry point.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--orders", type=int, default=100_000)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(0)
+    cents_orders = [
+        [
+            {"quantity": rng.randint(1, 15), "price": rng.randint(1, 10_000)}
+            for _ in range(rng.randint(1, 9))
+        ]
+        for _ in range(args.orders)
+    ]
+    float_orders = with_prices(cents_orders, lambda cents: cents / 100)
+    decimal_orders = with_prices(cents_orders, lambda cents: Decimal(cents) / 100)
+
+    seconds, float_totals = best_time(
+        lambda: [calculate_order_total(items, MONEY_FLOAT) for items in float_orders]
+    )
+    report("order total, float", len(float_orders), seconds, "orders")
+    seconds, decimal_totals = best_time(
+        lambda: [decimal_order_total(items) for items in decimal_orders]
+    )
+    report("order total, Decimal", len(decimal_orders), seconds, "orders")
+    seconds, cents_totals = best_time(
+        lambda: [calculate_order_total(items, MONEY_CENTS) for items in cents_orders]
+    )
+    report("order total, int cents", len(cents_orders), seconds, "orders")
+
+    if [total * 100 for total in decimal_totals] != cents_totals:
+        raise SystemExit("Decimal and cents totals differ")
+
+    seconds, _ = best_time(
+        lambda: [calculate_total_discount(total, MONEY_FLOAT) for total in float_totals]
+    )
+    report("discount, float", len(float_totals), seconds, "amounts")
+    seconds, _ = best_time(
+        lambda: [decimal_total_discount(total) for total in decimal_totals]
+    )
+    report("discount, Decimal", len(decimal_totals), seconds, "amounts")
+    seconds, _ = best_time(
+        lambda: [calculate_total_discount(total, MONEY_CENTS) for total in cents_totals]
+    )
+    report("discount, int cents", len(cents_totals), seconds, "amounts")
+
+
+if __name__ == "__main__":
+    main()
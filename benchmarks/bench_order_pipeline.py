@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+
+"""
+Parallel order pricing against the inline loop (src/order_pipeline.py).
+
+price_orders_parallel sends each chunk of orders to the workers as
+quantity, price and offset columns. The "dict chunks" row maps
+calculate_order_total over the orders themselves, so every item dict is
+pickled, which is what the columns replace.
+
+Usage: python -m benchmarks.bench_order_pipeline [--orders N]
+"""
+import argparse
+import random
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from benchmarks.common import best_time, report
+from src.order_pipeline import price_orders_parallel
+from src.white_box import calculate_order_total
+
+
+def price_dict_chunks(orders, workers):
+    """
+    Prices the orders by pickling their item dicts to the workers.
+    """
+    chunksize = max(1, -(-len(orders) // (workers * 4)))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(calculate_order_total, orders, chunksize=chunksize))
+
+
+def main(argv=None):
+    """
+    Command line entry point.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--orders", type=int, default=200_000)
+    parser.add_argument("--items", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(0)
+    orders = [
+        [
+            {"quantity": rng.randint(1, 15), "price": rng.randint(1, 10_000) / 100}
+            for _ in range(rng.randint(1, 2 * args.items - 1))
+        ]
+        for _ in range(args.orders)
+    ]
+
+    seconds, expected = best_time(partial(price_orders_parallel, orders, workers=1))
+    report("inline", len(orders), seconds, "orders")
+    for workers in (2, 4):
+        seconds, totals = best_time(partial(price_dict_chunks, orders, workers))
+        assert totals == expected
+        report(f"dict chunks, {workers} workers", len(orders), seconds, "orders")
+        seconds, totals = best_time(
+            partial(price_orders_parallel, orders, workers=workers)
+        )
+        assert totals == expected
+        report(f"column chunks, {workers} workers", len(orders), seconds, "orders")
+
+
+if __name__ == "__main__":
+    main()
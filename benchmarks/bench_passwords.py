@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+
+"""
+Password validation against the four-regex original (src/white_box.py).
+
+validate_password classifies the characters in one pass; the original
+below scans the password with one regex per rule.
+
+Usage: python -m benchmarks.bench_passwords [--passwords N]
+"""
+import argparse
+import random
+import re
+import string
+from functools import partial
+
+from benchmarks.common import best_time, report
+from src.white_box import validate_password, validate_passwords
+
+ALPHABET = string.ascii_letters + string.digits + "!@#$%&*-_ "
+
+
+def regex_validate_password(password):
+    """Original validate_password."""
+    if len(password) < 8:
+        return False
+    if (
+        not re.search(r"[A-Z]", password)
+        or not re.search(r"[a-z]", password)
+        or not re.search(r"\d", password)
+        or not re.search(r"[!@#$%&]", password)
+    ):
+        return False
+    return True
+
+
+def main(argv=None):
+    """
+    Command line entry point.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--passwords", type=int, default=200_000)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(0)
+    passwords = [
+        "".join(rng.choices(ALPHABET, k=rng.randint(4, 20)))
+        for _ in range(args.passwords)
+    ]
+
+    seconds, expected = best_time(lambda: list(map(regex_validate_password, passwords)))
+    report("regex original", len(passwords), seconds, "passwords")
+    seconds, results = best_time(lambda: list(map(validate_password, passwords)))
+    assert results == expected
+    report("validate_password", len(passwords), seconds, "passwords")
+    seconds, results = best_time(partial(validate_passwords, passwords))
+    assert results == expected
+    report("validate_passwords", len(passwords), seconds, "passwords")
+    seconds, (results, _) = best_time(
+        partial(validate_passwords, passwords, with_reasons=True)
+    )
+    assert results == expected
+    report("validate_passwords (reasons)", len(passwords), seconds, "passwords")
+    print(f"valid: {sum(expected):,} of {len(passwords):,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+
+"""
+Session store throughput and memory per session (src/sessions.py).
+
+Compares SessionManager with a dict of UserAuthentication objects plus a
+dict of expiry times, the layout it replaces.
+
+Usage: python -m benchmarks.bench_sessions [--users N]
+"""
+import argparse
+
+from benchmarks.common import allocated_bytes, best_time, report
+from src.sessions import SessionManager
+from src.white_box import UserAuthentication
+
+
+class FakeClock:  # pylint: disable=too-few-public-methods
+    """
+    Clock moved by hand, so expiry can be benchmarked without waiting.
+    """
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def timed(function):
+    """
+    Returns the seconds taken by one run of `function`.
+    """
+    return best_time(function, repeat=1)[0]
+
+
+def bench_manager(users, ttl):
+    """
+    Times login, touch, logout and expire of `users` sessions.
+    """
+    clock = FakeClock()
+    manager = SessionManager(ttl=ttl, clock=clock)
+    login, touch, logout = manager.login, manager.touch, manager.logout
+
+    report("login", len(users), timed(lambda: list(map(login, users))), "sessions")
+    clock.now = ttl / 2
+    report("touch", len(users), timed(lambda: list(map(touch, users))), "sessions")
+    half = users[: len(users) // 2]
+    report("logout", len(half), timed(lambda: list(map(logout, half))), "sessions")
+
+    clock.now = ttl * 2
+    seconds = timed(manager.expire)
+    if len(manager):
+        raise SystemExit(f"{len(manager)} sessions left after expiry")
+    report("expire", len(users) - len(half), seconds, "sessions")
+
+
+def bench_memory(users, ttl):
+    """
+    Prints the memory per session of both layouts.
+    """
+
+    def manager():
+        sessions = SessionManager(ttl=ttl, clock=lambda: 0.0)
+        for user in users:
+            sessions.login(user)
+        return sessions
+
+    def objects():
+        sessions, expires = {}, {}
+        for user in users:
+            session = sessions[user] = UserAuthentication()
+            session.login()
+            expires[user] = ttl
+        return sessions, expires
+
+    for label, build in (("SessionManager", manager), ("dict of objects", objects)):
+        size, _ = allocated_bytes(build)
+        print(f"{label:<32} {size / len(users):>8.1f} bytes/session")
+
+
+def main(argv=None):
+    """
+    Command line entry point.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--users", type=int, default=1_000_000)
+    parser.add_argument("--ttl", type=float, default=1800.0)
+    args = parser.parse_args(argv)
+
+    users = [f"user{index}" for index in range(args.users)]
+    bench_manager(users, args.ttl)
+    bench_memory(users, args.ttl)
+
+
+if __name__ == "__main__":
+    main()
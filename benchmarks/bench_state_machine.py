@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+
+"""
+Table-driven state machines against their if ladders (src/state_machine.py).
+
+The ladder classes below are the original VendingMachine and TrafficLight.
+A random log of events is fired on each machine through its methods, and
+on the table-driven VendingMachine through replay as well.
+
+Usage: python -m benchmarks.bench_state_machine [--events N]
+"""
+import argparse
+import random
+
+from benchmarks.common import best_time, report
+from src.white_box import TrafficLight, VendingMachine
+
+
+class LadderVendingMachine:
+    """Original VendingMachine."""
+
+    def __init__(self):
+        self.state = "Ready"
+
+    def insert_coin(self):
+        """Original insert_coin."""
+        if self.state == "Ready":
+            self.state = "Dispensing"
+            return "Coin Inserted. Select your drink."
+        return "Invalid operation in current state."
+
+    def select_drink(self):
+        """Original select_drink."""
+        if self.state == "Dispensing":
+            self.state = "Ready"
+            return "Drink Dispensed. Thank you!"
+        return "Invalid operation in current state."
+
+
+class LadderTrafficLight:  # pylint: disable=too-few-public-methods
+    """Original TrafficLight."""
+
+    def __init__(self):
+        self.state = "Red"
+
+    def change_state(self):
+        """Original change_state."""
+        if self.state == "Red":
+            self.state = "Green"
+        elif self.state == "Green":
+            self.state = "Yellow"
+        elif self.state == "Yellow":
+            self.state = "Red"
+
+
+def time_events(machine_class, events):
+    """
+    Fires the events on a new `machine_class` machine by calling its
+    methods, which are looked up before the clock starts.
+    Returns the best time and the results and final state of the machine.
+    """
+    methods = [getattr(machine_class, event) for event in events]
+
+    def run():
+        machine = machine_class()
+        return [method(machine) for method in methods], machine.state
+
+    return best_time(run)
+
+
+def main(argv=None):
+    """
+    Command line entry point.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--events", type=int, default=500_000)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(0)
+    events = rng.choices(("insert_coin", "select_drink"), k=args.events)
+
+    seconds, expected = time_events(LadderVendingMachine, events)
+    report("vending, ladder", len(events), seconds, "events")
+    seconds, results = time_events(VendingMachine, events)
+    assert results == expected
+    report("vending, table", len(events), seconds, "events")
+    machine = VendingMachine()
+    seconds, _ = best_time(lambda: machine.replay(events), repeat=1)
+    assert machine.state == expected[1]
+    report("vending, replay", len(events), seconds, "events")
+
+    changes = ["change_state"] * args.events
+    seconds, expected = time_events(LadderTrafficLight, changes)
+    report("traffic light, ladder", len(changes), seconds, "events")
+    seconds, results = time_events(TrafficLight, changes)
+    assert results == expected
+    report("traffic light, table", len(changes), seconds, "events")
+
+
+if __name__ == "__main__":
+    main()
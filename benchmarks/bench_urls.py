@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+
+"""
+URL validation, single and batch (src/white_box.py, src/bulk_validation.py).
+
+The original validate_url below is kept as the reference. Its and/or
+precedence let any https:// URL through whatever its length, so its
+results differ on long https URLs and only its speed is compared.
+
+Usage: python -m benchmarks.bench_urls [--urls N]
+"""
+import argparse
+import random
+from functools import partial
+
+from benchmarks.common import best_time, report
+from src.bulk_validation import parse_urls, validate_urls
+from src.white_box import validate_url
+
+
+def original_validate_url(url):
+    """Original validate_url."""
+    if len(url) <= 255 and url.startswith("http://") or url.startswith("https://"):
+        return "Valid URL"
+    return "Invalid URL"
+
+
+def main(argv=None):
+    """
+    Command line entry point.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--urls", type=int, default=500_000)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(0)
+    schemes = ("http://", "https://", "ftp://", "")
+    urls = [
+        f"{rng.choice(schemes)}host{index}.example.com/{'p' * rng.randrange(300)}"
+        for index in range(args.urls)
+    ]
+
+    seconds, _ = best_time(lambda: list(map(original_validate_url, urls)))
+    report("original validate_url", len(urls), seconds, "urls")
+    seconds, expected = best_time(lambda: list(map(validate_url, urls)))
+    report("validate_url", len(urls), seconds, "urls")
+    seconds, results = best_time(lambda: list(validate_urls(urls)))
+    assert results == expected
+    report("validate_urls", len(urls), seconds, "urls")
+    seconds, columns = best_time(partial(parse_urls, urls))
+    assert columns["valid"] == [result == "Valid URL" for result in expected]
+    report("parse_urls", len(urls), seconds, "urls")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+
+"""
+Timing and memory helpers shared by the benchmark scripts.
+"""
+import gc
+import time
+import tracemalloc
+
+
+def best_time(function, repeat=3):
+    """
+    Runs `function` `repeat` times and returns the fastest run in seconds
+    and the result of the last run.
+    """
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = function()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def allocated_bytes(function):
+    """
+    Returns the bytes still allocated by `function` when it returns, and
+    its result (which keeps the allocation alive).
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = function()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return after - before, result
+
+
+def report(label, count, seconds, unit="ops"):
+    """
+    Prints the rate of `count` operations done in `seconds`.
+    """
+    rate = count / seconds if seconds else float("inf")
+    print(f"{label:<32} {rate:>14,.0f} {unit}/s")
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+
+"""
+asyncio front end for the banking system.
+"""
+import asyncio
+
+from src.concurrent_banking import ConcurrentBankingSystem
+
+
+class AsyncBankingSystem:
+    """
+    Awaitable facade over a thread-safe banking system.
+    Every call runs in `executor` (the loop's default executor when None), so
+    printing or a slow sink never blocks the event loop. The wrapped
+    `banking_system` can still be used synchronously; both share its state.
+    """
+
+    def __init__(
+        self, banking_system=None, executor=None, max_concurrency=64, money=None
+    ):
+        """
+        Wrap `banking_system`, by default a quiet ConcurrentBankingSystem in
+        the `money` mode (the global mode when None).
+        """
+        if banking_system is None:
+            banking_system = ConcurrentBankingSystem(quiet=True, money=money)
+        self.banking_system = banking_system
+        self.executor = executor
+        self.max_concurrency = max_concurrency
+
+    async def _run(self, function, *args):
+        """
+        Runs a synchronous banking call in the executor.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, function, *args)
+
+    async def authenticate(self, username, password):
+        """
+        User authentication function.
+        """
+        return await self._run(self.banking_system.authenticate, username, password)
+
+    async def transfer(self, sender, receiver, amount, transaction_type):
+        """
+        Performs a money transfer and returns a TransferResult.
+        """
+        return await self._run(
+            self.banking_system.transfer, sender, receiver, amount, transaction_type
+        )
+
+    async def transfer_batch(self, transfers, max_concurrency=None):
+        """
+        Submits many (sender, receiver, amount, transaction_type) transfers,
+        from a regular or an async iterable.
+        At most `max_concurrency` transfers are in flight; the next one is only
+        pulled from `transfers` when a slot frees up.
+        Returns the TransferResults in input order.
+        """
+        slots = asyncio.Semaphore(max_concurrency or self.max_concurrency)
+        tasks = []
+
+        async def submit(request):
+            try:
+                return await self.transfer(*request)
+            finally:
+                slots.release()
+
+        async for request in _aiter(transfers):
+            await slots.acquire()
+            tasks.append(asyncio.ensure_future(submit(request)))
+
+        return list(await asyncio.gather(*tasks))
+
+
+async def _aiter(iterable):
+    """
+    Iterates a regular or an async iterable asynchronously.
+    """
+    if hasattr(iterable, "__aiter__"):
+        async for item in iterable:
+            yield item
+    else:
+        for item in iterable:
+            yield item
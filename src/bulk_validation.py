@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+
+"""
+Bulk validation of large datasets.
+"""
+import os
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from urllib.parse import urlsplit
+
+from src.white_box import DAYS_IN_MONTH, URL_MAX_LENGTH, URL_PREFIXES, validate_email
+
+
+def validate_emails(emails, cache_size=None):
+    """
+    Lazily validates many email addresses, yielding the validate_email result
+    of each one in order.
+    With `cache_size`, the results of the most recently seen addresses are
+    kept in a bounded LRU cache, which pays off on heavily duplicated data.
+    """
+    validator = validate_email
+    if cache_size:
+        validator = lru_cache(maxsize=cache_size)(validate_email)
+    return map(validator, emails)
+
+
+# validate_email result -> byte sent back by the shard workers.
+_EMAIL_FLAGS = {"Invalid Email": 0, "Valid Email": 1}
+
+
+def _file_shards(path, shards):
+    """
+    Splits a file into `shards` byte ranges of about the same size.
+    """
+    size = os.path.getsize(path)
+    bounds = [size * shard // shards for shard in range(shards + 1)]
+    return list(zip(bounds, bounds[1:]))
+
+
+def _read_shard_lines(path, start, end):
+    """
+    Yields the lines (without line endings) that start in [start, end).
+    """
+    with open(path, "rb") as lines_file:
+        if start:
+            # The line running across `start` belongs to the previous shard.
+            lines_file.seek(start - 1)
+            lines_file.readline()
+        while lines_file.tell() < end:
+            line = lines_file.readline()
+            if not line:
+                break
+            yield line.rstrip(b"\r\n").decode("utf-8", "surrogateescape")
+
+
+def _validate_shard(path, start, end, cache_size):
+    """
+    Validates the lines of one shard, in order.
+    Returns one byte per line, 1 for a valid address and 0 otherwise, so
+    a worker sends back a compact buffer rather than a list of strings.
+    """
+    results = validate_emails(_read_shard_lines(path, start, end), cache_size)
+    return bytearray(map(_EMAIL_FLAGS.__getitem__, results))
+
+
+class EmailFileResults(Sequence):
+    """
+    Read-only view of the validate_email results of a file, one per line.
+    The results are kept as the `flags` bytearray (1 for a valid address)
+    and turned into validate_email strings only when they are read.
+    """
+
+    RESULTS = ("Invalid Email", "Valid Email")
+
+    def __init__(self, flags):
+        """
+        Wraps the per-line flags.
+        """
+        self.flags = flags
+
+    def __len__(self):
+        """
+        Number of lines.
+        """
+        return len(self.flags)
+
+    def __getitem__(self, index):
+        """
+        validate_email result of a line, or a list of them for a slice.
+        """
+        if isinstance(index, slice):
+            return [self.RESULTS[flag] for flag in self.flags[index]]
+        return self.RESULTS[self.flags[index]]
+
+    def invalid_lines(self):
+        """
+        Line numbers (from 1) of the invalid addresses.
+        """
+        return [number for number, flag in enumerate(self.flags, 1) if not flag]
+
+
+def validate_email_file(path, workers=None, cache_size=None):
+    """
+    Validates a file with one email address per line, splitting it into byte
+    ranges checked in parallel by `workers` processes (os.cpu_count() by
+    default).
+    Returns an EmailFileResults sequence of validate_email results, one per
+    line in file order; wrap it in a Counter for totals.
+    """
+    workers = workers or os.cpu_count() or 1
+    shards = _file_shards(path, workers)
+    if workers == 1:
+        return EmailFileResults(_validate_shard(path, *shards[0], cache_size))
+
+    flags = bytearray()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_validate_shard, path, start, end, cache_size)
+            for start, end in shards
+        ]
+        for future in futures:
+            flags += future.result()
+    return EmailFileResults(flags)
+
+
+def validate_urls(urls):
+    """
+    Lazily validates many URLs, yielding the validate_url result of each one
+    in order.
+    """
+    prefixes = URL_PREFIXES
+    max_length = URL_MAX_LENGTH
+    return (
+        (
+            "Valid URL"
+            if len(url) <= max_length and url.startswith(prefixes)
+            else "Invalid URL"
+        )
+        for url in urls
+    )
+
+
+def parse_urls(urls):
+    """
+    Validates many URLs and splits the valid ones into scheme and host.
+    Returns a dict of columns: "valid" (booleans), "scheme" and "host"
+    (None for invalid URLs, and for URLs without a usable host).
+    """
+    columns = {"valid": [], "scheme": [], "host": []}
+    valid_column = columns["valid"]
+    scheme_column = columns["scheme"]
+    host_column = columns["host"]
+    for url in urls:
+        valid = len(url) <= URL_MAX_LENGTH and url.startswith(URL_PREFIXES)
+        scheme = host = None
+        if valid:
+            scheme = url[: url.index(":")]
+            try:
+                host = urlsplit(url).hostname
+            except ValueError:  # e.g. an unterminated IPv6 address
+                host = None
+        valid_column.append(valid)
+        scheme_column.append(scheme)
+        host_column.append(host)
+    return columns
+
+
+def validate_dates(years, months, days):
+    """
+    Validates many dates given as year, month and day columns.
+    Returns a list of booleans, True where validate_date accepts the date.
+    """
+    days_in_month = DAYS_IN_MONTH.get
+    return [
+        1 <= day <= days_in_month((year, month), 0)
+        for year, month, day in zip(years, months, days)
+    ]
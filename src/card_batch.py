@@ -0,0 +1,293 @@
+# -*- coding: utf-8 -*-
+
+"""
+Batch credit card validation.
+
+Builds on validate_credit_card (13 to 16 digits) and adds the Luhn checksum
+and an optional BIN (bank identification number) range lookup. Cards are
+handled as ASCII bytes, and the Luhn digit arithmetic is done with
+bytes.translate tables so no Python-level loop runs over the digits.
+
+validate_card_file memory-maps files of fixed-width card records and
+validates whole chunks of records at once: each column of a chunk is
+translated into a big integer holding one byte per record, so adding or
+masking those integers works on every record of the chunk in one step.
+"""
+import mmap
+import sys
+from array import array
+from bisect import bisect_right
+
+BIN_LENGTH = 6
+
+# Digit sum of twice each digit, e.g. 7 -> 14 -> 5.
+_DOUBLED_DIGIT_SUMS = bytes([0, 2, 4, 6, 8, 1, 3, 5, 7, 9])
+
+# Digit value, and digit sum of twice the digit, of every ASCII digit.
+_LUHN_PLAIN = bytes.maketrans(b"0123456789", bytes(range(10)))
+_LUHN_DOUBLED = bytes.maketrans(b"0123456789", _DOUBLED_DIGIT_SUMS)
+
+
+def _as_bytes(card):
+    """
+    Returns a card number as bytes.
+    """
+    if isinstance(card, str):
+        return card.encode("ascii", "replace")
+    return bytes(card)
+
+
+def luhn_valid(card):
+    """
+    Checks the Luhn checksum of a card number made of ASCII digits.
+    """
+    digits = card[::-1]
+    total = sum(digits[0::2].translate(_LUHN_PLAIN)) + sum(
+        digits[1::2].translate(_LUHN_DOUBLED)
+    )
+    return total % 10 == 0
+
+
+class BinTable:  # pylint: disable=too-few-public-methods
+    """
+    Card brands by BIN range.
+    Ranges are given as (first, last, brand) prefixes of any length up to
+    BIN_LENGTH digits, e.g. ("51", "55", "Mastercard"), and are stored as
+    sorted 6-digit bounds searched with bisect.
+    """
+
+    def __init__(self, ranges):
+        """
+        Build the table; overlapping ranges are rejected.
+        """
+        bounds = sorted(
+            (
+                int(first.ljust(BIN_LENGTH, "0")),
+                int(last.ljust(BIN_LENGTH, "9")),
+                brand,
+            )
+            for first, last, brand in ranges
+        )
+        for (_, previous_last, _), (first, _, brand) in zip(bounds, bounds[1:]):
+            if first <= previous_last:
+                raise ValueError(f"Overlapping BIN range for {brand}")
+
+        self.starts = [first for first, _, _ in bounds]
+        self.ends = [last for _, last, _ in bounds]
+        self.brands = [brand for _, _, brand in bounds]
+
+    def lookup(self, card):
+        """
+        Returns the brand of a card number (ASCII digits), or None.
+        """
+        bin_number = int(card[:BIN_LENGTH])
+        index = bisect_right(self.starts, bin_number) - 1
+        if index >= 0 and bin_number <= self.ends[index]:
+            return self.brands[index]
+        return None
+
+
+DEFAULT_BIN_TABLE = BinTable(
+    [
+        ("2221", "2720", "Mastercard"),
+        ("34", "34", "American Express"),
+        ("37", "37", "American Express"),
+        ("4", "4", "Visa"),
+        ("51", "55", "Mastercard"),
+        ("6011", "6011", "Discover"),
+        ("65", "65", "Discover"),
+    ]
+)
+
+
+def validate_card(card, bin_table=None):
+    """
+    Validates one card number: 13 to 16 ASCII digits with a valid Luhn
+    checksum and, when `bin_table` is given, a known BIN.
+    """
+    card = _as_bytes(card)
+    return (
+        13 <= len(card) <= 16
+        and card.isdigit()
+        and luhn_valid(card)
+        and (bin_table is None or bin_table.lookup(card) is not None)
+    )
+
+
+def validate_cards(cards, bin_table=None):
+    """
+    Validates many card numbers (bytes or str).
+    Returns a list of booleans, one per card.
+    """
+    plain = _LUHN_PLAIN
+    doubled = _LUHN_DOUBLED
+    results = []
+    append = results.append
+    for card in cards:
+        if not isinstance(card, bytes):
+            card = _as_bytes(card)
+        if not (13 <= len(card) <= 16 and card.isdigit()):
+            append(False)
+            continue
+
+        # Inlined luhn_valid.
+        digits = card[::-1]
+        valid = (
+            sum(digits[0::2].translate(plain)) + sum(digits[1::2].translate(doubled))
+        ) % 10 == 0
+        if valid and bin_table is not None:
+            valid = bin_table.lookup(card) is not None
+        append(valid)
+    return results
+
+
+def validate_card_buffer(buffer, bin_table=None):
+    """
+    Validates a buffer of newline-separated card numbers, such as the
+    contents of a settlement file.
+    """
+    return validate_cards(bytes(buffer).splitlines(), bin_table)
+
+
+# Byte tables for the fixed-width file mode: every other byte maps to 0.
+_IS_DIGIT = bytes(1 if 48 <= byte <= 57 else 0 for byte in range(256))
+_IS_PAD = bytes(1 if byte == 32 else 0 for byte in range(256))
+_IS_OTHER = bytes(0 if byte == 32 or 48 <= byte <= 57 else 1 for byte in range(256))
+_DIGIT_PLAIN = bytes(byte - 48 if 48 <= byte <= 57 else 0 for byte in range(256))
+_DIGIT_DOUBLED = bytes(
+    _DOUBLED_DIGIT_SUMS[byte - 48] if 48 <= byte <= 57 else 0 for byte in range(256)
+)
+_EVEN_MASK = bytes(255 if value % 2 == 0 else 0 for value in range(256))
+_CARD_LENGTH_OK = bytes(1 if 13 <= value <= 16 else 0 for value in range(256))
+_MULTIPLE_OF_10 = bytes(1 if value % 10 == 0 else 0 for value in range(256))
+_IS_ZERO = bytes(1 if value == 0 else 0 for value in range(256))
+
+# Packs the lowest bit of each byte of a little-endian 64-bit word into bits
+# 56-63, first byte lowest.
+_PACK_BITS = 0x0102040810204080
+
+# A column sum of up to this many digits still fits in one byte per record.
+MAX_FIELD_WIDTH = 28
+
+
+def _to_int(column):
+    """
+    Reads one byte per record as a little-endian integer.
+    """
+    return int.from_bytes(column, "little")
+
+
+def _luhn_ok(columns, lengths, rows):
+    """
+    Checks the Luhn checksum of every record of the columns.
+    Returns one byte per record as an integer, 1 when the checksum is valid.
+    """
+    # Luhn doubles the columns with the parity of the card length: `even`
+    # holds the sums for even lengths and `odd` those for odd lengths.
+    even = odd = 0
+    for j, column in enumerate(columns):
+        plain = _to_int(column.translate(_DIGIT_PLAIN))
+        doubled = _to_int(column.translate(_DIGIT_DOUBLED))
+        if j % 2:
+            even += plain
+            odd += doubled
+        else:
+            even += doubled
+            odd += plain
+
+    even_mask = _to_int(lengths.translate(_EVEN_MASK))
+    sums = (even & even_mask) | (odd & ~even_mask)
+    return _to_int(sums.to_bytes(rows, "little").translate(_MULTIPLE_OF_10))
+
+
+def _validate_records(view, rows, record_width, field_width, luhn):
+    """
+    Validates `rows` fixed-width records of `view`.
+    Returns one byte per record, 1 for a valid card and 0 otherwise.
+    """
+    columns = [bytes(view[j::record_width]) for j in range(field_width)]
+    digits = [_to_int(column.translate(_IS_DIGIT)) for column in columns]
+    pads = [_to_int(column.translate(_IS_PAD)) for column in columns]
+
+    # Left-aligned digits followed only by spaces.
+    malformed = sum(_to_int(column.translate(_IS_OTHER)) for column in columns)
+    malformed += sum(pad & digit for pad, digit in zip(pads, digits[1:]))
+    lengths = sum(digits).to_bytes(rows, "little")
+    valid = _to_int(lengths.translate(_CARD_LENGTH_OK)) & _to_int(
+        malformed.to_bytes(rows, "little").translate(_IS_ZERO)
+    )
+
+    if luhn:
+        valid &= _luhn_ok(columns, lengths, rows)
+
+    return valid.to_bytes(rows, "little")
+
+
+def _pack_bits(flags):
+    """
+    Packs bytes of 0 or 1 into a bitmap, eight records per byte.
+    """
+    words = array("Q", flags + bytes(-len(flags) % 8))
+    if sys.byteorder == "big":
+        words.byteswap()
+    return bytearray((word * _PACK_BITS >> 56) & 255 for word in words)
+
+
+def _validate_chunks(
+    view, rows, record_width, field_width, luhn, chunk_records
+):  # pylint: disable=too-many-arguments
+    """
+    Validates the records of a mapped file chunk by chunk.
+    Returns the bitmap of valid records.
+    """
+    bitmap = bytearray()
+    for first in range(0, rows, chunk_records):
+        count = min(chunk_records, rows - first)
+        start = first * record_width
+        with view[start : start + count * record_width] as records:
+            if len(records) < count * record_width:
+                # Last record without its terminator.
+                records = records.tobytes().ljust(count * record_width)
+            flags = _validate_records(records, count, record_width, field_width, luhn)
+        bitmap += _pack_bits(flags)
+    return bitmap
+
+
+def bitmap_get(bitmap, row):
+    """
+    Checks whether `row` is marked valid in a bitmap from validate_card_file.
+    """
+    return bool(bitmap[row >> 3] >> (row & 7) & 1)
+
+
+def validate_card_file(
+    path, field_width=16, record_width=None, luhn=True, chunk_records=1 << 16
+):
+    """
+    Validates a file of fixed-width card records through a memory map.
+    Each record is a card number left-aligned in `field_width` bytes and
+    padded with spaces, followed by a terminator up to `record_width` bytes
+    (field_width + 1, for a newline, by default); the last terminator may be
+    missing. A card is valid with 13 to 16 digits and, with `luhn`, a valid
+    Luhn checksum.
+    Returns a bitmap (bit `row % 8` of byte `row // 8`) and the row count.
+    """
+    record_width = record_width or field_width + 1
+    # Whole bitmap bytes per chunk.
+    chunk_records = -(-chunk_records // 8) * 8
+    if not 0 < field_width <= min(record_width, MAX_FIELD_WIDTH):
+        raise ValueError(f"field_width must be between 1 and {MAX_FIELD_WIDTH}")
+
+    with open(path, "rb") as cards_file:
+        size = cards_file.seek(0, 2)
+        rows = size // record_width + (size % record_width >= field_width)
+        if not rows:
+            return bytearray(), 0
+
+        with mmap.mmap(
+            cards_file.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mapped, memoryview(mapped) as view:
+            bitmap = _validate_chunks(
+                view, rows, record_width, field_width, luhn, chunk_records
+            )
+    return bitmap, rows
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+
+"""
+Thread-safe banking system.
+"""
+import threading
+
+from src.white_box import FEE_ACCOUNT, BankingSystem
+
+
+class ConcurrentBankingSystem(BankingSystem):
+    """
+    Banking system that can be shared between threads.
+    Every account has its own lock, so transfers between unrelated accounts
+    proceed in parallel. A transfer locks its two accounts in a fixed global
+    order (by lock id) to avoid deadlocks.
+    """
+
+    def __init__(self, quiet=False, sink=None, credentials=None, money=None):
+        """
+        Set up the locks before the ledger is populated.
+        """
+        self._registry_lock = threading.RLock()  # accounts and their locks
+        self._users_lock = threading.Lock()  # logged_in_users
+        self._account_locks = {}
+        super().__init__(quiet=quiet, sink=sink, credentials=credentials, money=money)
+
+    def open_account(self, account_number, balance):
+        """
+        Adds an account and its lock to the ledger and returns it.
+        """
+        with self._registry_lock:
+            self._account_locks.setdefault(account_number, threading.Lock())
+            return super().open_account(account_number, balance)
+
+    def get_account(self, account_number, opening_balance=None):
+        """
+        Returns the ledger account, opening it if it does not exist yet with
+        `opening_balance`, DEFAULT_OPENING_BALANCE by default.
+        """
+        account = self.accounts.get(account_number)
+        if account is None:
+            with self._registry_lock:
+                account = super().get_account(account_number, opening_balance)
+        return account
+
+    def _account_lock(self, account_number, opening_balance=None):
+        """
+        Returns the lock of an account, opening the account if needed.
+        """
+        lock = self._account_locks.get(account_number)
+        if lock is None:
+            self.get_account(account_number, opening_balance)
+            lock = self._account_locks[account_number]
+        return lock
+
+    def _log_in(self, username):
+        """
+        Marks a verified user as logged in; False if they already were.
+        Only the check-and-add is locked: the password check and the messages
+        run outside it, so logins of different users do not wait on each
+        other.
+        """
+        with self._users_lock:
+            return super()._log_in(username)
+
+    def _apply_transfer(self, sender, receiver, amount, fee):
+        """
+        Moves the money between the ledger accounts while holding their locks.
+        The fee is credited right after the account locks are released, so
+        the fee account never serializes unrelated transfers.
+        """
+        locks = sorted(
+            {self._account_lock(sender), self._account_lock(receiver, 0)}, key=id
+        )
+        for lock in locks:
+            lock.acquire()
+        try:
+            sender_account = self.accounts[sender]
+            if sender_account.balance < (amount + fee):
+                return False
+
+            sender_account.balance -= amount + fee
+            self.accounts[receiver].balance += amount
+        finally:
+            for lock in reversed(locks):
+                lock.release()
+
+        with self._account_locks[FEE_ACCOUNT]:
+            self.accounts[FEE_ACCOUNT].balance += fee
+        return True
@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+
+"""
+Hashed credential storage.
+"""
+import hashlib
+import hmac
+import os
+import threading
+import time
+from collections import OrderedDict
+
+
+class VerifiedCredentialCache:
+    """
+    LRU cache of recently verified credentials with a time-to-live.
+    Passwords are only kept as fingerprints keyed with a random per-cache
+    secret, never in plain text. The cache is safe to share between threads.
+    """
+
+    def __init__(self, maxsize=1024, ttl=300, clock=time.monotonic):
+        """
+        Keep at most `maxsize` users, each for `ttl` seconds of `clock`.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self._key = os.urandom(32)
+        self._entries = OrderedDict()  # username -> (fingerprint, expires_at)
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        """
+        Number of cached users, including expired ones not yet evicted.
+        """
+        return len(self._entries)
+
+    def _fingerprint(self, password):
+        """
+        Keyed fingerprint of a password.
+        """
+        return hmac.new(self._key, password.encode(), "sha256").digest()
+
+    def contains(self, username, password):
+        """
+        Checks whether these credentials were verified recently.
+        """
+        candidate = self._fingerprint(password)
+        with self._lock:
+            entry = self._entries.get(username)
+            if entry is None:
+                return False
+
+            fingerprint, expires_at = entry
+            if expires_at <= self.clock():
+                del self._entries[username]
+                return False
+
+            if not hmac.compare_digest(fingerprint, candidate):
+                return False
+
+            self._entries.move_to_end(username)
+            return True
+
+    def add(self, username, password):
+        """
+        Remembers verified credentials, evicting the least recently used.
+        """
+        fingerprint = self._fingerprint(password)
+        with self._lock:
+            self._entries[username] = (fingerprint, self.clock() + self.ttl)
+            self._entries.move_to_end(username)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def forget(self, username):
+        """
+        Drops the cached credentials of a user.
+        """
+        with self._lock:
+            self._entries.pop(username, None)
+
+
+class CredentialStore:
+    """
+    User credentials stored as salted PBKDF2-SHA256 hashes.
+    Verification compares digests in constant time and hashes even for
+    unknown users, so timing does not reveal which usernames exist. An
+    optional VerifiedCredentialCache skips the hash for repeated logins.
+    """
+
+    def __init__(self, users=None, iterations=100_000, cache=None):
+        """
+        Hash the passwords of `users`, a username -> password mapping.
+        """
+        self.iterations = iterations
+        self.cache = cache
+        self._records = {}  # username -> (salt, digest)
+        self._dummy_salt = os.urandom(16)
+        for username, password in (users or {}).items():
+            self.add_user(username, password)
+
+    def __contains__(self, username):
+        """
+        Checks whether a user exists.
+        """
+        return username in self._records
+
+    def _hash(self, password, salt):
+        """
+        Slow salted hash of a password.
+        """
+        return hashlib.pbkdf2_hmac("sha256", password.encode(), salt, self.iterations)
+
+    def add_user(self, username, password):
+        """
+        Adds a user or changes their password.
+        """
+        salt = os.urandom(16)
+        self._records[username] = (salt, self._hash(password, salt))
+        if self.cache is not None:
+            self.cache.forget(username)
+
+    def copy(self):
+        """
+        Returns a store with the same users and an empty cache.
+        """
+        cache = self.cache
+        if cache is not None:
+            cache = VerifiedCredentialCache(cache.maxsize, cache.ttl, cache.clock)
+        store = CredentialStore(iterations=self.iterations, cache=cache)
+        store._records.update(self._records)  # pylint: disable=protected-access
+        return store
+
+    def verify(self, username, password):
+        """
+        Checks a username and password.
+        """
+        cache = self.cache
+        if cache is not None and cache.contains(username, password):
+            return True
+
+        record = self._records.get(username)
+        if record is None:
+            # Hash anyway so unknown users take as long as known ones.
+            self._hash(password, self._dummy_salt)
+            return False
+
+        salt, digest = record
+        verified = hmac.compare_digest(self._hash(password, salt), digest)
+        if verified and cache is not None:
+            cache.add(username, password)
+        return verified
@@ -0,0 +1,267 @@
+# -*- coding: utf-8 -*-
+
+"""
+Dispatching a bank of elevators.
+
+Elevator extends ElevatorSystem with a floor and a LOOK scheduler: stops
+above the car wait in a min-heap and stops below it in a max-heap, so the
+car serves every stop in its direction of travel before turning around.
+ElevatorDispatcher assigns each floor call to the car that reaches it
+soonest, and simulate() replays a stream of calls as a discrete-event
+simulation.
+"""
+from collections import namedtuple
+from heapq import heapify, heappop, heappush
+from itertools import count
+
+from src.white_box import ElevatorSystem
+
+_DIRECTIONS = {"Idle": 0, "Moving Up": 1, "Moving Down": -1}
+# Direction of travel indexed by ElevatorSystem state id.
+DIRECTIONS = tuple(_DIRECTIONS[state] for state in ElevatorSystem.TABLE.states)
+
+SimulationResult = namedtuple(
+    "SimulationResult", ["calls", "average_wait", "max_wait", "end_time"]
+)
+
+# Simulation event kinds; ticks sort first so cars move before new calls
+# arriving at the same instant are dispatched.
+_TICK = 0
+_CALL = 1
+
+
+class Elevator(ElevatorSystem):
+    """
+    An elevator car that tracks its floor and schedules its stops (LOOK).
+    `sweep` is the direction of the current sweep; unlike the state it is
+    kept while the car stops at a floor, and only reset once the car has
+    nothing left to do.
+    """
+
+    __slots__ = ("floor", "sweep", "up_stops", "down_stops", "pickups", "busy")
+
+    def __init__(self, floor=0):
+        """
+        Parks the car, idle, at `floor`.
+        """
+        super().__init__()
+        self.floor = floor
+        self.sweep = 0
+        self.up_stops = []
+        self.down_stops = []
+        # Calls waiting for this car, by floor: lists of (time, destination).
+        self.pickups = {}
+        self.busy = False
+
+    @property
+    def direction(self):
+        """
+        1 when moving up, -1 when moving down, 0 when idle.
+        """
+        return DIRECTIONS[self.state_id]
+
+    @property
+    def heading(self):
+        """
+        Direction of the current sweep: the direction of travel when moving,
+        else the sweep the car stopped in.
+        """
+        return DIRECTIONS[self.state_id] or self.sweep
+
+    @property
+    def stops(self):
+        """
+        Number of pending stops.
+        """
+        return len(self.up_stops) + len(self.down_stops)
+
+    def add_stop(self, floor):
+        """
+        Schedules a stop at `floor`.
+        A stop at the current floor is served now when the car is stopped,
+        or on the way back when it is already moving away.
+        """
+        if floor != self.floor:
+            upward = floor > self.floor
+        elif self.direction:
+            upward = self.direction < 0
+        else:
+            upward = self.sweep >= 0
+        if upward:
+            heappush(self.up_stops, floor)
+        else:
+            heappush(self.down_stops, -floor)
+
+    def next_stop(self):
+        """
+        Floor of the next stop, or None when there is nothing to do.
+        """
+        up_stops, down_stops = self.up_stops, self.down_stops
+        if not up_stops:
+            return -down_stops[0] if down_stops else None
+        if not down_stops:
+            return up_stops[0]
+        heading = self.heading
+        if heading > 0:
+            return up_stops[0]
+        if heading < 0:
+            return -down_stops[0]
+        above, below = up_stops[0], -down_stops[0]
+        return above if above - self.floor <= self.floor - below else below
+
+    def arrive(self):
+        """
+        Clears the stops at the current floor.
+        Returns True if the car had to stop here.
+        """
+        floor = self.floor
+        up_stops, down_stops = self.up_stops, self.down_stops
+        stopped = False
+        while up_stops and up_stops[0] == floor:
+            heappop(up_stops)
+            stopped = True
+        while down_stops and -down_stops[0] == floor:
+            heappop(down_stops)
+            stopped = True
+        return stopped
+
+    def head(self, direction):
+        """
+        Puts the car in the state that travels in `direction`; stopping
+        (direction 0) keeps the sweep.
+        """
+        if direction:
+            self.sweep = direction
+        if self.direction != direction:
+            if self.direction:
+                self.stop()
+            if direction > 0:
+                self.move_up()
+            elif direction < 0:
+                self.move_down()
+
+    def distance_to(self, floor):
+        """
+        Floors the car travels before reaching `floor`, following its current
+        sweep to the furthest pending stop before turning around.
+        """
+        offset = floor - self.floor
+        sweep = self.heading
+        if sweep == 0 or offset * sweep >= 0:
+            return abs(offset)
+        if sweep > 0:
+            turn = max(self.up_stops, default=self.floor)
+        else:
+            turn = min((-stop for stop in self.down_stops), default=self.floor)
+        return abs(turn - self.floor) + abs(turn - floor)
+
+
+class ElevatorDispatcher:  # pylint: disable=too-few-public-methods
+    """
+    Assigns floor calls to a bank of elevators.
+    Each call goes to the car with the lowest cost: the floors it travels
+    to reach the call plus `stop_penalty` for each stop it already has.
+    """
+
+    def __init__(self, elevators=4, floors=10, stop_penalty=2.0):
+        """
+        Creates `elevators` idle cars on the ground floor of a building with
+        floors 0 to `floors` - 1.
+        """
+        if elevators < 1 or floors < 2:
+            raise ValueError("Need at least one elevator and two floors")
+        self.floors = floors
+        self.stop_penalty = stop_penalty
+        self.elevators = [Elevator() for _ in range(elevators)]
+
+    def _check_floor(self, floor):
+        """
+        Raises ValueError for floors outside the building.
+        """
+        if not 0 <= floor < self.floors:
+            raise ValueError(f"Invalid floor: {floor}")
+
+    def call(self, floor, destination, time=0.0):
+        """
+        Dispatches a call made at `time` from `floor` to `destination`.
+        Returns the index of the elevator that will serve it.
+        """
+        self._check_floor(floor)
+        self._check_floor(destination)
+        if floor == destination:
+            raise ValueError("Destination must differ from the call floor")
+
+        penalty = self.stop_penalty
+        index = min(
+            range(len(self.elevators)),
+            key=lambda i: self.elevators[i].distance_to(floor)
+            + penalty * self.elevators[i].stops,
+        )
+        elevator = self.elevators[index]
+        elevator.pickups.setdefault(floor, []).append((time, destination))
+        elevator.add_stop(floor)
+        return index
+
+
+def _tick(elevator, now, waits, floor_time, door_time):
+    """
+    Advances `elevator` at time `now`.
+    Returns the time of its next tick, or None when it goes idle.
+    """
+    elevator.floor += elevator.direction
+    target = elevator.next_stop()
+    if target is None:
+        elevator.head(0)
+        elevator.sweep = 0
+        elevator.busy = False
+        return None
+
+    if target == elevator.floor:
+        elevator.arrive()
+        elevator.head(0)
+        for called_at, destination in elevator.pickups.pop(elevator.floor, ()):
+            waits.append(now - called_at)
+            elevator.add_stop(destination)
+        return now + door_time
+
+    elevator.head(1 if target > elevator.floor else -1)
+    return now + floor_time
+
+
+def simulate(  # pylint: disable=too-many-arguments
+    calls, elevators=4, floors=10, floor_time=1.0, door_time=2.0
+):
+    """
+    Discrete-event simulation of a bank of elevators.
+    `calls` are (time, floor, destination) tuples. Cars take `floor_time` to
+    travel one floor and `door_time` for each stop.
+    Returns a SimulationResult with the wait of the calls from the call to
+    the pickup.
+    """
+    dispatcher = ElevatorDispatcher(elevators, floors, door_time / floor_time)
+    cars = dispatcher.elevators
+    sequence = count()
+    events = [(call[0], _CALL, next(sequence), *call[1:]) for call in calls]
+    heapify(events)
+
+    waits = []
+    now = 0.0
+    while events:
+        now, kind, _, index, destination = heappop(events)
+        if kind == _CALL:
+            index = dispatcher.call(index, destination, now)
+            if cars[index].busy:
+                continue
+            cars[index].busy = True
+            next_tick = now
+        else:
+            next_tick = _tick(cars[index], now, waits, floor_time, door_time)
+        if next_tick is not None:
+            heappush(events, (next_tick, _TICK, next(sequence), index, None))
+
+    return SimulationResult(
+        len(waits),
+        sum(waits) / len(waits) if waits else 0.0,
+        max(waits, default=0.0),
+        now,
+    )
@@ -0,0 +1,190 @@
+# -*- coding: utf-8 -*-
+
+"""
+Interval-table classification.
+"""
+from bisect import bisect_left
+
+# Tables with up to this many boundaries are compiled to an if ladder by
+# scalar_function(); a few comparisons beat a call to bisect_left.
+MAX_LADDER_BOUNDS = 8
+
+_CLOSED_SIDES = {
+    "both": (True, True),
+    "left": (True, False),
+    "right": (False, True),
+    "neither": (False, False),
+}
+
+
+class IntervalClassifier:
+    """
+    Maps numbers to values through a table of non-overlapping intervals.
+    Each interval is a (low, high, value) tuple, closed on both ends, or a
+    (low, high, value, closed) tuple where `closed` is "both", "left",
+    "right" or "neither". None as `low` or `high` leaves that side unbounded.
+    Numbers outside every interval map to `default`.
+
+    The table is compiled into sorted boundaries, the value at each boundary
+    and the value of each gap between boundaries, so a lookup is one bisect.
+    scalar_function() turns the table into a standalone function for hot
+    scalar call sites.
+    """
+
+    def __init__(self, intervals, default=None):
+        """
+        Compile the interval table.
+        """
+        intervals = [_normalize(interval) for interval in intervals]
+        self.bounds = sorted(
+            {bound for low, high, *_ in intervals for bound in (low, high)} - {None}
+        )
+        self.default = default
+
+        # at_bounds[i] is the value at bounds[i]; segments[i] the value
+        # strictly between bounds[i - 1] and bounds[i].
+        self.at_bounds = [_value_at(intervals, bound, default) for bound in self.bounds]
+        edges = [None, *self.bounds, None]
+        self.segments = [
+            _value_between(intervals, low, high, default)
+            for low, high in zip(edges, edges[1:])
+        ]
+
+    def __call__(self, number):
+        """
+        Classifies one number.
+        """
+        index = bisect_left(self.bounds, number)
+        if index < len(self.bounds) and self.bounds[index] == number:
+            return self.at_bounds[index]
+        return self.segments[index]
+
+    def classify_many(self, numbers):
+        """
+        Classifies many numbers, returning a list of values.
+        """
+        bounds = self.bounds
+        count = len(bounds)
+        at_bounds = self.at_bounds
+        segments = self.segments
+        results = []
+        append = results.append
+        for number in numbers:
+            index = bisect_left(bounds, number)
+            if index < count and bounds[index] == number:
+                append(at_bounds[index])
+            else:
+                append(segments[index])
+        return results
+
+    def scalar_function(self, name, argument="number", doc=None, module=None):
+        """
+        Returns a function `name(argument)` that classifies one number.
+        Tables with at most MAX_LADDER_BOUNDS boundaries become an if ladder,
+        so a call costs what the hand-written ladder did; larger tables are
+        looked up with one bisect. Table values are bound by reference.
+        """
+        if not (name.isidentifier() and argument.isidentifier()):
+            raise ValueError(f"Invalid function or argument name: {name}, {argument}")
+        namespace = {"__name__": module, "bisect_left": bisect_left}
+        if len(self.bounds) <= MAX_LADDER_BOUNDS:
+            body = _ladder(self, argument, namespace)
+        else:
+            namespace.update(
+                bounds=tuple(self.bounds),
+                count=len(self.bounds),
+                at_bounds=tuple(self.at_bounds),
+                segments=tuple(self.segments),
+            )
+            body = [
+                f"index = bisect_left(bounds, {argument})",
+                f"if index < count and bounds[index] == {argument}:",
+                "    return at_bounds[index]",
+                "return segments[index]",
+            ]
+        source = "\n    ".join([f"def {name}({argument}):", *body])
+        exec(  # pylint: disable=exec-used
+            compile(source, f"<interval table {name}>", "exec"), namespace
+        )
+        function = namespace[name]
+        function.__doc__ = doc
+        return function
+
+
+def _ladder(classifier, argument, namespace):
+    """
+    Source lines of an if ladder over the boundaries of `classifier`, in
+    ascending order; the values are added to `namespace`.
+    When the value at a boundary equals the value on one side of it, the
+    equality test is folded into a single comparison.
+    """
+    segments = classifier.segments
+    lines = []
+    for index, (bound, at_bound) in enumerate(
+        zip(classifier.bounds, classifier.at_bounds)
+    ):
+        namespace[f"bound{index}"] = bound
+        namespace[f"at{index}"] = at_bound
+        namespace[f"below{index}"] = segments[index]
+        if at_bound is segments[index]:
+            lines.append(f"if {argument} <= bound{index}:")
+            lines.append(f"    return below{index}")
+            continue
+        lines.append(f"if {argument} < bound{index}:")
+        lines.append(f"    return below{index}")
+        if at_bound is not segments[index + 1]:
+            lines.append(f"if {argument} == bound{index}:")
+            lines.append(f"    return at{index}")
+    namespace["above"] = segments[-1]
+    lines.append("return above")
+    return lines
+
+
+def _normalize(interval):
+    """
+    Returns an interval as (low, high, value, low_closed, high_closed).
+    """
+    low, high, value, *closed = interval
+    try:
+        low_closed, high_closed = _CLOSED_SIDES[closed[0] if closed else "both"]
+    except KeyError:
+        raise ValueError(f"Invalid interval closure: {closed[0]}") from None
+    if low is not None and high is not None and low > high:
+        raise ValueError(f"Empty interval: {interval}")
+    return low, high, value, low_closed, high_closed
+
+
+def _single(matches, default, where):
+    """
+    Returns the only matching value, or `default` when nothing matches.
+    """
+    if len(matches) > 1:
+        raise ValueError(f"Overlapping intervals at {where}")
+    return matches[0] if matches else default
+
+
+def _value_at(intervals, point, default):
+    """
+    Value of the interval containing a boundary point.
+    """
+    matches = [
+        value
+        for low, high, value, low_closed, high_closed in intervals
+        if (low is None or low < point or (low == point and low_closed))
+        and (high is None or point < high or (point == high and high_closed))
+    ]
+    return _single(matches, default, point)
+
+
+def _value_between(intervals, start, end, default):
+    """
+    Value of the interval containing the open gap between two consecutive
+    boundaries (None meaning unbounded).
+    """
+    matches = [
+        value
+        for low, high, value, *_ in intervals
+        if (low is None or (start is not None and low <= start))
+        and (high is None or (end is not None and end <= high))
+    ]
+    return _single(matches, default, (start, end))
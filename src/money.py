@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+
+"""
+Money modes.
+
+In the default "float" mode amounts are plain numbers of dollars, as they
+always were. In the "cents" mode amounts are integers of cents and every
+percentage is applied in integer basis points, so results are exact and
+need no rounding downstream. The mode can be set globally or per call.
+"""
+
+MONEY_FLOAT = "float"
+MONEY_CENTS = "cents"
+MONEY_MODES = (MONEY_FLOAT, MONEY_CENTS)
+
+_money_mode = MONEY_FLOAT  # pylint: disable=invalid-name
+
+
+def set_money_mode(mode):
+    """
+    Sets the global money mode.
+    """
+    global _money_mode  # pylint: disable=global-statement
+    _money_mode = resolve_money_mode(mode)
+
+
+def get_money_mode():
+    """
+    Returns the global money mode.
+    """
+    return _money_mode
+
+
+def resolve_money_mode(mode=None):
+    """
+    Returns `mode`, or the global mode when `mode` is None.
+    """
+    if mode is None:
+        return _money_mode
+
+    if mode not in MONEY_MODES:
+        raise ValueError(f"Invalid money mode: {mode}")
+
+    return mode
+
+
+def to_cents(amount):
+    """
+    Converts an amount of dollars to integer cents.
+    """
+    return round(amount * 100)
+
+
+def format_cents(cents):
+    """
+    Formats integer cents as dollars, e.g. 1999 -> "19.99".
+    """
+    sign = "-" if cents < 0 else ""
+    dollars, cents = divmod(abs(cents), 100)
+    return f"{sign}{dollars}.{cents:02d}"
+
+
+def apply_rate(cents, basis_points):
+    """
+    Multiplies integer cents by a rate in basis points (1/100 of a percent),
+    rounding half up to whole cents.
+    """
+    return (cents * basis_points + 5000) // 10000
@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+
+"""
+Streaming order-file processor.
+
+Reads orders from a JSON Lines file, prices them and computes their shipping
+cost, and writes one JSON line per order. Every stage is a generator, so
+memory use stays constant whatever the file size:
+
+    read_lines -> parse_orders -> price_orders -> write_results
+
+Usage: python -m src.order_pipeline orders.jsonl results.jsonl
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice, repeat
+
+from src.money import resolve_money_mode
+from src.white_box import (
+    calculate_items_shipping_cost,
+    calculate_order_total,
+    calculate_order_totals,
+)
+
+DEFAULT_CHUNK_SIZE = 1000
+
+
+def read_lines(lines):
+    """
+    Yields the non-blank lines of a file.
+    """
+    for line in lines:
+        if line.strip():
+            yield line
+
+
+def parse_orders(lines):
+    """
+    Parses each JSON line into an order dict.
+    A line that is not valid JSON yields its json.JSONDecodeError instead,
+    so that one bad line is reported rather than aborting the run.
+    """
+    for line in lines:
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as error:
+            yield error
+
+
+def price_orders(orders, default_method="standard"):
+    """
+    Computes the total and the shipping cost of each order.
+    An order has "items" (with "quantity", "price" and "weight") and an
+    optional "order_id" and "shipping_method". Orders that cannot be priced,
+    and lines that are not JSON objects, get an "error" instead.
+    """
+    for order in orders:
+        if isinstance(order, json.JSONDecodeError):
+            yield {"order_id": None, "error": f"Invalid JSON: {order}"}
+            continue
+        if not isinstance(order, dict):
+            yield {"order_id": None, "error": "Order is not a JSON object"}
+            continue
+        result = {"order_id": order.get("order_id")}
+        try:
+            items = order["items"]
+            result["total"] = calculate_order_total(items)
+            result["shipping"] = calculate_items_shipping_cost(
+                items, order.get("shipping_method", default_method)
+            )
+        except (KeyError, TypeError, ValueError) as error:
+            result = {"order_id": result["order_id"], "error": str(error)}
+        yield result
+
+
+def _order_columns(orders):
+    """
+    Converts orders (lists of items) into calculate_order_totals columns.
+    """
+    quantities, prices, offsets = [], [], [0]
+    for items in orders:
+        for item in items:
+            quantities.append(item["quantity"])
+            prices.append(item["price"])
+        offsets.append(len(quantities))
+    return quantities, prices, offsets
+
+
+def _price_columns(columns, money):
+    """
+    Prices one chunk of orders sent to a worker as columns.
+    """
+    return calculate_order_totals(*columns, money=money)
+
+
+def price_orders_parallel(orders, workers=None, chunksize=None, money=None):
+    """
+    Calculates the total of every order (a list of items) across `workers`
+    processes, os.cpu_count() by default.
+    Orders are sent to the workers `chunksize` at a time, each chunk as
+    quantity, price and offset columns, so the item dicts are never
+    pickled; by default each worker gets about four chunks.
+    The `money` mode (the global mode when None) is resolved here and sent
+    to the workers, since processes started with "spawn" do not see a mode
+    set with set_money_mode.
+    Returns the totals in input order.
+    """
+    orders = list(orders)
+    workers = workers or os.cpu_count() or 1
+    money = resolve_money_mode(money)
+    if workers == 1 or len(orders) < 2:
+        return [calculate_order_total(items, money) for items in orders]
+
+    if chunksize is None:
+        chunksize = max(1, -(-len(orders) // (workers * 4)))
+    chunks = (
+        _order_columns(orders[start : start + chunksize])
+        for start in range(0, len(orders), chunksize)
+    )
+    totals = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for chunk_totals in executor.map(_price_columns, chunks, repeat(money)):
+            totals.extend(chunk_totals)
+    return totals
+
+
+def write_results(results, output, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Writes the results as JSON lines, `chunk_size` lines per write.
+    Returns the number of results written.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+
+    count = 0
+    results = iter(results)
+    while True:
+        chunk = [json.dumps(result) + "\n" for result in islice(results, chunk_size)]
+        if not chunk:
+            return count
+        output.writelines(chunk)
+        count += len(chunk)
+
+
+def process_orders(
+    lines, output, chunk_size=DEFAULT_CHUNK_SIZE, default_method="standard"
+):
+    """
+    Runs the whole pipeline from input lines to `output`.
+    Returns the number of rows and the rows per second.
+    """
+    start = time.perf_counter()
+    rows = write_results(
+        price_orders(parse_orders(read_lines(lines)), default_method),
+        output,
+        chunk_size,
+    )
+    elapsed = time.perf_counter() - start
+    return rows, rows / elapsed if elapsed else 0.0
+
+
+def main(argv=None):
+    """
+    Command line entry point.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("input", help="JSON Lines orders file, - for stdin")
+    parser.add_argument("output", help="JSON Lines results file, - for stdout")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--default-method", default="standard")
+    args = parser.parse_args(argv)
+
+    with _open(args.input, "r", sys.stdin) as lines, _open(
+        args.output, "w", sys.stdout
+    ) as output:
+        rows, rate = process_orders(lines, output, args.chunk_size, args.default_method)
+
+    print(f"{rows} rows processed ({rate:.0f} rows/s)", file=sys.stderr)
+    return 0
+
+
+def _open(path, mode, standard_stream):
+    """
+    Opens a file, or wraps a standard stream for "-" without closing it.
+    """
+    if path == "-":
+        return open(  # pylint: disable=consider-using-with
+            standard_stream.fileno(), mode, encoding="utf-8", closefd=False
+        )
+    return open(path, mode, encoding="utf-8")  # pylint: disable=consider-using-with
+
+
+if __name__ == "__main__":
+    sys.exit(main())
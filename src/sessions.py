@@ -0,0 +1,184 @@
+# -*- coding: utf-8 -*-
+
+"""
+Session store for many users of UserAuthentication.
+
+Sessions live in columns indexed by a slot number: the UserAuthentication
+state id of each slot in a bytearray and its expiry tick in an array, with
+a dict from user name to slot. Freed slots are reused. Expiry is scheduled
+on a timer wheel: one bucket of slots per tick, so scheduling a session is
+an append and expiring is a walk over the buckets of the ticks that passed.
+"""
+import time
+from array import array
+from math import ceil
+
+from src.white_box import UserAuthentication
+
+_TABLE = UserAuthentication.TABLE
+_LOGGED_OUT = _TABLE.state_id("Logged Out")
+_LOGGED_IN = _TABLE.state_id("Logged In")
+_LOGIN = _TABLE.events["login"]
+_LOGOUT = _TABLE.events["logout"]
+_INVALID_OPERATION = "Invalid operation in current state"
+
+
+class SessionManager:  # pylint: disable=too-many-instance-attributes
+    """
+    Logged in users with sliding expiry.
+    Sessions expire `ttl` seconds after their last login or touch, rounded
+    up to the next tick of `tick` seconds; expired sessions are logged out
+    by expire(), or as soon as they are looked up.
+    """
+
+    def __init__(self, ttl=1800.0, tick=1.0, clock=time.monotonic):
+        """
+        Creates an empty session store.
+        """
+        if ttl <= 0 or tick <= 0:
+            raise ValueError("TTL and tick must be positive")
+        self.ttl = ttl
+        self.tick = tick
+        self.clock = clock
+
+        self.slots = {}
+        self.users = []
+        self.states = bytearray()
+        self.expires = array("q")
+        self._free = []
+
+        # More buckets than ticks in a TTL, so a session is never scheduled
+        # a full turn of the wheel ahead.
+        self._wheel = [array("I") for _ in range(ceil(ttl / tick) + 2)]
+        self._last_tick = self._tick_at(clock())
+
+    def __len__(self):
+        """
+        Number of logged in users.
+        """
+        return len(self.slots)
+
+    def _tick_at(self, now):
+        """
+        Tick number of time `now`.
+        """
+        return int(now // self.tick)
+
+    def _schedule(self, slot, now):
+        """
+        Sets the expiry of `slot` and files it on the wheel.
+        The entry in the bucket of the previous expiry is left behind and
+        dropped when that bucket is next walked.
+        """
+        expires = self._tick_at(now + self.ttl) + 1
+        self.expires[slot] = expires
+        self._wheel[expires % len(self._wheel)].append(slot)
+
+    def _live_slot(self, user):
+        """
+        Slot of the session of `user`, or None when they are not logged in.
+        A session past its expiry is released here rather than waiting for
+        expire().
+        """
+        slot = self.slots.get(user)
+        if slot is not None and self.expires[slot] <= self._tick_at(self.clock()):
+            self._release(slot)
+            return None
+        return slot
+
+    def login(self, user):
+        """
+        Logs `user` in and starts their session.
+        """
+        slot = self._live_slot(user)
+        state = self.states[slot] if slot is not None else _LOGGED_OUT
+        if _LOGIN[state] < 0:
+            return _INVALID_OPERATION
+
+        if self._free:
+            slot = self._free.pop()
+            self.users[slot] = user
+        else:
+            slot = len(self.users)
+            self.users.append(user)
+            self.states.append(_LOGGED_OUT)
+            self.expires.append(0)
+        self.states[slot] = _LOGIN[_LOGGED_OUT]
+        self.slots[user] = slot
+        self._schedule(slot, self.clock())
+        return "Login successful"
+
+    def logout(self, user):
+        """
+        Logs `user` out and ends their session.
+        """
+        slot = self._live_slot(user)
+        if slot is None or _LOGOUT[self.states[slot]] < 0:
+            return _INVALID_OPERATION
+        self._release(slot)
+        return "Logout successful"
+
+    def _release(self, slot):
+        """
+        Logs the user of `slot` out and frees the slot.
+        """
+        self.states[slot] = _LOGOUT[self.states[slot]]
+        del self.slots[self.users[slot]]
+        self.users[slot] = None
+        self._free.append(slot)
+
+    def touch(self, user):
+        """
+        Extends the session of `user`.
+        Returns False when the user is not logged in or their session has
+        expired.
+        """
+        slot = self._live_slot(user)
+        if slot is None:
+            return False
+        now = self.clock()
+        if self.expires[slot] != self._tick_at(now + self.ttl) + 1:
+            self._schedule(slot, now)
+        return True
+
+    def is_logged_in(self, user):
+        """
+        Whether `user` has a live session.
+        """
+        return self._live_slot(user) is not None
+
+    def get_state(self, user):
+        """
+        UserAuthentication state name of `user`.
+        """
+        slot = self._live_slot(user)
+        return _TABLE.states[_LOGGED_OUT if slot is None else self.states[slot]]
+
+    def expire(self):
+        """
+        Logs out the users whose sessions expired since the last call.
+        Returns their names.
+        """
+        now = self._tick_at(self.clock())
+        first = self._last_tick + 1
+        if now < first:
+            return []
+        self._last_tick = now
+        size = len(self._wheel)
+        first = max(first, now - size + 1)
+
+        expired = []
+        states, expires, users = self.states, self.expires, self.users
+        for tick in range(first, now + 1):
+            bucket = self._wheel[tick % size]
+            pending = array("I")
+            for slot in bucket:
+                if states[slot] != _LOGGED_IN:
+                    continue
+                if expires[slot] <= now:
+                    expired.append(users[slot])
+                    self._release(slot)
+                elif expires[slot] % size == tick % size:
+                    pending.append(slot)
+            bucket[:] = pending
+        return expired
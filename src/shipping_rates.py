@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+
+"""
+Table-driven shipping rates.
+"""
+import json
+from bisect import bisect_left
+from pathlib import Path
+
+DEFAULT_RATES_FILE = Path(__file__).with_name("shipping_rates.json")
+
+
+class ShippingRateTable:
+    """
+    Shipping costs by method and total weight.
+    Each method has sorted weight `breakpoints` and one more `rates` entry
+    than breakpoints: a weight up to and including `breakpoints[i]` (and
+    above the previous breakpoint) costs `rates[i]`, anything heavier than
+    the last breakpoint costs `rates[-1]`.
+    """
+
+    def __init__(self, methods):
+        """
+        Build the table from a {method: {"breakpoints": [...], "rates": [...]}}
+        mapping.
+        """
+        self.methods = {}
+        for method, tiers in methods.items():
+            breakpoints = list(tiers["breakpoints"])
+            rates = list(tiers["rates"])
+            if breakpoints != sorted(breakpoints):
+                raise ValueError(f"Unsorted breakpoints for method {method}")
+            if len(rates) != len(breakpoints) + 1:
+                raise ValueError(f"Expected {len(breakpoints) + 1} rates for {method}")
+            self.methods[method] = (breakpoints, rates)
+
+    @classmethod
+    def from_file(cls, path=DEFAULT_RATES_FILE):
+        """
+        Loads a rate table from a JSON file.
+        """
+        with open(path, encoding="utf-8") as rates_file:
+            return cls(json.load(rates_file))
+
+    def _tiers(self, shipping_method):
+        """
+        Breakpoints and rates of a shipping method.
+        """
+        try:
+            return self.methods[shipping_method]
+        except KeyError:
+            raise ValueError("Invalid shipping method") from None
+
+    def cost(self, total_weight, shipping_method):
+        """
+        Shipping cost of a package weighing `total_weight`.
+        """
+        breakpoints, rates = self._tiers(shipping_method)
+        return rates[bisect_left(breakpoints, total_weight)]
+
+    def items_cost(self, items, shipping_method):
+        """
+        Shipping cost of an order, from the "weight" of each item.
+        """
+        return self.cost(sum(item["weight"] for item in items), shipping_method)
+
+    def batch_costs(self, orders, shipping_method):
+        """
+        Shipping costs of many orders (lists of items) with the same method.
+        """
+        breakpoints, rates = self._tiers(shipping_method)
+        return [
+            rates[bisect_left(breakpoints, sum(item["weight"] for item in items))]
+            for items in orders
+        ]
+
+
+DEFAULT_RATES = ShippingRateTable.from_file()
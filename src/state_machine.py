@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+
+"""
+Table-driven finite state machines.
+
+A StateTable numbers the states of a machine and holds one transition row
+per event: row[state_id] is the id of the next state, or INVALID_TRANSITION
+when the event is not allowed in that state. StateMachine instances only
+store their current state id; a MachineFleet stores the state ids of many
+machines in one bytearray and fires events on all of them at once with
+bytes.translate.
+"""
+
+INVALID_TRANSITION = -1
+# Fleets keep one state id per byte and need a spare bit above the ids.
+MAX_FLEET_STATES = 128
+
+
+def _event_method(targets, results):
+    """
+    Returns a method that moves a machine from each state id to
+    `targets[state_id]` and returns `results[state_id]`.
+    The tuples are closure cells rather than defaults, so the method takes
+    no arguments beyond the machine.
+    """
+
+    def fire(machine):
+        """
+        Fires the event on `machine`.
+        """
+        state_id = machine.state_id
+        machine.state_id = targets[state_id]
+        return results[state_id]
+
+    return fire
+
+
+class StateTable:
+    """
+    States and transition matrix of a state machine.
+    """
+
+    def __init__(self, states, initial):
+        """
+        Numbers `states` in order; `initial` is the state of new machines.
+        """
+        self.states = tuple(states)
+        self.ids = {state: state_id for state_id, state in enumerate(self.states)}
+        if len(self.ids) != len(self.states):
+            raise ValueError("Duplicate state names")
+        self.initial = self.state_id(initial)
+        self.events = {}
+
+    def state_id(self, state):
+        """
+        Id of the state named `state`.
+        """
+        try:
+            return self.ids[state]
+        except KeyError:
+            raise ValueError(f"Unknown state: {state!r}") from None
+
+    def event(  # pylint: disable=too-many-arguments
+        self, name, moves, message=None, invalid=None, doc=None
+    ):
+        """
+        Adds the event `name`, where `moves` maps each state the event is
+        allowed in to the next state.
+        Returns a method that fires the event and returns `message`, or
+        `invalid` when the event is not allowed in the current state.
+        """
+        if name in self.events:
+            raise ValueError(f"Duplicate event: {name!r}")
+        row = [INVALID_TRANSITION] * len(self.states)
+        for source, target in moves.items():
+            row[self.state_id(source)] = self.state_id(target)
+        row = self.events[name] = tuple(row)
+
+        # The method indexes two per-state tuples instead of branching:
+        # disallowed states step to themselves and return `invalid`.
+        targets = tuple(
+            state_id if target < 0 else target for state_id, target in enumerate(row)
+        )
+        results = tuple(invalid if target < 0 else message for target in row)
+        fire = _event_method(targets, results)
+        fire.__name__ = fire.__qualname__ = name
+        if doc is not None:
+            fire.__doc__ = doc
+        return fire
+
+    def translation(self, event):
+        """
+        The transition row of `event` as a bytes.translate table; states
+        where the event is not allowed map to themselves.
+        """
+        table = bytearray(range(256))
+        for state_id, target in enumerate(self.events[event]):
+            if target >= 0:
+                table[state_id] = target
+        return bytes(table)
+
+
+class StateMachine:
+    """
+    Base class of table-driven state machines. Subclasses set TABLE to a
+    StateTable and expose its events as methods.
+    """
+
+    __slots__ = ("state_id",)
+    TABLE = StateTable(("Initial",), "Initial")
+
+    def __init__(self):
+        """
+        Starts the machine in the initial state of its table.
+        """
+        self.state_id = self.TABLE.initial
+
+    @property
+    def state(self):
+        """
+        Name of the current state.
+        """
+        return self.TABLE.states[self.state_id]
+
+    @state.setter
+    def state(self, state):
+        self.state_id = self.TABLE.state_id(state)
+
+    def replay(self, events):
+        """
+        Fires a log of event names in order, skipping events that are not
+        allowed in the state reached so far.
+        Returns the number of events that changed the state; unknown
+        event names raise KeyError.
+        """
+        rows = self.TABLE.events
+        state_id = self.state_id
+        accepted = 0
+        for event in events:
+            target = rows[event][state_id]
+            if target >= 0:
+                state_id = target
+                accepted += 1
+        self.state_id = state_id
+        return accepted
+
+
+class MachineFleet:
+    """
+    Many machines of one StateTable, stored as a bytearray of state ids.
+    """
+
+    def __init__(self, table, size):
+        """
+        Creates `size` machines in the initial state of `table`.
+        """
+        if len(table.states) > MAX_FLEET_STATES:
+            raise ValueError(f"Fleets support up to {MAX_FLEET_STATES} states")
+        self.table = table
+        self.states = bytearray([table.initial]) * size
+
+        # A masked step adds `flag` to the selected ids, then one table maps
+        # ids below `flag` to themselves and `flag + id` to the next state.
+        flag = 1 << (len(table.states) - 1).bit_length()
+        self._flags = bytes([0]) + bytes([flag]) * 255
+        self._steps = {}
+        self._masked_steps = {}
+        for event in table.events:
+            step = self._steps[event] = table.translation(event)
+            self._masked_steps[event] = bytes(range(flag)) + step[: 256 - flag]
+
+    def __len__(self):
+        """
+        Number of machines in the fleet.
+        """
+        return len(self.states)
+
+    def state(self, index):
+        """
+        Name of the state of machine `index`.
+        """
+        return self.table.states[self.states[index]]
+
+    def set_state(self, index, state):
+        """
+        Sets the state of machine `index` by name.
+        """
+        self.states[index] = self.table.state_id(state)
+
+    def fire(self, event, mask=None):
+        """
+        Fires `event` on every machine, or only on the machines whose entry
+        in `mask` (a sequence of one flag per machine) is true.
+        """
+        if mask is None:
+            self.states[:] = self.states.translate(self._steps[event])
+            return
+
+        size = len(self.states)
+        if len(mask) != size:
+            raise ValueError("Mask length does not match the fleet size")
+        if not isinstance(mask, (bytes, bytearray)):
+            mask = bytes(map(bool, mask))
+        flags = mask.translate(self._flags)
+        combined = int.from_bytes(self.states, "little") + int.from_bytes(
+            flags, "little"
+        )
+        self.states[:] = combined.to_bytes(size, "little").translate(
+            self._masked_steps[event]
+        )
+
+    def fire_one(self, index, event):
+        """
+        Fires `event` on machine `index` only.
+        """
+        states = self.states
+        states[index] = self._steps[event][states[index]]
+
+    def counts(self):
+        """
+        Number of machines in each state, by state name.
+        """
+        return {
+            state: self.states.count(state_id)
+            for state_id, state in enumerate(self.table.states)
+        }
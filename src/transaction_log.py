@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+
+"""
+Append-only binary transaction log.
+
+Every transaction is one fixed-size little-endian record (see RECORD), so
+a log can be appended to without reading it and replayed with
+struct.iter_unpack. Records are buffered in memory and written, flushed and
+fsynced once per batch instead of once per transaction.
+"""
+import os
+import struct
+import time
+from collections import namedtuple
+
+# time (float seconds), kind, slot, amount (cents or units), paid (cents)
+RECORD = struct.Struct("<dBHII")
+
+LOG_VEND = 1
+LOG_REFUND = 2
+LOG_RESTOCK = 3
+
+# Slot of LOG_REFUND records: refunds give back credit, not a slot's sale,
+# so they use the largest slot number, which no real slot may take.
+REFUND_SLOT = 0xFFFF
+
+Transaction = namedtuple("Transaction", ["time", "kind", "slot", "amount", "paid"])
+Transaction.__doc__ = """
+One logged transaction. For LOG_VEND `amount` is the price and `paid` the
+credit it was paid from; for LOG_REFUND (logged under REFUND_SLOT) `amount`
+is the refunded credit; for LOG_RESTOCK `amount` is the number of items
+added to `slot`.
+"""
+
+SlotTotals = namedtuple("SlotTotals", ["vends", "revenue", "refunds", "restocked"])
+
+# Records read per chunk when replaying.
+_REPLAY_RECORDS = 1 << 16
+
+
+class TransactionLog:
+    """
+    Writer of an append-only transaction log file.
+    Records are written in batches of `batch_size`; with `fsync` each batch
+    is also forced to disk before append() returns.
+    """
+
+    def __init__(self, path, batch_size=1024, fsync=True, clock=time.time):
+        """
+        Opens `path` for appending, creating it if needed.
+        """
+        if batch_size < 1:
+            raise ValueError("Batch size must be at least 1")
+        self.path = path
+        self.batch_size = batch_size
+        self.fsync = fsync
+        self.clock = clock
+        self._file = open(path, "ab")  # pylint: disable=consider-using-with
+        self._buffer = bytearray()
+        self._pending = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def append(  # pylint: disable=too-many-arguments
+        self, kind, slot, amount, paid=0, timestamp=None
+    ):
+        """
+        Logs one transaction, writing the batch out when it is full.
+        """
+        if timestamp is None:
+            timestamp = self.clock()
+        self._buffer += RECORD.pack(timestamp, kind, slot, amount, paid)
+        self._pending += 1
+        if self._pending >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """
+        Writes the buffered records out, and fsyncs them when enabled.
+        """
+        if not self._pending:
+            return
+        self._file.write(self._buffer)
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+        self._buffer.clear()
+        self._pending = 0
+
+    def close(self):
+        """
+        Flushes the buffered records and closes the file.
+        """
+        if self._file.closed:
+            return
+        self.flush()
+        self._file.close()
+
+
+def _records(path):
+    """
+    Yields the raw record tuples of a log file, skipping a partial record
+    at the end of the file (an interrupted write).
+    """
+    chunk_size = RECORD.size * _REPLAY_RECORDS
+    with open(path, "rb") as log_file:
+        while True:
+            chunk = log_file.read(chunk_size)
+            usable = len(chunk) - len(chunk) % RECORD.size
+            yield from RECORD.iter_unpack(chunk[:usable])
+            if len(chunk) < chunk_size:
+                return
+
+
+def replay(path):
+    """
+    Yields the Transaction records of a log file in order.
+    """
+    return map(Transaction._make, _records(path))
+
+
+def aggregate(path):
+    """
+    Totals a log file per slot.
+    Returns a dict of slot to SlotTotals(vends, revenue, refunds, restocked).
+    Refunds are not tied to a slot: they are reported on their own under
+    REFUND_SLOT, so the totals of real slots never include them.
+    """
+    totals = {}
+    for _, kind, slot, amount, _ in _records(path):
+        vends, revenue, refunds, restocked = totals.get(slot, (0, 0, 0, 0))
+        if kind == LOG_VEND:
+            vends += 1
+            revenue += amount
+        elif kind == LOG_REFUND:
+            refunds += amount
+        elif kind == LOG_RESTOCK:
+            restocked += amount
+        totals[slot] = (vends, revenue, refunds, restocked)
+    return {slot: SlotTotals(*values) for slot, values in totals.items()}
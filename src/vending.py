@@ -0,0 +1,277 @@
+# -*- coding: utf-8 -*-
+
+"""
+Vending machine with slot inventory, coin accounting and a transaction log.
+
+All amounts are integer cents. Change is made from a coin-change table
+computed once per set of denominations; when the coins in the machine
+cannot pay the table's answer, a bounded search over the coins actually
+loaded is used instead.
+"""
+from array import array
+from collections import namedtuple
+
+from src.transaction_log import LOG_REFUND, LOG_RESTOCK, LOG_VEND, REFUND_SLOT
+from src.white_box import VendingMachine
+
+DEFAULT_DENOMINATIONS = (5, 10, 25, 100)
+# Largest amount of change looked up in the precomputed table.
+DEFAULT_MAX_CHANGE = 1000
+
+VendResult = namedtuple("VendResult", ["status", "change"])
+VendResult.__doc__ = """
+Outcome of a vend: `status` is one of the VEND_* codes and `change` maps
+each coin denomination to the number of coins given back.
+"""
+
+VEND_OK = "ok"
+VEND_NOT_READY = "not_ready"
+VEND_UNKNOWN_SLOT = "unknown_slot"
+VEND_SOLD_OUT = "sold_out"
+VEND_INSUFFICIENT_CREDIT = "insufficient_credit"
+VEND_NO_CHANGE = "no_change"
+
+_VEND_MESSAGES = {
+    VEND_OK: "Drink Dispensed. Thank you!",
+    VEND_NOT_READY: "Invalid operation in current state.",
+    VEND_UNKNOWN_SLOT: "Invalid selection.",
+    VEND_SOLD_OUT: "Sold out.",
+    VEND_INSUFFICIENT_CREDIT: "Insufficient credit.",
+    VEND_NO_CHANGE: "Exact change only.",
+}
+
+
+class CoinChanger:  # pylint: disable=too-few-public-methods
+    """
+    Makes change with the fewest coins.
+    `table[amount]` is the fewest coins that pay `amount` (0 when it cannot
+    be paid) and `last[amount]` the denomination of one of those coins, for
+    every amount up to `max_amount`.
+    """
+
+    def __init__(
+        self, denominations=DEFAULT_DENOMINATIONS, max_amount=DEFAULT_MAX_CHANGE
+    ):
+        """
+        Precomputes the change table.
+        """
+        self.denominations = tuple(sorted(set(denominations)))
+        if not self.denominations or self.denominations[0] <= 0:
+            raise ValueError("Denominations must be positive")
+        self.max_amount = max_amount
+
+        unreachable = max_amount + 1
+        table = array("I", [0]) + array("I", [unreachable]) * max_amount
+        last = array("I", [0]) * (max_amount + 1)
+        for amount in range(1, max_amount + 1):
+            for coin in self.denominations:
+                if coin > amount:
+                    break
+                coins = table[amount - coin] + 1
+                if coins < table[amount]:
+                    table[amount] = coins
+                    last[amount] = coin
+        for amount in range(1, max_amount + 1):
+            if table[amount] == unreachable:
+                table[amount] = 0
+        self.table = table
+        self.last = last
+
+    def make_change(self, amount, available=None):
+        """
+        Returns the coins that pay `amount` as a dict of denomination to
+        count, or None when it cannot be paid. `available` limits the coins
+        of each denomination that can be used.
+        """
+        if amount == 0:
+            return {}
+        if amount < 0:
+            raise ValueError("Change cannot be negative")
+        if amount <= self.max_amount:
+            if not self.table[amount]:
+                return None
+            change = {}
+            last = self.last
+            remaining = amount
+            while remaining:
+                coin = last[remaining]
+                change[coin] = change.get(coin, 0) + 1
+                remaining -= coin
+            if available is None or all(
+                available.get(coin, 0) >= count for coin, count in change.items()
+            ):
+                return change
+        if available is None:
+            available = dict.fromkeys(self.denominations, amount)
+        return _bounded_change(amount, available)
+
+
+def _coin_bundles(amount, available):
+    """
+    Splits each stock of coins into bundles of 1, 2, 4... coins, so that
+    any number of coins up to the stock is a sum of distinct bundles.
+    """
+    bundles = []
+    for coin, stock in available.items():
+        stock = min(stock, amount // coin)
+        size = 1
+        while stock > 0:
+            take = min(size, stock)
+            bundles.append((coin, take))
+            stock -= take
+            size *= 2
+    return bundles
+
+
+def _bounded_change(amount, available):
+    """
+    Fewest coins paying `amount` using at most `available[coin]` of each
+    coin, or None. Each coin bundle is used at most once (0/1 knapsack).
+    """
+    bundles = _coin_bundles(amount, available)
+    unreachable = amount + 1
+    best = [0] + [unreachable] * amount
+    used = []
+    for coin, count in bundles:
+        value = coin * count
+        took = bytearray(amount + 1)
+        for total in range(amount, value - 1, -1):
+            coins = best[total - value] + count
+            if coins < best[total]:
+                best[total] = coins
+                took[total] = 1
+        used.append(took)
+    if best[amount] == unreachable:
+        return None
+
+    change = {}
+    for (coin, count), took in zip(reversed(bundles), reversed(used)):
+        if took[amount]:
+            change[coin] = change.get(coin, 0) + count
+            amount -= coin * count
+    return change
+
+
+class InventoryVendingMachine(VendingMachine):
+    """
+    Vending machine with priced slots, a coin box and optional transaction
+    log. Coins build up credit; a vend pays the slot price from the credit
+    and gives the rest back as change from the coin box.
+    Called without arguments, insert_coin and select_drink keep the plain
+    VendingMachine behavior only on a machine with no slots and no credit;
+    otherwise they are refused, so nothing is dispensed without payment.
+    """
+
+    __slots__ = ("changer", "log", "names", "prices", "stock", "coins", "credit")
+
+    def __init__(self, changer=None, log=None):
+        """
+        Creates an empty machine; `log` is an optional TransactionLog.
+        """
+        super().__init__()
+        self.changer = changer or CoinChanger()
+        self.log = log
+        self.names = []
+        self.prices = array("I")
+        self.stock = array("I")
+        self.coins = dict.fromkeys(self.changer.denominations, 0)
+        self.credit = 0
+
+    def add_slot(self, name, price, quantity=0):
+        """
+        Adds a slot selling `name` at `price` cents.
+        Returns the slot number.
+        """
+        if len(self.names) >= REFUND_SLOT:
+            raise ValueError("Too many slots")
+        self.names.append(name)
+        self.prices.append(price)
+        self.stock.append(0)
+        slot = len(self.names) - 1
+        if quantity:
+            self.restock(slot, quantity)
+        return slot
+
+    def restock(self, slot, quantity):
+        """
+        Adds `quantity` items to `slot`.
+        """
+        self.stock[slot] += quantity
+        if self.log is not None:
+            self.log.append(LOG_RESTOCK, slot, quantity)
+
+    def load_coins(self, coins):
+        """
+        Adds coins to the coin box, from a dict of denomination to count.
+        """
+        for coin, count in coins.items():
+            if coin not in self.coins:
+                raise ValueError(f"Invalid coin: {coin}")
+            self.coins[coin] += count
+
+    def insert_coin(self, coin=None):
+        """
+        Function called when a coin is inserted.
+        """
+        if coin is None:
+            if self.names or self.credit:
+                return "Invalid coin."
+            return super().insert_coin()
+        if coin not in self.coins:
+            return "Invalid coin."
+
+        self.coins[coin] += 1
+        self.credit += coin
+        self.state = "Dispensing"
+        return "Coin Inserted. Select your drink."
+
+    def vend(self, slot):
+        """
+        Sells one item of `slot` from the current credit and returns a
+        VendResult. On failure the credit is kept.
+        """
+        if self.state != "Dispensing":
+            return VendResult(VEND_NOT_READY, {})
+        if not 0 <= slot < len(self.names):
+            return VendResult(VEND_UNKNOWN_SLOT, {})
+        if not self.stock[slot]:
+            return VendResult(VEND_SOLD_OUT, {})
+        price = self.prices[slot]
+        if self.credit < price:
+            return VendResult(VEND_INSUFFICIENT_CREDIT, {})
+        change = self.changer.make_change(self.credit - price, self.coins)
+        if change is None:
+            return VendResult(VEND_NO_CHANGE, {})
+
+        for coin, count in change.items():
+            self.coins[coin] -= count
+        self.stock[slot] -= 1
+        if self.log is not None:
+            self.log.append(LOG_VEND, slot, price, self.credit)
+        self.credit = 0
+        self.state = "Ready"
+        return VendResult(VEND_OK, change)
+
+    def select_drink(self, slot=None):
+        """
+        Function called after selecting a drink.
+        """
+        if slot is None:
+            if self.names or self.credit:
+                return _VEND_MESSAGES[VEND_UNKNOWN_SLOT]
+            return super().select_drink()
+        return _VEND_MESSAGES[self.vend(slot).status]
+
+    def refund(self):
+        """
+        Gives the current credit back.
+        Returns the coins as a dict of denomination to count.
+        """
+        change = self.changer.make_change(self.credit, self.coins)
+        for coin, count in change.items():
+            self.coins[coin] -= count
+        if self.credit and self.log is not None:
+            self.log.append(LOG_REFUND, REFUND_SLOT, self.credit)
+        self.credit = 0
+        self.state = "Ready"
+        return change
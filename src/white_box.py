@@ -3,7 +3,20 @@
 """
 White-box code examples.
 """
-import re
+# pylint: disable=too-many-lines
+import logging
+from array import array
+from calendar import monthrange
+from collections import namedtuple
+from functools import lru_cache
+from itertools import repeat
+from operator import mul
+
+from src.credentials import CredentialStore, VerifiedCredentialCache
+from src.intervals import IntervalClassifier
+from src.money import MONEY_CENTS, apply_rate, format_cents, resolve_money_mode
+from src.shipping_rates import DEFAULT_RATES
+from src.state_machine import MachineFleet, StateMachine, StateTable
 
 
 # 0.1
@@ -26,19 +39,16 @@ def divide(a, b):
 
 
 # 0.3
-def get_grade(score):
-    """
-    Grade function.
-    """
-    if score >= 90:
-        grade = "A"
-    elif score >= 80:
-        grade = "B"
-    elif score >= 70:
-        grade = "C"
-    else:
-        grade = "F"
-    return grade
+_GRADES = IntervalClassifier(
+    [
+        (90, None, "A"),
+        (80, 90, "B", "left"),
+        (70, 80, "C", "left"),
+    ],
+    default="F",
+)
+
+get_grade = _GRADES.scalar_function("get_grade", "score", "Grade function.", __name__)
 
 
 # 0.4
@@ -67,48 +77,136 @@ def check_number_status(number):
 
 
 # 2
+_PASSWORD_MIN_LENGTH = 8
+_PASSWORD_SPECIAL_CHARS = "!@#$%&"
+
+# Bit assigned to each password rule; a password is valid once all are set.
+_PASSWORD_UPPER = 1
+_PASSWORD_LOWER = 2
+_PASSWORD_DIGIT = 4
+_PASSWORD_SPECIAL = 8
+_PASSWORD_ALL_RULES = 15
+
+_PASSWORD_RULE_NAMES = (
+    (_PASSWORD_UPPER, "uppercase"),
+    (_PASSWORD_LOWER, "lowercase"),
+    (_PASSWORD_DIGIT, "digit"),
+    (_PASSWORD_SPECIAL, "special"),
+)
+
+# Precomputed character class of every character that satisfies a rule.
+_PASSWORD_CHAR_CLASSES = {
+    **dict.fromkeys("ABCDEFGHIJKLMNOPQRSTUVWXYZ", _PASSWORD_UPPER),
+    **dict.fromkeys("abcdefghijklmnopqrstuvwxyz", _PASSWORD_LOWER),
+    **dict.fromkeys("0123456789", _PASSWORD_DIGIT),
+    **dict.fromkeys(_PASSWORD_SPECIAL_CHARS, _PASSWORD_SPECIAL),
+}
+
+
+def _password_rules_met(password):
+    """
+    Classifies the password characters in a single pass and returns the
+    bitmask of the rules they satisfy.
+    """
+    classes = _PASSWORD_CHAR_CLASSES
+    rules = 0
+    for char in password:
+        # Like the regex "\\d", any Unicode decimal digit counts as a digit.
+        rules |= classes.get(char) or (_PASSWORD_DIGIT if char.isdecimal() else 0)
+        if rules == _PASSWORD_ALL_RULES:
+            break
+    return rules
+
+
 def validate_password(password):
     """
     Validates user passwords.
     """
     # Check length
-    if len(password) < 8:
+    if len(password) < _PASSWORD_MIN_LENGTH:
         return False
 
     # Check for at least one uppercase letter, one lowercase letter,
     # one digit, and one special character.
-    if (
-        not re.search(r"[A-Z]", password)
-        or not re.search(r"[a-z]", password)
-        or not re.search(r"\d", password)
-        or not re.search(r"[!@#$%&]", password)
-    ):
-        return False
+    return _password_rules_met(password) == _PASSWORD_ALL_RULES
+
+
+def validate_passwords(passwords, with_reasons=False):
+    """
+    Validates many passwords at once.
+    Returns a list of booleans, one per password. When `with_reasons` is set,
+    a second list is returned holding, for each password, the tuple of failed
+    rules ("length", "uppercase", "lowercase", "digit", "special").
+    """
+    if not with_reasons:
+        return [validate_password(password) for password in passwords]
 
-    return True
+    results = []
+    reasons = []
+    for password in passwords:
+        rules = _password_rules_met(password)
+        failed = tuple(name for bit, name in _PASSWORD_RULE_NAMES if not rules & bit)
+        if len(password) < _PASSWORD_MIN_LENGTH:
+            failed = ("length",) + failed
+        results.append(not failed)
+        reasons.append(failed)
+    return results, reasons
 
 
 # 3
-def calculate_total_discount(total_amount):
+_DISCOUNT_RATES = IntervalClassifier(
+    [
+        (None, 100, 0, "neither"),
+        (100, 500, 0.1),
+        (500, None, 0.2, "neither"),
+    ]
+)
+_DISCOUNT_BASIS_POINTS = IntervalClassifier(
+    [
+        (None, 10000, 0, "neither"),
+        (10000, 50000, 1000),
+        (50000, None, 2000, "neither"),
+    ]
+)
+_discount_rate = _DISCOUNT_RATES.scalar_function("_discount_rate", "total_amount")
+_discount_basis_points = _DISCOUNT_BASIS_POINTS.scalar_function(
+    "_discount_basis_points", "total_amount"
+)
+
+
+def calculate_total_discount(total_amount, money=None):
     """
     Calculates the discount for a customer's purchase based on the total amount.
+    In the "cents" money mode the amount and the discount are integer cents.
     """
-    if total_amount < 100:
-        return 0
+    if resolve_money_mode(money) == MONEY_CENTS:
+        return apply_rate(total_amount, _discount_basis_points(total_amount))
 
-    if 100 <= total_amount <= 500:
-        return 0.1 * total_amount
-
-    return 0.2 * total_amount
+    # No discount is an int 0, not 0 * total_amount.
+    rate = _discount_rate(total_amount)
+    return rate and rate * total_amount
 
 
 # 4
-def calculate_order_total(items):
+# Discount rate for every whole quantity in the 1-5 and 6-10 tiers; any
+# other whole quantity gets the 10% discount.
+_ORDER_TIER_RATES = {
+    **dict.fromkeys(range(1, 6), 1),
+    **dict.fromkeys(range(6, 11), 0.95),
+}
+
+
+def calculate_order_total(items, money=None):
     """
     Processes user orders in an e-commerce system.
     The function calculates the total price of the items in the order,
     applying different discounts based on the quantity of each item.
+    In the "cents" money mode prices and the total are integer cents, and
+    each discounted line is rounded to the cent.
     """
+    if resolve_money_mode(money) == MONEY_CENTS:
+        return _calculate_order_total_cents(items)
+
     total_price = 0
 
     for item in items:
@@ -126,34 +224,89 @@ def calculate_order_total(items):
     return total_price
 
 
-# 5
-def calculate_items_shipping_cost(items, shipping_method):
+def _calculate_order_total_cents(items):
     """
-    Calculates shipping costs for an online shopping system.
-    The function calculates shipping costs based on the total weight of the
-    items in the order and the shipping method chosen by the customer.
+    calculate_order_total for prices in integer cents.
     """
-    total_weight = sum(item["weight"] for item in items)
+    total_price = 0
 
-    if shipping_method == "standard":
-        if total_weight <= 5:
-            return 10
+    for item in items:
+        total_price += _line_total_cents(item["quantity"], item["price"])
 
-        if 5 < total_weight <= 10:
-            return 15
+    return total_price
 
-        return 20
 
-    if shipping_method == "express":
-        if total_weight <= 5:
-            return 20
+def _line_total_cents(quantity, price):
+    """
+    Discounted total of one order line in integer cents.
+    """
+    line_price = quantity * price
+
+    if 1 <= quantity <= 5:
+        return line_price
+    if 6 <= quantity <= 10:
+        return apply_rate(line_price, 9500)  # 5% discount
+    return apply_rate(line_price, 9000)  # 10% discount
+
+
+def calculate_order_totals(quantities, prices, offsets, money=None):
+    """
+    Calculates the totals of many orders stored as columns.
+    `quantities` and `prices` hold one entry per item line, and the lines of
+    order `k` are `offsets[k]:offsets[k + 1]`, so `n` orders need `n + 1`
+    offsets. A dict of columns can be passed as `**columns`. Raises
+    ValueError if the columns differ in length or the offsets are not
+    ascending indexes into them.
+    Every total matches calculate_order_total for the same order, in the
+    `money` mode (the global mode when None).
+    """
+    quantities = list(quantities)
+    prices = list(prices)
+    offsets = list(offsets)
+    if len(prices) != len(quantities):
+        raise ValueError("quantities and prices must have the same length")
+    if any(start > end for start, end in zip(offsets, offsets[1:])) or (
+        offsets and not 0 <= offsets[0] <= offsets[-1] <= len(quantities)
+    ):
+        raise ValueError("offsets must be ascending indexes into the lines")
 
-        if 5 < total_weight <= 10:
-            return 30
+    if resolve_money_mode(money) == MONEY_CENTS:
+        line_totals = list(map(_line_total_cents, quantities, prices))
+    else:
+        # Vectorized tier selection: look up each quantity's rate, then
+        # compute rate * quantity * price with the same evaluation order as
+        # the scalar path. A rate of int 1 keeps undiscounted lines exact.
+        if set(map(type, quantities)) <= {int}:
+            rates = map(_ORDER_TIER_RATES.get, quantities, repeat(0.9))
+        else:
+            # Fractional quantities fall between the table keys.
+            rates = [
+                1 if 1 <= quantity <= 5 else 0.95 if 6 <= quantity <= 10 else 0.9
+                for quantity in quantities
+            ]
+        line_totals = list(map(mul, map(mul, rates, quantities), prices))
+
+    # Lines are added one by one, in order, so float results are identical
+    # to the scalar path (sum() may use compensated summation).
+    totals = []
+    for start, end in zip(offsets, offsets[1:]):
+        total_price = 0
+        for line_total in line_totals[start:end]:
+            total_price += line_total
+        totals.append(total_price)
 
-        return 40
+    return totals
 
-    raise ValueError("Invalid shipping method")
+
+# 5
+def calculate_items_shipping_cost(items, shipping_method):
+    """
+    Calculates shipping costs for an online shopping system.
+    The function calculates shipping costs based on the total weight of the
+    items in the order and the shipping method chosen by the customer.
+    The rates come from the default ShippingRateTable.
+    """
+    return DEFAULT_RATES.items_cost(items, shipping_method)
 
 
 # 6
@@ -168,31 +321,45 @@ def validate_login(username, password):
 
 
 # 7
-def verify_age(age):
-    """
-    Determines whether a person is eligible for a certain service based on their age.
-    """
-    if 18 <= age <= 65:
-        return "Eligible"
-
-    return "Not Eligible"
+_AGE_ELIGIBILITY = IntervalClassifier([(18, 65, "Eligible")], default="Not Eligible")
+verify_age = _AGE_ELIGIBILITY.scalar_function(
+    "verify_age",
+    "age",
+    "Determines whether a person is eligible for a certain service based on "
+    "their age.",
+    __name__,
+)
 
 
 # 8
-def categorize_product(price):
-    """
-    Determines the price category of a product based on its price.
-    """
-    if 10 <= price <= 50:
-        return "Category A"
-
-    if 51 <= price <= 100:
-        return "Category B"
-
-    if 101 <= price <= 200:
-        return "Category C"
-
-    return "Category D"
+PRODUCT_CATEGORIES = ("Category A", "Category B", "Category C", "Category D")
+# Buckets are continuous: [10, 50], (50, 100], (100, 200]; anything else is D.
+_PRODUCT_CATEGORY_INTERVALS = (
+    (10, 50, 0),
+    (50, 100, 1, "right"),
+    (100, 200, 2, "right"),
+)
+_PRODUCT_CATEGORY_CODES = IntervalClassifier(_PRODUCT_CATEGORY_INTERVALS, default=3)
+categorize_product = IntervalClassifier(
+    [
+        (low, high, PRODUCT_CATEGORIES[code], *closed)
+        for low, high, code, *closed in _PRODUCT_CATEGORY_INTERVALS
+    ],
+    default=PRODUCT_CATEGORIES[3],
+).scalar_function(
+    "categorize_product",
+    "price",
+    "Determines the price category of a product based on its price.",
+    __name__,
+)
+
+
+def categorize_products(prices):
+    """
+    Categorizes a column of prices in one call.
+    Returns an array("b") of category codes, indexes into PRODUCT_CATEGORIES.
+    """
+    return array("b", _PRODUCT_CATEGORY_CODES.classify_many(prices))
 
 
 # 9
@@ -229,11 +396,22 @@ def validate_credit_card(card_number):
 
 
 # 12
+DATE_MIN_YEAR = 1900
+DATE_MAX_YEAR = 2100
+
+# Number of days of every month of every supported year, leap years included.
+DAYS_IN_MONTH = {
+    (year, month): monthrange(year, month)[1]
+    for year in range(DATE_MIN_YEAR, DATE_MAX_YEAR + 1)
+    for month in range(1, 13)
+}
+
+
 def validate_date(year, month, day):
     """
     Validates dates.
     """
-    if 1900 <= year <= 2100 and 1 <= month <= 12 and 1 <= day <= 31:
+    if 1 <= day <= DAYS_IN_MONTH.get((year, month), 0):
         return "Valid Date"
 
     return "Invalid Date"
@@ -251,39 +429,49 @@ def check_flight_eligibility(age, frequent_flyer):
 
 
 # 14
+URL_MAX_LENGTH = 255
+URL_PREFIXES = ("http://", "https://")
+
+
 def validate_url(url):
     """
     Validates URLs.
     """
-    if len(url) <= 255 and url.startswith("http://") or url.startswith("https://"):
+    if len(url) <= URL_MAX_LENGTH and url.startswith(URL_PREFIXES):
         return "Valid URL"
 
     return "Invalid URL"
 
 
 # 15
-def calculate_quantity_discount(quantity):
-    """
-    Calculates discounts based on the quantity of a product.
-    """
-    if 1 <= quantity <= 5:
-        return "No Discount"
-
-    if 6 <= quantity <= 10:
-        return "5% Discount"
-
-    return "10% Discount"
+_QUANTITY_DISCOUNTS = IntervalClassifier(
+    [
+        (1, 5, "No Discount"),
+        (6, 10, "5% Discount"),
+    ],
+    default="10% Discount",
+)
+
+calculate_quantity_discount = _QUANTITY_DISCOUNTS.scalar_function(
+    "calculate_quantity_discount",
+    "quantity",
+    "Calculates discounts based on the quantity of a product.",
+    __name__,
+)
 
 
 # 16
-def check_file_size(size_in_bytes):
-    """
-    Checks if the size is valid for a file.
-    """
-    if 0 <= size_in_bytes <= 1048576:  # 1 MB in bytes
-        return "Valid File Size"
+_FILE_SIZES = IntervalClassifier(
+    [(0, 1048576, "Valid File Size")],  # 1 MB in bytes
+    default="Invalid File Size",
+)
 
-    return "Invalid File Size"
+check_file_size = _FILE_SIZES.scalar_function(
+    "check_file_size",
+    "size_in_bytes",
+    "Checks if the size is valid for a file.",
+    __name__,
+)
 
 
 # 17
@@ -340,11 +528,25 @@ def grade_quiz(correct_answers, incorrect_answers):
 
 
 # 20
-def authenticate_user(username, password):
+@lru_cache(maxsize=None)
+def _admin_credentials():
+    """
+    Credential store of the administrators, hashed once per process.
+    """
+    return CredentialStore({"admin": "admin123"}, cache=VerifiedCredentialCache())
+
+
+def authenticate_user(username, password, admin_credentials=None):
     """
     Authenticates users based on their username and password.
+    Administrators are checked against `admin_credentials`, a CredentialStore
+    holding the built-in admin account by default. Only administrator names
+    pay for the password hash; ordinary users never hit the store.
     """
-    if username == "admin" and password == "admin123":
+    if admin_credentials is None:
+        admin_credentials = _admin_credentials()
+
+    if username in admin_credentials and admin_credentials.verify(username, password):
         return "Admin"
 
     if len(username) >= 5 and len(password) >= 8:
@@ -368,61 +570,52 @@ def get_weather_advisory(temperature, humidity):
 
 
 # 22
-class VendingMachine:
+_INVALID_OPERATION = "Invalid operation in current state"
+_VENDING_MACHINE = StateTable(("Ready", "Dispensing"), "Ready")
+
+
+class VendingMachine(StateMachine):
     """
     A simple vending machine that dispenses drinks.
     It has two states: "Ready" and "Dispensing."
     """
 
-    def __init__(self):
-        """
-        Defines the vending machine initial state.
-        """
-        self.state = "Ready"
+    __slots__ = ()
+    TABLE = _VENDING_MACHINE
 
-    def insert_coin(self):
-        """
-        Function called when a coin is inserted.
-        """
-        if self.state == "Ready":
-            self.state = "Dispensing"
-            return "Coin Inserted. Select your drink."
+    insert_coin = _VENDING_MACHINE.event(
+        "insert_coin",
+        {"Ready": "Dispensing"},
+        "Coin Inserted. Select your drink.",
+        _INVALID_OPERATION + ".",
+        doc="Function called when a coin is inserted.",
+    )
+    select_drink = _VENDING_MACHINE.event(
+        "select_drink",
+        {"Dispensing": "Ready"},
+        "Drink Dispensed. Thank you!",
+        _INVALID_OPERATION + ".",
+        doc="Function called after selecting a drink.",
+    )
 
-        return "Invalid operation in current state."
 
-    def select_drink(self):
-        """
-        Function called after selecting a drink.
-        """
-        if self.state == "Dispensing":
-            self.state = "Ready"
-            return "Drink Dispensed. Thank you!"
-
-        return "Invalid operation in current state."
+# 23
+_TRAFFIC_LIGHT = StateTable(("Red", "Green", "Yellow"), "Red")
 
 
-# 23
-class TrafficLight:
+class TrafficLight(StateMachine):
     """
     A traffic light system with three states: "Green," "Yellow," and "Red."
     """
 
-    def __init__(self):
-        """
-        Defines the traffic light initial state.
-        """
-        self.state = "Red"
+    __slots__ = ()
+    TABLE = _TRAFFIC_LIGHT
 
-    def change_state(self):
-        """
-        Function that changes the traffic light state.
-        """
-        if self.state == "Red":
-            self.state = "Green"
-        elif self.state == "Green":
-            self.state = "Yellow"
-        elif self.state == "Yellow":
-            self.state = "Red"
+    change_state = _TRAFFIC_LIGHT.event(
+        "change_state",
+        {"Red": "Green", "Green": "Yellow", "Yellow": "Red"},
+        doc="Function that changes the traffic light state.",
+    )
 
     def get_current_state(self):
         """
@@ -431,113 +624,155 @@ class TrafficLight:
         return self.state
 
 
-# 24
-class UserAuthentication:
+class TrafficLightFleet(MachineFleet):
     """
-    A user authentication system with states "Logged Out" and "Logged In."
+    Traffic lights of a whole city stored as one bytearray of state ids,
+    all advanced by a single change_state call.
     """
 
-    def __init__(self):
+    def __init__(self, size):
         """
-        Defines the user initial state.
+        Creates `size` lights, all "Red".
         """
-        self.state = "Logged Out"
+        super().__init__(_TRAFFIC_LIGHT, size)
 
-    def login(self):
+    def __getitem__(self, index):
         """
-        Function to login a user.
+        View of light `index`.
         """
-        if self.state == "Logged Out":
-            self.state = "Logged In"
-            return "Login successful"
+        if not -len(self.states) <= index < len(self.states):
+            raise IndexError("Traffic light index out of range")
+        return TrafficLightView(self, index % len(self.states))
 
-        return "Invalid operation in current state"
-
-    def logout(self):
+    def change_state(self, mask=None):
         """
-        Function to logout a user.
+        Changes the state of every light, or of the lights selected by `mask`.
         """
-        if self.state == "Logged In":
-            self.state = "Logged Out"
-            return "Logout successful"
+        self.fire("change_state", mask)
 
-        return "Invalid operation in current state"
+    def get_current_state(self, index):
+        """
+        Provides the current state of light `index`.
+        """
+        return self.state(index)
 
 
-# 25
-class DocumentEditingSystem:
+class TrafficLightView:
     """
-    A document editing system with states "Editing" and "Saved."
+    One light of a TrafficLightFleet, with the TrafficLight interface.
     """
 
-    def __init__(self):
+    __slots__ = ("fleet", "index")
+
+    def __init__(self, fleet, index):
         """
-        Defines the initial state.
+        Binds the view to light `index` of `fleet`.
         """
-        self.state = "Editing"
+        self.fleet = fleet
+        self.index = index
 
-    def save_document(self):
+    def change_state(self):
         """
-        Function to save a document.
+        Changes the state of this light only.
         """
-        if self.state == "Editing":
-            self.state = "Saved"
-            return "Document saved successfully"
-
-        return "Invalid operation in current state"
+        self.fleet.fire_one(self.index, "change_state")
 
-    def edit_document(self):
+    def get_current_state(self):
         """
-        Function to edit a document.
+        Provides the current state of this light.
         """
-        if self.state == "Saved":
-            self.state = "Editing"
-            return "Editing resumed"
+        return self.fleet.state(self.index)
 
-        return "Invalid operation in current state"
 
+# 24
+_USER_AUTHENTICATION = StateTable(("Logged Out", "Logged In"), "Logged Out")
 
-# 26
-class ElevatorSystem:
+
+class UserAuthentication(StateMachine):
     """
-    An elevator system with states "Idle," "Moving Up," and "Moving Down."
+    A user authentication system with states "Logged Out" and "Logged In."
     """
 
-    def __init__(self):
-        """
-        Defines the elevator initial state.
-        """
-        self.state = "Idle"
+    __slots__ = ()
+    TABLE = _USER_AUTHENTICATION
 
-    def move_up(self):
-        """
-        Function to move up the elevator.
-        """
-        if self.state == "Idle":
-            self.state = "Moving Up"
-            return "Elevator moving up"
+    login = _USER_AUTHENTICATION.event(
+        "login",
+        {"Logged Out": "Logged In"},
+        "Login successful",
+        _INVALID_OPERATION,
+        doc="Function to login a user.",
+    )
+    logout = _USER_AUTHENTICATION.event(
+        "logout",
+        {"Logged In": "Logged Out"},
+        "Logout successful",
+        _INVALID_OPERATION,
+        doc="Function to logout a user.",
+    )
 
-        return "Invalid operation in current state"
 
-    def move_down(self):
-        """
-        Function to move down the elevator.
-        """
-        if self.state == "Idle":
-            self.state = "Moving Down"
-            return "Elevator moving down"
+# 25
+_DOCUMENT_EDITING = StateTable(("Editing", "Saved"), "Editing")
 
-        return "Invalid operation in current state"
 
-    def stop(self):
-        """
-        Function to stop the elevator.
-        """
-        if self.state in ["Moving Up", "Moving Down"]:
-            self.state = "Idle"
-            return "Elevator stopped"
+class DocumentEditingSystem(StateMachine):
+    """
+    A document editing system with states "Editing" and "Saved."
+    """
+
+    __slots__ = ()
+    TABLE = _DOCUMENT_EDITING
+
+    save_document = _DOCUMENT_EDITING.event(
+        "save_document",
+        {"Editing": "Saved"},
+        "Document saved successfully",
+        _INVALID_OPERATION,
+        doc="Function to save a document.",
+    )
+    edit_document = _DOCUMENT_EDITING.event(
+        "edit_document",
+        {"Saved": "Editing"},
+        "Editing resumed",
+        _INVALID_OPERATION,
+        doc="Function to edit a document.",
+    )
+
+
+# 26
+_ELEVATOR = StateTable(("Idle", "Moving Up", "Moving Down"), "Idle")
 
-        return "Invalid operation in current state"
+
+class ElevatorSystem(StateMachine):
+    """
+    An elevator system with states "Idle," "Moving Up," and "Moving Down."
+    """
+
+    __slots__ = ()
+    TABLE = _ELEVATOR
+
+    move_up = _ELEVATOR.event(
+        "move_up",
+        {"Idle": "Moving Up"},
+        "Elevator moving up",
+        _INVALID_OPERATION,
+        doc="Function to move up the elevator.",
+    )
+    move_down = _ELEVATOR.event(
+        "move_down",
+        {"Idle": "Moving Down"},
+        "Elevator moving down",
+        _INVALID_OPERATION,
+        doc="Function to move down the elevator.",
+    )
+    stop = _ELEVATOR.event(
+        "stop",
+        {"Moving Up": "Idle", "Moving Down": "Idle"},
+        "Elevator stopped",
+        _INVALID_OPERATION,
+        doc="Function to stop the elevator.",
+    )
 
 
 # 27
@@ -546,6 +781,8 @@ class BankAccount:  # pylint: disable=too-few-public-methods
     Bank account class.
     """
 
+    __slots__ = ("account_number", "balance")
+
     def __init__(self, account_number, balance):
         """
         Set the bank account details.
@@ -561,64 +798,194 @@ class BankAccount:  # pylint: disable=too-few-public-methods
 
 
 # 28
+TransferResult = namedtuple("TransferResult", ["status", "fee", "reason"])
+TransferResult.__doc__ = """
+Outcome of a money transfer: `status` is True when the transfer went
+through, `fee` is the fee charged (None if it was never computed) and
+`reason` is one of the TRANSFER_* codes.
+"""
+
+TRANSFER_OK = "ok"
+TRANSFER_NOT_AUTHENTICATED = "not_authenticated"
+TRANSFER_INVALID_TYPE = "invalid_type"
+TRANSFER_INVALID_AMOUNT = "invalid_amount"
+TRANSFER_INSUFFICIENT_FUNDS = "insufficient_funds"
+
+_TRANSFER_FEE_RATES = {"regular": 0.02, "express": 0.05, "scheduled": 0.01}
+_TRANSFER_FEE_BASIS_POINTS = {"regular": 200, "express": 500, "scheduled": 100}
+
+# Balance of sender accounts opened implicitly by their first transfer;
+# receivers opened by a transfer start empty.
+DEFAULT_OPENING_BALANCE = 1000
+FEE_ACCOUNT = "fees"
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=None)
+def _mock_credentials():
+    """
+    Credential store of the mock users, hashed once per process.
+    """
+    return CredentialStore({"user123": "pass123"}, cache=VerifiedCredentialCache())
+
+
 class BankingSystem:
     """
     Banking system class.
+    Users are checked against `credentials`, a CredentialStore.
+    Balances live in an in-memory ledger of BankAccount objects; transfers
+    debit the sender and credit the receiver and the fee account.
+    By default every outcome is printed. In quiet mode messages go to `sink`
+    (any callable taking the message) or, without a sink, to this module's
+    logger, and are only formatted when someone is listening.
+    The money mode is fixed when the system is created; in the "cents" mode
+    amounts, fees and balances are integer cents.
     """
 
-    def __init__(self):
+    def __init__(self, quiet=False, sink=None, credentials=None, money=None):
         """
         Mock users.
         """
-        self.users = {"user123": "pass123"}  # Simplified user database
+        self.money = resolve_money_mode(money)
+        if credentials is None:
+            credentials = _mock_credentials().copy()
+        self.credentials = credentials  # Hashed user database
         self.logged_in_users = set()
+        self.quiet = quiet
+        self.sink = sink
+        self.accounts = {}
+        self.open_account(FEE_ACCOUNT, 0)
+
+    def open_account(self, account_number, balance):
+        """
+        Adds an account to the ledger and returns it.
+        """
+        account = BankAccount(account_number, balance)
+        self.accounts[account_number] = account
+        return account
+
+    def get_account(self, account_number, opening_balance=None):
+        """
+        Returns the ledger account, opening it if it does not exist yet with
+        `opening_balance`, DEFAULT_OPENING_BALANCE by default.
+        """
+        account = self.accounts.get(account_number)
+        if account is None:
+            if opening_balance is None:
+                opening_balance = DEFAULT_OPENING_BALANCE
+                if self.money == MONEY_CENTS:
+                    opening_balance *= 100
+            account = self.open_account(account_number, opening_balance)
+        return account
+
+    def _emit(self, message, *args):
+        """
+        Sends a %-style message to stdout, the sink or the logger.
+        In the "cents" mode integer arguments are amounts of cents, shown as
+        dollars; they are only converted when someone is listening.
+        """
+        if self.quiet and self.sink is None and not logger.isEnabledFor(logging.INFO):
+            return
+        if self.money == MONEY_CENTS:
+            args = tuple(
+                format_cents(arg) if isinstance(arg, int) else arg for arg in args
+            )
+        if not self.quiet:
+            print(message % args)
+        elif self.sink is not None:
+            self.sink(message % args)
+        else:
+            logger.info(message, *args)
 
     def authenticate(self, username, password):
         """
         User authentication function.
         """
-        if username in self.users and self.users[username] == password:
-            if username not in self.logged_in_users:
-                self.logged_in_users.add(username)
-                print(f"User {username} authenticated successfully.")
+        if self.credentials.verify(username, password):
+            if self._log_in(username):
+                self._emit("User %s authenticated successfully.", username)
                 return True
 
-            print("User already logged in.")
+            self._emit("User already logged in.")
         else:
-            print("Authentication failed.")
+            self._emit("Authentication failed.")
 
         return False
 
-    def transfer_money(self, sender, receiver, amount, transaction_type):
+    def _log_in(self, username):
         """
-        Function to perform a money transfer.
+        Marks a verified user as logged in; False if they already were.
         """
-        if sender not in self.logged_in_users:
-            print("Sender not authenticated.")
+        if username in self.logged_in_users:
             return False
+        self.logged_in_users.add(username)
+        return True
+
+    def transfer(self, sender, receiver, amount, transaction_type):
+        """
+        Performs a money transfer and returns a TransferResult.
+        """
+        if sender not in self.logged_in_users:
+            self._emit("Sender not authenticated.")
+            return TransferResult(False, None, TRANSFER_NOT_AUTHENTICATED)
+
+        cents = self.money == MONEY_CENTS
+        if (cents and not isinstance(amount, int)) or not amount > 0:
+            self._emit("Invalid transfer amount.")
+            return TransferResult(False, None, TRANSFER_INVALID_AMOUNT)
 
         # Simulate transaction processing logic
-        if transaction_type == "regular":
-            fee = 0.02 * amount
-        elif transaction_type == "express":
-            fee = 0.05 * amount
-        elif transaction_type == "scheduled":
-            fee = 0.01 * amount
-        else:
-            print("Invalid transaction type.")
-            return False
+        rates = _TRANSFER_FEE_BASIS_POINTS if cents else _TRANSFER_FEE_RATES
+        rate = rates.get(transaction_type)
+        if rate is None:
+            self._emit("Invalid transaction type.")
+            return TransferResult(False, None, TRANSFER_INVALID_TYPE)
+        fee = apply_rate(amount, rate) if cents else rate * amount
+
+        if not self._apply_transfer(sender, receiver, amount, fee):
+            self._emit("Insufficient funds.")
+            return TransferResult(False, fee, TRANSFER_INSUFFICIENT_FUNDS)
+
+        self._emit(
+            "Money transfer of $%s (%s transfer) from %s to %s processed successfully.",
+            amount,
+            transaction_type,
+            sender,
+            receiver,
+        )
+        return TransferResult(True, fee, TRANSFER_OK)
 
-        # Simulate checking for sufficient funds
-        if BankAccount(sender, 1000).balance < (amount + fee):
-            print("Insufficient funds.")
+    def _apply_transfer(self, sender, receiver, amount, fee):
+        """
+        Moves the money between the ledger accounts.
+        Returns False, leaving every balance untouched, when the sender has
+        insufficient funds.
+        """
+        sender_account = self.get_account(sender)
+        if sender_account.balance < (amount + fee):
             return False
 
-        print(
-            f"Money transfer of ${amount} ({transaction_type} transfer)"
-            f" from {sender} to {receiver} processed successfully."
-        )
+        sender_account.balance -= amount + fee
+        self.get_account(receiver, 0).balance += amount
+        self.accounts[FEE_ACCOUNT].balance += fee
         return True
 
+    def transfer_money(self, sender, receiver, amount, transaction_type):
+        """
+        Function to perform a money transfer.
+        """
+        return self.transfer(sender, receiver, amount, transaction_type).status
+
+    def transfer_batch(self, transfers):
+        """
+        Applies many transfers, given as (sender, receiver, amount,
+        transaction_type) tuples, in order.
+        Returns one TransferResult per transfer.
+        """
+        transfer = self.transfer
+        return [transfer(*request) for request in transfers]
+
 
 # 29
 class Product:  # pylint: disable=too-few-public-methods
@@ -626,6 +993,8 @@ class Product:  # pylint: disable=too-few-public-methods
     Product class.
     """
 
+    __slots__ = ("name", "price")
+
     def __init__(self, name, price):
         """
         Set the product details.
@@ -642,55 +1011,141 @@ class Product:  # pylint: disable=too-few-public-methods
         return msg
 
 
+class ProductCatalog:
+    """
+    Product catalog stored as columns: one list of names and one array of
+    prices, instead of one Product object per record.
+    Prices are kept in an array("q") of ints while every price is an int;
+    the first non-int price converts the column to an array("d") of
+    floats, so from then on every price reads back as a float.
+    """
+
+    def __init__(self, products=()):
+        """
+        Initialize the catalog, optionally from existing products.
+        """
+        self.names = []
+        self.prices = array("q")
+        for product in products:
+            self.add_product(product.name, product.price)
+
+    def __len__(self):
+        """
+        Number of products in the catalog.
+        """
+        return len(self.names)
+
+    def __getitem__(self, index):
+        """
+        Builds a Product view of the record at `index`.
+        """
+        return Product(self.names[index], self.prices[index])
+
+    def add_product(self, name, price):
+        """
+        Function to add a product to the catalog.
+        Returns the index of the new record.
+        """
+        if self.prices.typecode == "q" and not isinstance(price, int):
+            self.prices = array("d", self.prices)
+        self.names.append(name)
+        self.prices.append(price)
+        return len(self.names) - 1
+
+    def category_codes(self):
+        """
+        Category code of every product, see categorize_products.
+        """
+        return categorize_products(self.prices)
+
+
 # 30
 class ShoppingCart:
     """
     Shopping cart class.
+    Items are indexed by product, and the cart total and item count are kept
+    up to date on every change, so carts with thousands of products stay fast.
+    Each line keeps the unit price of its product when it was last added;
+    the total, view_cart and checkout all use that price, so they agree
+    even if the product's price changes while it is in the cart.
+    In the "cents" money mode product prices are integer cents.
     """
 
-    def __init__(self):
+    def __init__(self, money=None):
         """
         Initialize the shopping cart.
         """
-        self.items = []
+        self.money = resolve_money_mode(money)
+        self._index = {}  # product -> {"product", "quantity", "price"} line
+        self.total = 0
+        self.item_count = 0
+
+    @property
+    def items(self):
+        """
+        The cart lines, in the order the products were added.
+        """
+        return list(self._index.values())
 
     def add_product(self, product, quantity=1):
         """
         Function to add a product to the shopping cart.
+        Adding a product again reprices its whole line at the current price.
         """
-        for item in self.items:
-            if item["product"] == product:
-                item["quantity"] += quantity
-                break
+        price = product.price
+        item = self._index.get(product)
+        if item is None:
+            self._index[product] = {
+                "product": product,
+                "quantity": quantity,
+                "price": price,
+            }
         else:
-            self.items.append({"product": product, "quantity": quantity})
+            if item["price"] != price:
+                self.total += (price - item["price"]) * item["quantity"]
+                item["price"] = price
+            item["quantity"] += quantity
+
+        self.total += price * quantity
+        self.item_count += quantity
 
     def remove_product(self, product, quantity=1):
         """
         Function to remove a product from the shopping cart.
         """
-        for item in self.items:
-            if item["product"] == product:
-                if item["quantity"] <= quantity:
-                    self.items.remove(item)
-                else:
-                    item["quantity"] -= quantity
-                break
+        item = self._index.get(product)
+        if item is None:
+            return
+
+        if item["quantity"] <= quantity:
+            del self._index[product]
+            quantity = item["quantity"]
+        else:
+            item["quantity"] -= quantity
+
+        self.total -= item["price"] * quantity
+        self.item_count -= quantity
+        if not self._index:
+            # Drop any rounding error left over from float prices.
+            self.total = 0
+            self.item_count = 0
 
     def view_cart(self):
         """
         Function to display the shopping cart content.
         """
-        for item in self.items:
-            print(
-                f"{item['quantity']} x {item['product'].name}"
-                f" - ${item['product'].price * item['quantity']}"
-            )
+        for item in self._index.values():
+            price = item["price"] * item["quantity"]
+            if self.money == MONEY_CENTS:
+                price = format_cents(price)
+            print(f"{item['quantity']} x {item['product'].name} - ${price}")
 
     def checkout(self):
         """
         Function to checkout the items from the shopping cart.
         """
-        total = sum(item["product"].price * item["quantity"] for item in self.items)
+        total = self.total
+        if self.money == MONEY_CENTS:
+            total = format_cents(total)
         print(f"Total: ${total}")
         print("Checkout completed. Thank you for shopping!")
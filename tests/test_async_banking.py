@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+
+"""
+asyncio banking unit tests.
+"""
+import asyncio
+import threading
+import unittest
+from unittest import mock
+
+from src.async_banking import AsyncBankingSystem
+from src.white_box import TransferResult
+
+
+class TestAsyncBankingSystem(unittest.IsolatedAsyncioTestCase):
+    """Unittest class - AsyncBankingSystem."""
+
+    def setUp(self):
+        """Setup an AsyncBankingSystem with a funded account."""
+        self.bank = AsyncBankingSystem(max_concurrency=4)
+        self.bank.banking_system.open_account("user123", 1000)
+
+    async def test_authenticate(self):
+        """Check authentication is awaitable and shares state."""
+        self.assertTrue(await self.bank.authenticate("user123", "pass123"))
+        self.assertFalse(await self.bank.authenticate("user123", "pass123"))
+        self.assertIn("user123", self.bank.banking_system.logged_in_users)
+
+    async def test_transfer(self):
+        """Check a transfer returns its TransferResult."""
+        await self.bank.authenticate("user123", "pass123")
+        result = await self.bank.transfer("user123", "user456", 100, "regular")
+        self.assertEqual(result, TransferResult(True, 2.0, "ok"))
+        self.assertEqual(self.bank.banking_system.accounts["user123"].balance, 898)
+
+    async def test_money_mode(self):
+        """Check the default banking system uses the given money mode."""
+        bank = AsyncBankingSystem(money="cents")
+        bank.banking_system.logged_in_users.add("user123")
+        result = await bank.transfer("user123", "user456", 12345, "regular")
+        self.assertEqual(result, TransferResult(True, 247, "ok"))
+
+    async def test_transfer_batch_keeps_order(self):
+        """Check batch results come back in input order."""
+        await self.bank.authenticate("user123", "pass123")
+        results = await self.bank.transfer_batch(
+            [("user123", "user456", 100, "scheduled")] * 10
+            + [("user456", "user123", 100, "scheduled")]
+        )
+        self.assertEqual(len(results), 11)
+        self.assertEqual(sum(result.status for result in results), 9)
+        self.assertEqual(results[-1].reason, "not_authenticated")
+
+    async def test_transfer_batch_async_iterable(self):
+        """Check transfers can come from an async generator."""
+        await self.bank.authenticate("user123", "pass123")
+
+        async def transfers():
+            for _ in range(3):
+                yield ("user123", "user456", 100, "express")
+
+        results = await self.bank.transfer_batch(transfers())
+        self.assertEqual([result.fee for result in results], [5.0] * 3)
+
+    async def test_transfer_batch_bounded_concurrency(self):
+        """Check no more than max_concurrency transfers run at once."""
+        in_flight = 0
+        peak = 0
+        transfer = self.bank.transfer
+
+        async def slow_transfer(*args):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+            return await transfer(*args)
+
+        with mock.patch.object(self.bank, "transfer", slow_transfer):
+            await self.bank.transfer_batch(
+                [("user123", "user456", 1, "regular")] * 20, max_concurrency=3
+            )
+        self.assertEqual(peak, 3)
+
+    async def test_calls_run_off_the_event_loop(self):
+        """Check banking calls run in the executor, not on the loop thread."""
+        threads = []
+        authenticate = self.bank.banking_system.authenticate
+
+        def record_thread(*args):
+            threads.append(threading.get_ident())
+            return authenticate(*args)
+
+        with mock.patch.object(self.bank.banking_system, "authenticate", record_thread):
+            await self.bank.authenticate("user123", "pass123")
+        self.assertNotEqual(threads, [threading.get_ident()])
@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+
+"""
+Bulk validation unit tests.
+"""
+import datetime
+import os
+import tempfile
+import unittest
+from collections import Counter
+from unittest import mock
+
+from src.bulk_validation import (
+    EmailFileResults,
+    parse_urls,
+    validate_dates,
+    validate_email_file,
+    validate_emails,
+    validate_urls,
+)
+from src.white_box import validate_date, validate_email, validate_url
+
+EMAILS = [
+    "test@example.com",
+    "t@e.",
+    "testexample.com",
+    "test@examplecom",
+    "test@.com",
+    "",
+    "ñandú@example.com",
+    "a" * 45 + "@b.com",
+]
+
+
+def run_inline(function, *args):
+    """Runs a submitted call right away, returning a future-like mock."""
+    return mock.Mock(result=mock.Mock(return_value=function(*args)))
+
+
+class TestValidateEmails(unittest.TestCase):
+    """Unittest class - validate_emails."""
+
+    def test_matches_validate_email(self):
+        """Check the results match validate_email in order."""
+        self.assertEqual(
+            list(validate_emails(EMAILS)), [validate_email(e) for e in EMAILS]
+        )
+
+    def test_is_lazy(self):
+        """Check addresses are validated as the results are consumed."""
+        results = validate_emails(iter(EMAILS))
+        self.assertEqual(next(results), "Valid Email")
+
+    def test_cache_reuses_results(self):
+        """Check duplicates are answered from the LRU cache."""
+        with mock.patch(
+            "src.bulk_validation.validate_email", wraps=validate_email
+        ) as spy:
+            results = list(validate_emails(EMAILS * 3, cache_size=16))
+        self.assertEqual(results, [validate_email(e) for e in EMAILS * 3])
+        self.assertEqual(spy.call_count, len(EMAILS))
+
+    def test_cache_is_bounded(self):
+        """Check the cache evicts old addresses once full."""
+        with mock.patch(
+            "src.bulk_validation.validate_email", wraps=validate_email
+        ) as spy:
+            list(validate_emails(EMAILS * 2, cache_size=2))
+        self.assertEqual(spy.call_count, 2 * len(EMAILS))
+
+
+class TestValidateEmailFile(unittest.TestCase):
+    """Unittest class - validate_email_file."""
+
+    def setUp(self):
+        """Write a file of addresses with Windows and Unix line endings."""
+        self.emails = EMAILS * 25
+        with tempfile.NamedTemporaryFile(
+            "w", suffix=".txt", delete=False, encoding="utf-8", newline=""
+        ) as emails_file:
+            for index, email in enumerate(self.emails):
+                emails_file.write(email + ("\r\n" if index % 2 else "\n"))
+        self.path = emails_file.name
+        self.addCleanup(os.remove, self.path)
+        self.expected = list(map(validate_email, self.emails))
+
+    def test_single_worker(self):
+        """Check one worker validates every line in order."""
+        results = validate_email_file(self.path, workers=1)
+        self.assertIsInstance(results, EmailFileResults)
+        self.assertEqual(list(results), self.expected)
+
+    def test_shards_cover_every_line_once(self):
+        """Check uneven byte shards neither drop nor repeat lines."""
+        with mock.patch("src.bulk_validation.ProcessPoolExecutor") as executor:
+            executor.return_value.__enter__.return_value.submit.side_effect = run_inline
+            for workers in (2, 3, 7, 64):
+                with self.subTest(workers=workers):
+                    results = validate_email_file(
+                        self.path, workers=workers, cache_size=8
+                    )
+                    self.assertEqual(list(results), self.expected)
+
+    def test_process_pool(self):
+        """Check shards are validated in worker processes."""
+        results = validate_email_file(self.path, workers=2)
+        self.assertIsInstance(results.flags, bytearray)
+        self.assertEqual(list(results), self.expected)
+
+    def test_invalid_line_numbers(self):
+        """Check the invalid lines can be located from the results."""
+        results = validate_email_file(self.path, workers=3)
+        self.assertEqual(
+            results.invalid_lines(),
+            [
+                number
+                for number, email in enumerate(self.emails, 1)
+                if validate_email(email) != "Valid Email"
+            ],
+        )
+        self.assertEqual(results[1:3], ["Invalid Email", "Invalid Email"])
+        self.assertEqual(results[-1], self.expected[-1])
+        self.assertEqual(Counter(results), Counter(self.expected))
+
+    def test_empty_file(self):
+        """Check an empty file gives no results."""
+        with open(self.path, "w", encoding="utf-8"):
+            pass
+        self.assertEqual(len(validate_email_file(self.path, workers=2)), 0)
+
+
+URLS = [
+    "http://example.com",
+    "https://Example.com:8443/path?q=1",
+    "https://user@host.example/",
+    "example.com",
+    "www://example.com",
+    "http://" + "a" * 244 + ".com",
+    "https://" + "a" * 250 + ".com",
+    "https://[::1",
+    "",
+]
+
+
+class TestValidateUrls(unittest.TestCase):
+    """Unittest class - validate_urls and parse_urls."""
+
+    def test_matches_validate_url(self):
+        """Check the results match validate_url in order."""
+        self.assertEqual(list(validate_urls(URLS)), [validate_url(u) for u in URLS])
+
+    def test_is_lazy(self):
+        """Check URLs are validated as the results are consumed."""
+        self.assertEqual(next(validate_urls(iter(URLS))), "Valid URL")
+
+    def test_parse_urls(self):
+        """Check valid URLs are split into scheme and host columns."""
+        columns = parse_urls(URLS)
+        self.assertEqual(
+            columns["valid"], [validate_url(u) == "Valid URL" for u in URLS]
+        )
+        self.assertEqual(
+            columns["scheme"],
+            ["http", "https", "https", None, None, "http", None, "https", None],
+        )
+        self.assertEqual(
+            columns["host"],
+            [
+                "example.com",
+                "example.com",
+                "host.example",
+                None,
+                None,
+                "a" * 244 + ".com",
+                None,
+                None,
+                None,
+            ],
+        )
+
+
+class TestValidateDates(unittest.TestCase):
+    """Unittest class - validate_dates."""
+
+    def test_matches_datetime(self):
+        """Check every day of the supported range against datetime.date."""
+        years, months, days = [], [], []
+        for year in (1899, 1900, 1904, 2000, 2023, 2024, 2100, 2101):
+            for month in range(0, 14):
+                for day in range(0, 33):
+                    years.append(year)
+                    months.append(month)
+                    days.append(day)
+
+        def reference(year, month, day):
+            if not 1900 <= year <= 2100:
+                return False
+            try:
+                datetime.date(year, month, day)
+            except ValueError:
+                return False
+            return True
+
+        self.assertEqual(
+            validate_dates(years, months, days),
+            list(map(reference, years, months, days)),
+        )
+
+    def test_matches_validate_date(self):
+        """Check the mask matches validate_date."""
+        dates = [(2022, 1, 1), (2023, 2, 29), (1899, 5, 15), (2000, 4, 31)]
+        self.assertEqual(
+            validate_dates(*zip(*dates)),
+            [validate_date(*date) == "Valid Date" for date in dates],
+        )
+
+    def test_empty(self):
+        """Check empty columns give an empty mask."""
+        self.assertEqual(validate_dates([], [], []), [])
@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+
+"""
+Batch credit card validation unit tests.
+"""
+import os
+import tempfile
+import unittest
+
+from src.card_batch import (
+    DEFAULT_BIN_TABLE,
+    BinTable,
+    bitmap_get,
+    luhn_valid,
+    validate_card,
+    validate_card_buffer,
+    validate_card_file,
+    validate_cards,
+)
+from src.white_box import validate_credit_card
+
+VISA = b"4111111111111111"
+MASTERCARD = b"5555555555554444"
+AMEX = b"378282246310005"
+VISA_13 = b"4222222222222"
+UNKNOWN_BIN = b"9999999999999995"
+
+
+class TestLuhn(unittest.TestCase):
+    """Unittest class - luhn_valid."""
+
+    def test_valid_numbers(self):
+        """Check well-known test card numbers pass."""
+        for card in (VISA, MASTERCARD, AMEX, VISA_13, UNKNOWN_BIN, b"0"):
+            with self.subTest(card=card):
+                self.assertTrue(luhn_valid(card))
+
+    def test_invalid_numbers(self):
+        """Check a changed digit fails the checksum."""
+        self.assertFalse(luhn_valid(b"4111111111111112"))
+        self.assertFalse(luhn_valid(b"1234567890123"))
+
+    def test_matches_reference_implementation(self):
+        """Check the table-driven sum matches a digit-by-digit Luhn."""
+
+        def reference(card):
+            total = 0
+            for index, digit in enumerate(reversed(card.decode())):
+                value = int(digit) * (2 if index % 2 else 1)
+                total += value - 9 if value > 9 else value
+            return total % 10 == 0
+
+        for number in range(10**12, 10**12 + 200):
+            card = str(number).encode()
+            self.assertEqual(luhn_valid(card), reference(card))
+
+
+class TestBinTable(unittest.TestCase):
+    """Unittest class - BinTable."""
+
+    def test_default_brands(self):
+        """Check the default table finds the major brands."""
+        self.assertEqual(DEFAULT_BIN_TABLE.lookup(VISA), "Visa")
+        self.assertEqual(DEFAULT_BIN_TABLE.lookup(MASTERCARD), "Mastercard")
+        self.assertEqual(DEFAULT_BIN_TABLE.lookup(b"2221000000000009"), "Mastercard")
+        self.assertEqual(DEFAULT_BIN_TABLE.lookup(b"2720990000000000"), "Mastercard")
+        self.assertEqual(DEFAULT_BIN_TABLE.lookup(AMEX), "American Express")
+        self.assertIsNone(DEFAULT_BIN_TABLE.lookup(b"2721000000000000"))
+        self.assertIsNone(DEFAULT_BIN_TABLE.lookup(UNKNOWN_BIN))
+        self.assertIsNone(DEFAULT_BIN_TABLE.lookup(b"1000000000000000"))
+
+    def test_overlapping_ranges(self):
+        """Check overlapping ranges are rejected."""
+        with self.assertRaises(ValueError):
+            BinTable([("4", "4", "Visa"), ("45", "46", "Other")])
+
+
+class TestValidateCards(unittest.TestCase):
+    """Unittest class - validate_card and validate_cards."""
+
+    def test_validate_card(self):
+        """Check length, digits, Luhn and BIN are all required."""
+        self.assertTrue(validate_card(VISA))
+        self.assertTrue(validate_card(VISA.decode()))
+        self.assertTrue(validate_card(UNKNOWN_BIN))
+        self.assertFalse(validate_card(UNKNOWN_BIN, DEFAULT_BIN_TABLE))
+        self.assertFalse(validate_card(b"4111111111111112"))
+        self.assertFalse(validate_card(b"411111111111"))
+        self.assertFalse(validate_card(b"41111111111111111"))
+        self.assertFalse(validate_card(b" 411111111111111"))
+        self.assertFalse(validate_card("４１１１１１１１１１１１１１１１"))
+
+    def test_validate_cards_matches_validate_card(self):
+        """Check batch results match the scalar check."""
+        cards = [VISA, MASTERCARD.decode(), AMEX, b"4111111111111112", b"", b"abc"]
+        for bin_table in (None, DEFAULT_BIN_TABLE):
+            with self.subTest(bin_table=bin_table):
+                self.assertEqual(
+                    validate_cards(cards, bin_table),
+                    [validate_card(card, bin_table) for card in cards],
+                )
+
+    def test_validate_card_buffer(self):
+        """Check a newline-separated buffer is validated line by line."""
+        buffer = bytearray(b"\n".join([VISA, UNKNOWN_BIN, b"123", AMEX]) + b"\r\n")
+        self.assertEqual(
+            validate_card_buffer(buffer, DEFAULT_BIN_TABLE), [True, False, False, True]
+        )
+
+
+class TestValidateCardFile(unittest.TestCase):
+    """Unittest class - validate_card_file."""
+
+    RECORDS = [
+        VISA,
+        AMEX,
+        VISA_13,
+        MASTERCARD,
+        b"4111111111111112",  # bad checksum
+        b"411111111111",  # too short
+        b"41111111111111111",  # too long
+        b"4111 1111111111111",  # inner space
+        b" 411111111111111",  # leading space
+        b"411111111111111A",  # letter
+        b"",
+        b"0000000000000",
+        b"1234567890123",  # bad checksum, valid without Luhn
+    ]
+
+    def write_file(self, records, field_width, terminator=b"\n"):
+        """Writes space-padded fixed-width records to a temporary file."""
+        with tempfile.NamedTemporaryFile(delete=False) as cards_file:
+            cards_file.write(
+                terminator.join(record.ljust(field_width) for record in records)
+            )
+        self.addCleanup(os.remove, cards_file.name)
+        return cards_file.name
+
+    def expected(self, records, luhn=True):
+        """Reference results from the scalar validation."""
+        return [
+            (
+                validate_card(record)
+                if luhn
+                else validate_credit_card(record.decode()) == "Valid Card"
+            )
+            for record in records
+        ]
+
+    def bits(self, bitmap, rows):
+        """Unpacks a bitmap into booleans."""
+        return [bitmap_get(bitmap, row) for row in range(rows)]
+
+    def test_matches_scalar_validation(self):
+        """Check the bitmap matches the scalar checks row by row."""
+        path = self.write_file(self.RECORDS, 19)
+        for luhn in (True, False):
+            with self.subTest(luhn=luhn):
+                bitmap, rows = validate_card_file(path, field_width=19, luhn=luhn)
+                self.assertEqual(rows, len(self.RECORDS))
+                self.assertEqual(len(bitmap), 2)
+                self.assertEqual(
+                    self.bits(bitmap, rows), self.expected(self.RECORDS, luhn)
+                )
+
+    def test_chunks_and_terminators(self):
+        """Check small chunks, CRLF records and a missing last terminator."""
+        records = [
+            str(number).encode() for number in range(4000000000000, 4000000000300)
+        ]
+        path = self.write_file(records, 16, b"\r\n")
+        bitmap, rows = validate_card_file(
+            path, field_width=16, record_width=18, chunk_records=7
+        )
+        self.assertEqual(rows, len(records))
+        self.assertEqual(self.bits(bitmap, rows), self.expected(records))
+        self.assertEqual(sum(self.expected(records)), 30)
+
+    def test_empty_file(self):
+        """Check an empty file has no rows."""
+        self.assertEqual(validate_card_file(self.write_file([], 16)), (bytearray(), 0))
+
+    def test_invalid_field_width(self):
+        """Check field widths that could overflow the column sums are rejected."""
+        path = self.write_file([VISA], 16)
+        with self.assertRaises(ValueError):
+            validate_card_file(path, field_width=29, record_width=30)
+        with self.assertRaises(ValueError):
+            validate_card_file(path, field_width=16, record_width=8)
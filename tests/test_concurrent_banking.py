@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+
+"""
+Concurrent banking unit tests.
+"""
+import random
+import threading
+import unittest
+from unittest import mock
+
+from src.concurrent_banking import ConcurrentBankingSystem
+
+
+class TestConcurrentBankingSystem(unittest.TestCase):
+    """Unittest class - ConcurrentBankingSystem."""
+
+    def setUp(self):
+        """Setup a quiet system where every account is logged in."""
+        self.banking_system = ConcurrentBankingSystem(quiet=True)
+        self.accounts = [f"user{i}" for i in range(8)]
+        for account in self.accounts:
+            self.banking_system.open_account(account, 10000)
+        self.banking_system.logged_in_users.update(self.accounts)
+
+    def total_money(self):
+        """Sum of every ledger balance."""
+        return sum(account.balance for account in self.banking_system.accounts.values())
+
+    def run_threads(self, target, count=8):
+        """Runs `target(index)` on `count` threads and waits for them."""
+        threads = [threading.Thread(target=target, args=(i,)) for i in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    def test_concurrent_transfers_conserve_money(self):
+        """Check concurrent transfers neither create nor destroy money."""
+        before = self.total_money()
+
+        def worker(seed):
+            rng = random.Random(seed)
+            for _ in range(500):
+                sender, receiver = rng.sample(self.accounts, 2)
+                self.banking_system.transfer(
+                    sender, receiver, 100 * rng.randint(1, 5), "scheduled"
+                )
+
+        self.run_threads(worker)
+        self.assertEqual(self.total_money(), before)
+        for account in self.banking_system.accounts.values():
+            self.assertGreaterEqual(account.balance, 0)
+
+    def test_opposite_transfers_do_not_deadlock(self):
+        """Check transfers in opposite directions between two accounts finish."""
+
+        def worker(index):
+            sender, receiver = self.accounts[index % 2], self.accounts[1 - index % 2]
+            for _ in range(500):
+                self.banking_system.transfer(sender, receiver, 100, "regular")
+
+        self.run_threads(worker, count=4)
+        self.assertEqual(self.total_money(), 8 * 10000)
+
+    def test_no_overdraft_under_contention(self):
+        """Check concurrent withdrawals never overdraw the sender."""
+        self.banking_system.open_account("user0", 1000)
+        results = []
+
+        def worker(_):
+            results.append(
+                self.banking_system.transfer("user0", "user1", 100, "scheduled")
+            )
+
+        self.run_threads(worker, count=20)
+        self.assertEqual(sum(result.status for result in results), 9)
+        self.assertEqual(self.banking_system.accounts["user0"].balance, 91)
+
+    def test_concurrent_authentication_logs_in_once(self):
+        """Check only one of many concurrent logins of a user succeeds."""
+        results = []
+        self.run_threads(
+            lambda _: results.append(
+                self.banking_system.authenticate("user123", "pass123")
+            )
+        )
+        self.assertEqual(results.count(True), 1)
+
+    def test_authentication_checks_password_outside_lock(self):
+        """Check the password check and messages do not hold the users lock."""
+        # pylint: disable=protected-access
+        held = []
+        banking_system = ConcurrentBankingSystem(
+            quiet=True,
+            sink=lambda message: held.append(banking_system._users_lock.locked()),
+        )
+        verify = banking_system.credentials.verify
+
+        def checked_verify(username, password):
+            held.append(banking_system._users_lock.locked())
+            return verify(username, password)
+
+        with mock.patch.object(
+            banking_system.credentials, "verify", side_effect=checked_verify
+        ):
+            self.assertTrue(banking_system.authenticate("user123", "pass123"))
+            self.assertFalse(banking_system.authenticate("user123", "pass123"))
+        self.assertEqual(held, [False] * 4)
+
+    def test_money_mode(self):
+        """Check the money mode is passed through to the ledger."""
+        banking_system = ConcurrentBankingSystem(quiet=True, money="cents")
+        self.assertEqual(banking_system.money, "cents")
+        banking_system.logged_in_users.add("user123")
+        banking_system.transfer("user123", "user456", 12345, "regular")
+        self.assertEqual(banking_system.accounts["user123"].balance, 100000 - 12592)
+
+    def test_accounts_opened_on_first_transfer(self):
+        """Check accounts opened implicitly by concurrent transfers get locks."""
+        self.run_threads(
+            lambda index: self.banking_system.transfer(
+                self.accounts[index], "new_account", 100, "scheduled"
+            )
+        )
+        self.assertEqual(self.banking_system.accounts["new_account"].balance, 800)
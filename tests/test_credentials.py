@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+
+"""
+Credential storage unit tests.
+"""
+import threading
+import unittest
+from unittest import mock
+
+from src.credentials import CredentialStore, VerifiedCredentialCache
+
+
+class FakeClock:  # pylint: disable=too-few-public-methods
+    """Manually advanced clock."""
+
+    def __init__(self):
+        """Start at time zero."""
+        self.now = 0
+
+    def __call__(self):
+        """Current time."""
+        return self.now
+
+
+class TestCredentialStore(unittest.TestCase):
+    """Unittest class - CredentialStore."""
+
+    def setUp(self):
+        """Setup a store with one user and cheap hashing."""
+        self.store = CredentialStore({"user123": "pass123"}, iterations=1)
+
+    def test_verify_success(self):
+        """Check the right password is accepted."""
+        self.assertTrue(self.store.verify("user123", "pass123"))
+
+    def test_verify_wrong_password(self):
+        """Check a wrong password is rejected."""
+        self.assertFalse(self.store.verify("user123", "pass124"))
+
+    def test_verify_unknown_user_still_hashes(self):
+        """Check unknown users are rejected after the same hashing work."""
+        with mock.patch.object(self.store, "_hash", return_value=b"") as fake_hash:
+            self.assertFalse(self.store.verify("nobody", "pass123"))
+            fake_hash.assert_called_once()
+
+    def test_passwords_not_stored_in_plain_text(self):
+        """Check only salted digests are kept."""
+        other = CredentialStore({"user123": "pass123"}, iterations=1)
+        # pylint: disable=protected-access
+        salt, digest = self.store._records["user123"]
+        self.assertNotIn(b"pass123", salt + digest)
+        self.assertNotEqual(other._records["user123"], (salt, digest))
+
+    def test_add_user_changes_password(self):
+        """Check add_user replaces an existing password."""
+        self.store.add_user("user123", "new_pass")
+        self.assertIn("user123", self.store)
+        self.assertFalse(self.store.verify("user123", "pass123"))
+        self.assertTrue(self.store.verify("user123", "new_pass"))
+
+    def test_copy_is_independent(self):
+        """Check a copy shares users but not later changes."""
+        copy = self.store.copy()
+        copy.add_user("user456", "pass456")
+        self.assertTrue(copy.verify("user123", "pass123"))
+        self.assertNotIn("user456", self.store)
+
+
+class TestCredentialStoreCache(unittest.TestCase):
+    """Unittest class - CredentialStore with a VerifiedCredentialCache."""
+
+    def setUp(self):
+        """Setup a store whose cache uses a fake clock."""
+        self.clock = FakeClock()
+        self.cache = VerifiedCredentialCache(maxsize=2, ttl=10, clock=self.clock)
+        self.store = CredentialStore(
+            {"user1": "pass1", "user2": "pass2", "user3": "pass3"},
+            iterations=1,
+            cache=self.cache,
+        )
+
+    def hash_calls(self, username, password):
+        """Number of slow hashes needed to verify the credentials."""
+        with mock.patch.object(
+            self.store,
+            "_hash",
+            wraps=self.store._hash,  # pylint: disable=protected-access
+        ) as spy:
+            self.store.verify(username, password)
+        return spy.call_count
+
+    def test_repeated_login_skips_hash(self):
+        """Check a warm cache answers without hashing."""
+        self.assertEqual(self.hash_calls("user1", "pass1"), 1)
+        self.assertEqual(self.hash_calls("user1", "pass1"), 0)
+
+    def test_wrong_password_not_answered_by_cache(self):
+        """Check a cached user with a wrong password is still rejected."""
+        self.store.verify("user1", "pass1")
+        self.assertFalse(self.store.verify("user1", "wrong"))
+        self.assertTrue(self.store.verify("user1", "pass1"))
+
+    def test_failures_are_not_cached(self):
+        """Check failed logins are not remembered."""
+        self.store.verify("user1", "wrong")
+        self.assertEqual(len(self.cache), 0)
+
+    def test_entries_expire(self):
+        """Check entries are hashed again after their time-to-live."""
+        self.store.verify("user1", "pass1")
+        self.clock.now = 10
+        self.assertEqual(self.hash_calls("user1", "pass1"), 1)
+
+    def test_least_recently_used_evicted(self):
+        """Check the least recently used entry is evicted when full."""
+        self.store.verify("user1", "pass1")
+        self.store.verify("user2", "pass2")
+        self.store.verify("user1", "pass1")
+        self.store.verify("user3", "pass3")
+        self.assertEqual(len(self.cache), 2)
+        self.assertEqual(self.hash_calls("user1", "pass1"), 0)
+        self.assertEqual(self.hash_calls("user2", "pass2"), 1)
+
+    def test_shared_cache_expiry_across_threads(self):
+        """Check threads racing on an expired entry do not raise."""
+        errors = []
+
+        def check():
+            try:
+                for _ in range(200):
+                    self.cache.add("user1", "pass1")
+                    self.clock.now += 10
+                    self.cache.contains("user1", "pass1")
+            except KeyError as error:  # pragma: no cover - the bug being tested
+                errors.append(error)
+
+        threads = [threading.Thread(target=check) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+
+    def test_password_change_clears_cache(self):
+        """Check changing a password drops the cached entry."""
+        self.store.verify("user1", "pass1")
+        self.store.add_user("user1", "new_pass")
+        self.assertFalse(self.store.verify("user1", "pass1"))
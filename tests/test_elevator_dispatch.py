@@ -0,0 +1,191 @@
+# -*- coding: utf-8 -*-
+
+"""
+Elevator dispatch unit tests.
+"""
+import random
+import unittest
+
+from src.elevator_dispatch import (  # pylint: disable=protected-access
+    Elevator,
+    ElevatorDispatcher,
+    _tick,
+    simulate,
+)
+from src.white_box import ElevatorSystem
+
+
+class TestElevator(unittest.TestCase):
+    """Unittest class - elevator car with a LOOK scheduler."""
+
+    def test_elevator_is_elevator_system(self):
+        """Check a car starts idle and keeps the ElevatorSystem interface."""
+        elevator = Elevator(floor=3)
+        self.assertIsInstance(elevator, ElevatorSystem)
+        self.assertEqual(elevator.state, "Idle")
+        self.assertEqual(elevator.floor, 3)
+        self.assertEqual(elevator.direction, 0)
+        self.assertIsNone(elevator.next_stop())
+
+    def test_look_order(self):
+        """Check stops in the direction of travel are served first."""
+        elevator = Elevator(floor=5)
+        elevator.move_up()
+        for floor in (2, 9, 7, 4, 8):
+            elevator.add_stop(floor)
+        visited = []
+        while elevator.next_stop() is not None:
+            target = elevator.next_stop()
+            elevator.head(1 if target > elevator.floor else -1)
+            elevator.floor = target
+            self.assertTrue(elevator.arrive())
+            visited.append(target)
+        self.assertEqual(visited, [7, 8, 9, 4, 2])
+        self.assertEqual(elevator.state, "Moving Down")
+
+    def test_look_order_through_ticks(self):
+        """Check a car keeps its sweep across door stops."""
+        elevator = Elevator(floor=5)
+        elevator.head(1)
+        for floor in (6, 9, 4):
+            elevator.add_stop(floor)
+        stops = []
+        now = 0.0
+        while True:
+            next_tick = _tick(elevator, now, [], floor_time=1.0, door_time=100.0)
+            if next_tick is None:
+                break
+            if next_tick - now == 100.0:
+                stops.append(elevator.floor)
+            now = next_tick
+        self.assertEqual(stops, [6, 9, 4])
+        self.assertEqual(elevator.state, "Idle")
+        self.assertEqual(elevator.sweep, 0)
+
+    def test_stopped_car_keeps_sweep(self):
+        """Check a stopped car still prefers stops in its sweep direction."""
+        elevator = Elevator(floor=5)
+        elevator.head(-1)
+        elevator.head(0)
+        elevator.add_stop(6)
+        elevator.add_stop(3)
+        self.assertEqual(elevator.sweep, -1)
+        self.assertEqual(elevator.next_stop(), 3)
+        self.assertEqual(elevator.distance_to(7), 2 + 4)
+        elevator.add_stop(5)
+        self.assertEqual(elevator.next_stop(), 5)
+
+    def test_idle_picks_nearest_side(self):
+        """Check an idle car goes to the closest pending stop."""
+        elevator = Elevator(floor=5)
+        elevator.add_stop(9)
+        elevator.add_stop(4)
+        self.assertEqual(elevator.next_stop(), 4)
+
+    def test_stop_at_current_floor(self):
+        """Check a stop at the current floor is immediate only when idle."""
+        elevator = Elevator(floor=5)
+        elevator.add_stop(5)
+        self.assertEqual(elevator.next_stop(), 5)
+        self.assertTrue(elevator.arrive())
+        self.assertFalse(elevator.arrive())
+
+        elevator.move_up()
+        elevator.add_stop(8)
+        elevator.add_stop(5)
+        self.assertEqual(elevator.down_stops, [-5])
+
+    def test_distance_to(self):
+        """Check the distance follows the sweep before turning around."""
+        elevator = Elevator(floor=5)
+        self.assertEqual(elevator.distance_to(2), 3)
+        elevator.move_up()
+        elevator.add_stop(9)
+        self.assertEqual(elevator.distance_to(7), 2)
+        self.assertEqual(elevator.distance_to(3), 4 + 6)
+
+    def test_head(self):
+        """Check the car state follows the direction of travel."""
+        elevator = Elevator()
+        elevator.head(1)
+        self.assertEqual(elevator.state, "Moving Up")
+        elevator.head(-1)
+        self.assertEqual(elevator.state, "Moving Down")
+        elevator.head(0)
+        self.assertEqual(elevator.state, "Idle")
+
+
+class TestElevatorDispatcher(unittest.TestCase):
+    """Unittest class - elevator dispatcher."""
+
+    def test_call_goes_to_nearest_car(self):
+        """Check a call is assigned to the car that reaches it first."""
+        dispatcher = ElevatorDispatcher(elevators=2, floors=10)
+        dispatcher.elevators[1].floor = 8
+        self.assertEqual(dispatcher.call(7, 0), 1)
+        self.assertEqual(dispatcher.call(1, 5), 0)
+        self.assertEqual(dispatcher.elevators[1].pickups, {7: [(0.0, 0)]})
+
+    def test_busy_car_is_penalized(self):
+        """Check pending stops make a car less attractive."""
+        dispatcher = ElevatorDispatcher(elevators=2, floors=10, stop_penalty=5)
+        dispatcher.call(1, 2)
+        self.assertEqual(dispatcher.call(1, 3), 1)
+
+    def test_invalid_calls(self):
+        """Check calls outside the building or to the same floor fail."""
+        dispatcher = ElevatorDispatcher(elevators=1, floors=5)
+        for floor, destination in ((5, 0), (0, -1), (2, 2)):
+            with self.subTest(floor=floor, destination=destination):
+                with self.assertRaises(ValueError):
+                    dispatcher.call(floor, destination)
+        with self.assertRaises(ValueError):
+            ElevatorDispatcher(elevators=0)
+
+
+class TestSimulate(unittest.TestCase):
+    """Unittest class - discrete-event elevator simulation."""
+
+    def test_single_call(self):
+        """Check the wait and timing of one call."""
+        result = simulate([(0.0, 3, 0)], elevators=1, floors=5)
+        self.assertEqual(result.calls, 1)
+        self.assertEqual(result.average_wait, 3.0)
+        self.assertEqual(result.max_wait, 3.0)
+        # 3 floors up, doors, 3 floors down, doors.
+        self.assertEqual(result.end_time, 10.0)
+
+    def test_call_at_parked_floor(self):
+        """Check a call at the car's floor is picked up at once."""
+        result = simulate([(1.0, 0, 2)], elevators=1, floors=3, door_time=0.5)
+        self.assertEqual(result.average_wait, 0.0)
+        self.assertEqual(result.end_time, 4.0)
+
+    def test_every_call_is_served(self):
+        """Check a random stream of calls is fully served."""
+        rng = random.Random(7)
+        calls = []
+        for step in range(500):
+            floor, destination = rng.sample(range(20), 2)
+            calls.append((step * 0.5, floor, destination))
+        result = simulate(calls, elevators=4, floors=20)
+        self.assertEqual(result.calls, 500)
+        self.assertGreater(result.average_wait, 0)
+        self.assertLessEqual(result.average_wait, result.max_wait)
+        self.assertGreaterEqual(result.end_time, calls[-1][0])
+
+    def test_more_cars_wait_less(self):
+        """Check a larger bank reduces the average wait."""
+        rng = random.Random(3)
+        calls = [(step * 0.3, *rng.sample(range(15), 2)) for step in range(300)]
+        one = simulate(calls, elevators=1, floors=15)
+        four = simulate(calls, elevators=4, floors=15)
+        self.assertLess(four.average_wait, one.average_wait)
+
+    def test_no_calls(self):
+        """Check an empty stream of calls."""
+        self.assertEqual(simulate([]), (0, 0.0, 0.0, 0.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+# -*- coding: utf-8 -*-
+
+"""
+Interval classifier unit tests.
+"""
+import inspect
+import unittest
+
+from src.intervals import MAX_LADDER_BOUNDS, IntervalClassifier
+
+
+class TestIntervalClassifier(unittest.TestCase):
+    """Unittest class - interval classifier."""
+
+    def test_closed_intervals(self):
+        """Check closed intervals include both ends and gaps use the default."""
+        classify = IntervalClassifier([(1, 5, "low"), (6, 10, "high")], "none")
+        self.assertEqual(classify(1), "low")
+        self.assertEqual(classify(5), "low")
+        self.assertEqual(classify(5.5), "none")
+        self.assertEqual(classify(6), "high")
+        self.assertEqual(classify(10), "high")
+        self.assertEqual(classify(0), "none")
+        self.assertEqual(classify(11), "none")
+
+    def test_closures(self):
+        """Check each closure keyword at the interval ends."""
+        for closed, at_low, at_high in (
+            ("both", "in", "in"),
+            ("left", "in", None),
+            ("right", None, "in"),
+            ("neither", None, None),
+        ):
+            with self.subTest(closed=closed):
+                classify = IntervalClassifier([(0, 10, "in", closed)])
+                self.assertEqual(classify(0), at_low)
+                self.assertEqual(classify(10), at_high)
+                self.assertEqual(classify(5), "in")
+
+    def test_adjacent_half_open_intervals(self):
+        """Check half-open intervals can share a boundary."""
+        classify = IntervalClassifier(
+            [(None, 0, "neg", "neither"), (0, 10, "a", "left"), (10, None, "b")]
+        )
+        self.assertEqual(classify(-1e9), "neg")
+        self.assertEqual(classify(0), "a")
+        self.assertEqual(classify(9.99), "a")
+        self.assertEqual(classify(10), "b")
+        self.assertEqual(classify(1e9), "b")
+
+    def test_empty_table(self):
+        """Check an empty table always returns the default."""
+        classify = IntervalClassifier([], "x")
+        self.assertEqual(classify(3), "x")
+        self.assertEqual(classify.classify_many([1, 2]), ["x", "x"])
+
+    def test_overlapping_intervals(self):
+        """Check overlapping intervals are rejected."""
+        with self.assertRaises(ValueError):
+            IntervalClassifier([(0, 10, "a"), (5, 15, "b")])
+        with self.assertRaises(ValueError):
+            IntervalClassifier([(0, 10, "a"), (10, 15, "b")])
+        with self.assertRaises(ValueError):
+            IntervalClassifier([(None, None, "a"), (1, 2, "b")])
+
+    def test_invalid_intervals(self):
+        """Check empty intervals and unknown closures are rejected."""
+        with self.assertRaises(ValueError):
+            IntervalClassifier([(10, 0, "a")])
+        with self.assertRaises(ValueError):
+            IntervalClassifier([(0, 10, "a", "open")])
+
+    def test_classify_many(self):
+        """Check batch classification matches scalar classification."""
+        classify = IntervalClassifier(
+            [(10, 50, "A"), (51, 100, "B"), (101, 200, "C")], "D"
+        )
+        numbers = [x / 2 for x in range(-10, 450)]
+        self.assertEqual(
+            classify.classify_many(numbers), [classify(x) for x in numbers]
+        )
+        self.assertEqual(classify.classify_many(iter([50, 51])), ["A", "B"])
+
+    def test_scalar_function_matches_classifier(self):
+        """Check the ladder and bisect functions match the classifier."""
+        small = [(None, 0, "neg", "neither"), (0, 10, "a", "left"), (10, 20, "b")]
+        small += [(20, 30, "c", "neither"), (40, 50, "d", "right")]
+        large = [(step, step + 1, step, "left") for step in range(0, 40, 2)]
+        numbers = [x / 4 for x in range(-8, 220)]
+        for intervals in (small, large, []):
+            classify = IntervalClassifier(intervals, "x")
+            with self.subTest(bounds=len(classify.bounds)):
+                function = classify.scalar_function("lookup")
+                self.assertEqual(
+                    [function(x) for x in numbers], classify.classify_many(numbers)
+                )
+        self.assertLessEqual(len(IntervalClassifier(small).bounds), MAX_LADDER_BOUNDS)
+        self.assertGreater(len(IntervalClassifier(large).bounds), MAX_LADDER_BOUNDS)
+
+    def test_scalar_function_metadata(self):
+        """Check the function gets the requested name, argument and docs."""
+        function = IntervalClassifier([(1, 5, "low")]).scalar_function(
+            "grade", "score", "Grade function.", __name__
+        )
+        self.assertEqual(function.__name__, "grade")
+        self.assertEqual(function.__doc__, "Grade function.")
+        self.assertEqual(function.__module__, __name__)
+        self.assertEqual(list(inspect.signature(function).parameters), ["score"])
+        self.assertEqual(function(score=3), "low")
+        with self.assertRaises(TypeError):
+            function(3, 4)
+        with self.assertRaises(ValueError):
+            IntervalClassifier([]).scalar_function("bad name")
+        with self.assertRaises(ValueError):
+            IntervalClassifier([]).scalar_function("ok", "x):\n    pass")
+
+
+if __name__ == "__main__":
+    unittest.main()
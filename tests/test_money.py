@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+
+"""
+Money mode unit tests.
+"""
+import unittest
+
+from src.money import (
+    MONEY_CENTS,
+    MONEY_FLOAT,
+    apply_rate,
+    format_cents,
+    get_money_mode,
+    resolve_money_mode,
+    set_money_mode,
+    to_cents,
+)
+
+
+class TestMoney(unittest.TestCase):
+    """Unittest class - money helpers."""
+
+    def test_to_cents(self):
+        """Check dollars are converted to the nearest cent."""
+        self.assertEqual(to_cents(19.99), 1999)
+        self.assertEqual(to_cents(0.1 + 0.2), 30)
+        self.assertEqual(to_cents(-5), -500)
+
+    def test_format_cents(self):
+        """Check cents are formatted as dollars."""
+        self.assertEqual(format_cents(1999), "19.99")
+        self.assertEqual(format_cents(5), "0.05")
+        self.assertEqual(format_cents(-105), "-1.05")
+
+    def test_apply_rate_rounds_half_up(self):
+        """Check basis point rates round half up to whole cents."""
+        self.assertEqual(apply_rate(10000, 9500), 9500)
+        self.assertEqual(apply_rate(50, 100), 1)  # 0.5 cent
+        self.assertEqual(apply_rate(49, 100), 0)
+        self.assertEqual(apply_rate(1999 * 7, 9500), 13293)
+
+    def test_global_mode(self):
+        """Check the global mode is used when no mode is given."""
+        self.addCleanup(set_money_mode, get_money_mode())
+        self.assertEqual(resolve_money_mode(), MONEY_FLOAT)
+        set_money_mode(MONEY_CENTS)
+        self.assertEqual(resolve_money_mode(), MONEY_CENTS)
+        self.assertEqual(resolve_money_mode(MONEY_FLOAT), MONEY_FLOAT)
+
+    def test_invalid_mode(self):
+        """Check unknown modes are rejected."""
+        with self.assertRaises(ValueError):
+            set_money_mode("decimal")
+        with self.assertRaises(ValueError):
+            resolve_money_mode("decimal")
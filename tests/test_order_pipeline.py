@@ -0,0 +1,231 @@
+# -*- coding: utf-8 -*-
+
+"""
+Streaming order-file processor unit tests.
+"""
+import io
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from src.order_pipeline import (
+    main,
+    price_orders_parallel,
+    process_orders,
+    write_results,
+)
+from src.white_box import calculate_items_shipping_cost, calculate_order_total
+
+ORDERS = [
+    {
+        "order_id": 1,
+        "items": [
+            {"quantity": 3, "price": 10, "weight": 2},
+            {"quantity": 8, "price": 10, "weight": 4},
+        ],
+        "shipping_method": "express",
+    },
+    {"order_id": 2, "items": [{"quantity": 15, "price": 9.99, "weight": 12}]},
+    {"order_id": 3, "items": [], "shipping_method": "overnight"},
+    {"order_id": 4},
+]
+
+
+def jsonl(records):
+    """Serializes records as JSON Lines."""
+    return "".join(json.dumps(record) + "\n" for record in records)
+
+
+class TestOrderPipeline(unittest.TestCase):
+    """Unittest class - order_pipeline."""
+
+    def run_pipeline(self, text, **kwargs):
+        """Runs the pipeline over `text` and returns the parsed results."""
+        output = io.StringIO()
+        rows, rate = process_orders(io.StringIO(text), output, **kwargs)
+        results = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual(rows, len(results))
+        self.assertGreaterEqual(rate, 0)
+        return results
+
+    def test_results_match_scalar_functions(self):
+        """Check totals and shipping match the white-box functions."""
+        results = self.run_pipeline(jsonl(ORDERS[:2]))
+        self.assertEqual(
+            results,
+            [
+                {
+                    "order_id": order["order_id"],
+                    "total": calculate_order_total(order["items"]),
+                    "shipping": calculate_items_shipping_cost(
+                        order["items"], order.get("shipping_method", "standard")
+                    ),
+                }
+                for order in ORDERS[:2]
+            ],
+        )
+
+    def test_bad_orders_reported(self):
+        """Check orders that cannot be priced get an error."""
+        results = self.run_pipeline(jsonl(ORDERS[2:]))
+        self.assertEqual(
+            results,
+            [
+                {"order_id": 3, "error": "Invalid shipping method"},
+                {"order_id": 4, "error": "'items'"},
+            ],
+        )
+
+    def test_malformed_lines_reported(self):
+        """Check lines that are not JSON objects get an error row."""
+        text = '{"order_id": 7, "items": [\n[1, 2]\n"text"\n' + jsonl(ORDERS[:1])
+        results = self.run_pipeline(text)
+        self.assertEqual(len(results), 4)
+        self.assertIsNone(results[0]["order_id"])
+        self.assertTrue(results[0]["error"].startswith("Invalid JSON: "))
+        self.assertEqual(
+            results[1:3],
+            [{"order_id": None, "error": "Order is not a JSON object"}] * 2,
+        )
+        self.assertEqual(results[3]["order_id"], 1)
+        self.assertIn("total", results[3])
+
+    def test_main_survives_malformed_lines(self):
+        """Check the command line run completes despite malformed lines."""
+        with tempfile.TemporaryDirectory() as directory:
+            source = os.path.join(directory, "orders.jsonl")
+            target = os.path.join(directory, "results.jsonl")
+            with open(source, "w", encoding="utf-8") as orders_file:
+                orders_file.write("not json\n[1,2]\n" + jsonl(ORDERS))
+            with mock.patch("sys.stderr", new=io.StringIO()):
+                self.assertEqual(main([source, target]), 0)
+            with open(target, encoding="utf-8") as results_file:
+                self.assertEqual(len(results_file.readlines()), 6)
+
+    def test_blank_lines_skipped(self):
+        """Check blank lines are ignored."""
+        self.assertEqual(len(self.run_pipeline("\n" + jsonl(ORDERS[:1]) + "\n")), 1)
+
+    def test_default_method(self):
+        """Check orders without a method use the default one."""
+        results = self.run_pipeline(jsonl(ORDERS[1:2]), default_method="express")
+        self.assertEqual(results[0]["shipping"], 40)
+
+    def test_chunked_writes(self):
+        """Check results are written chunk_size lines at a time."""
+        output = mock.Mock()
+        count = write_results(({"n": n} for n in range(5)), output, chunk_size=2)
+        self.assertEqual(count, 5)
+        self.assertEqual(
+            [len(call.args[0]) for call in output.writelines.call_args_list],
+            [2, 2, 1],
+        )
+
+    def test_invalid_chunk_size(self):
+        """Check a chunk size below 1 is rejected."""
+        with self.assertRaises(ValueError):
+            write_results([], io.StringIO(), chunk_size=0)
+
+    def test_streams_lazily(self):
+        """Check input is consumed as output is written, not all at once."""
+        consumed = []
+
+        def lines():
+            for order in ORDERS[:2] * 3:
+                consumed.append(order["order_id"])
+                yield json.dumps(order)
+
+        output = mock.Mock()
+        output.writelines.side_effect = lambda chunk: self.assertLessEqual(
+            len(consumed), output.writelines.call_count * 2
+        )
+        process_orders(lines(), output, chunk_size=2)
+        self.assertEqual(output.writelines.call_count, 3)
+
+    def test_main(self):
+        """Check the command line entry point processes files."""
+        with tempfile.TemporaryDirectory() as directory:
+            source = os.path.join(directory, "orders.jsonl")
+            target = os.path.join(directory, "results.jsonl")
+            with open(source, "w", encoding="utf-8") as orders_file:
+                orders_file.write(jsonl(ORDERS))
+            with mock.patch("sys.stderr", new=io.StringIO()) as fake_stderr:
+                self.assertEqual(main([source, target, "--chunk-size", "3"]), 0)
+            with open(target, encoding="utf-8") as results_file:
+                self.assertEqual(len(results_file.readlines()), 4)
+        self.assertIn("4 rows processed", fake_stderr.getvalue())
+
+
+class TestPriceOrdersParallel(unittest.TestCase):
+    """Unittest class - price_orders_parallel."""
+
+    def setUp(self):
+        """Build orders with every discount tier."""
+        self.orders = [
+            [{"quantity": (n % 15) + 1, "price": n * 0.37}] * ((n % 3) + 1)
+            for n in range(50)
+        ]
+        self.expected = [calculate_order_total(items) for items in self.orders]
+
+    def test_parallel_results_in_input_order(self):
+        """Check results from worker processes come back in input order."""
+        self.assertEqual(
+            price_orders_parallel(self.orders, workers=2, chunksize=7), self.expected
+        )
+
+    def test_single_worker_runs_inline(self):
+        """Check one worker prices the orders without a process pool."""
+        with mock.patch("src.order_pipeline.ProcessPoolExecutor") as executor:
+            self.assertEqual(
+                price_orders_parallel(iter(self.orders), workers=1), self.expected
+            )
+        executor.assert_not_called()
+
+    def test_default_chunksize(self):
+        """Check the default chunk size gives each worker about four chunks."""
+        chunks = self.run_with_inline_pool(self.orders, workers=3)
+        self.assertEqual([len(offsets) - 1 for _, _, offsets in chunks], [5] * 10)
+
+    def test_chunks_are_columns(self):
+        """Check workers get quantity, price and offset columns, not dicts."""
+        orders = [[{"quantity": 1, "price": 2}, {"quantity": 3, "price": 4}], []]
+        orders.append([{"quantity": 5, "price": 6}])
+        chunks = self.run_with_inline_pool(orders, workers=2, chunksize=2)
+        self.assertEqual(chunks, [([1, 3], [2, 4], [0, 2, 2]), ([5], [6], [0, 1])])
+
+    def run_with_inline_pool(self, orders, **kwargs):
+        """
+        Runs price_orders_parallel with the pool replaced by an inline map.
+        Checks the totals and returns the column chunks sent to the workers.
+        """
+        chunks = []
+
+        def inline_map(function, *iterables):
+            for args in zip(*iterables):
+                chunks.append(args[0])
+                yield function(*args)
+
+        with mock.patch("src.order_pipeline.ProcessPoolExecutor") as executor:
+            executor.return_value.__enter__.return_value.map.side_effect = inline_map
+            totals = price_orders_parallel(orders, **kwargs)
+        self.assertEqual(totals, [calculate_order_total(items) for items in orders])
+        return chunks
+
+    def test_no_orders(self):
+        """Check an empty input gives no totals."""
+        self.assertEqual(price_orders_parallel([], workers=4), [])
+
+    def test_money_mode_reaches_workers(self):
+        """Check the money mode is sent to the workers with every order."""
+        orders = [[{"quantity": 7, "price": 1999}]] * 4
+        self.assertEqual(
+            price_orders_parallel(orders, workers=2, money="cents"), [13293] * 4
+        )
+        with mock.patch("src.order_pipeline.ProcessPoolExecutor") as executor:
+            executor.return_value.__enter__.return_value.map.return_value = []
+            with mock.patch("src.money._money_mode", "cents"):
+                price_orders_parallel(orders, workers=2)
+        modes = executor.return_value.__enter__.return_value.map.call_args.args[2]
+        self.assertEqual(next(modes), "cents")
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+
+"""
+Session manager unit tests.
+"""
+import unittest
+
+from src.sessions import SessionManager
+
+
+class FakeClock:  # pylint: disable=too-few-public-methods
+    """Clock controlled by the tests."""
+
+    def __init__(self):
+        """Start at time zero."""
+        self.now = 0.0
+
+    def __call__(self):
+        """Current time."""
+        return self.now
+
+
+class TestSessionManager(unittest.TestCase):
+    """Unittest class - session store with timer-wheel expiry."""
+
+    def setUp(self):
+        """Create a manager with a 10 second TTL."""
+        self.clock = FakeClock()
+        self.sessions = SessionManager(ttl=10, tick=1, clock=self.clock)
+
+    def test_login_logout(self):
+        """Check the UserAuthentication messages and states."""
+        self.assertEqual(self.sessions.get_state("alice"), "Logged Out")
+        self.assertEqual(self.sessions.login("alice"), "Login successful")
+        self.assertEqual(
+            self.sessions.login("alice"), "Invalid operation in current state"
+        )
+        self.assertEqual(self.sessions.get_state("alice"), "Logged In")
+        self.assertTrue(self.sessions.is_logged_in("alice"))
+        self.assertEqual(len(self.sessions), 1)
+        self.assertEqual(self.sessions.logout("alice"), "Logout successful")
+        self.assertEqual(
+            self.sessions.logout("alice"), "Invalid operation in current state"
+        )
+        self.assertFalse(self.sessions.is_logged_in("alice"))
+        self.assertEqual(len(self.sessions), 0)
+
+    def test_slots_are_reused(self):
+        """Check a freed slot is given to the next login."""
+        self.sessions.login("alice")
+        self.sessions.logout("alice")
+        self.sessions.login("bob")
+        self.assertEqual(self.sessions.slots, {"bob": 0})
+        self.assertEqual(self.sessions.users, ["bob"])
+
+    def test_expire(self):
+        """Check sessions expire once their TTL has passed."""
+        self.sessions.login("alice")
+        self.clock.now = 5
+        self.sessions.login("bob")
+        self.clock.now = 10.5
+        self.assertEqual(self.sessions.expire(), [])
+        self.clock.now = 11
+        self.assertEqual(self.sessions.expire(), ["alice"])
+        self.assertEqual(self.sessions.get_state("alice"), "Logged Out")
+        self.clock.now = 16
+        self.assertEqual(self.sessions.expire(), ["bob"])
+        self.assertEqual(len(self.sessions), 0)
+
+    def test_touch_extends_session(self):
+        """Check touching a session pushes its expiry back."""
+        self.sessions.login("alice")
+        self.clock.now = 8
+        self.assertTrue(self.sessions.touch("alice"))
+        self.assertTrue(self.sessions.touch("alice"))
+        self.assertFalse(self.sessions.touch("bob"))
+        self.clock.now = 12
+        self.assertEqual(self.sessions.expire(), [])
+        self.clock.now = 19
+        self.assertEqual(self.sessions.expire(), ["alice"])
+
+    def test_expired_session_is_logged_out_before_expire(self):
+        """Check lookups treat a session past its expiry as logged out."""
+        self.sessions.login("alice")
+        self.sessions.login("bob")
+        self.clock.now = 11
+        self.assertFalse(self.sessions.is_logged_in("alice"))
+        self.assertEqual(self.sessions.get_state("bob"), "Logged Out")
+        self.assertEqual(len(self.sessions), 0)
+        self.sessions.login("carol")
+        self.assertEqual(self.sessions.expire(), [])
+        self.assertTrue(self.sessions.is_logged_in("carol"))
+
+    def test_touch_refuses_expired_session(self):
+        """Check touch does not revive a session past its expiry."""
+        self.sessions.login("alice")
+        self.clock.now = 11
+        self.assertFalse(self.sessions.touch("alice"))
+        self.assertEqual(self.sessions.login("alice"), "Login successful")
+        self.assertEqual(self.sessions.slots, {"alice": 0})
+
+    def test_logout_before_expiry(self):
+        """Check logged out sessions are not expired again."""
+        self.sessions.login("alice")
+        self.sessions.logout("alice")
+        self.sessions.login("bob")
+        self.clock.now = 5
+        self.sessions.touch("bob")
+        self.clock.now = 11
+        self.assertEqual(self.sessions.expire(), [])
+        self.clock.now = 16
+        self.assertEqual(self.sessions.expire(), ["bob"])
+
+    def test_expire_after_long_pause(self):
+        """Check sessions expire when more than a wheel turn has passed."""
+        for index in range(5):
+            self.clock.now = index * 3
+            self.sessions.login(f"user{index}")
+        self.clock.now = 1000
+        self.assertEqual(
+            sorted(self.sessions.expire()), [f"user{index}" for index in range(5)]
+        )
+        self.assertEqual(self.sessions.expire(), [])
+
+    def test_expire_is_idempotent_within_a_tick(self):
+        """Check calling expire twice in one tick does nothing more."""
+        self.sessions.login("alice")
+        self.clock.now = 11.2
+        self.assertEqual(self.sessions.expire(), ["alice"])
+        self.clock.now = 11.7
+        self.assertEqual(self.sessions.expire(), [])
+
+    def test_wheel_buckets_are_compacted(self):
+        """Check stale wheel entries are dropped when their bucket is walked."""
+        self.sessions.login("alice")
+        for second in range(1, 30):
+            self.clock.now = second
+            self.sessions.touch("alice")
+            self.sessions.expire()
+        wheel = self.sessions._wheel  # pylint: disable=protected-access
+        self.assertLessEqual(sum(map(len, wheel)), 12)
+
+    def test_invalid_settings(self):
+        """Check the TTL and tick must be positive."""
+        with self.assertRaises(ValueError):
+            SessionManager(ttl=0)
+        with self.assertRaises(ValueError):
+            SessionManager(tick=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+
+"""
+Shipping rate table unit tests.
+"""
+import json
+import os
+import tempfile
+import unittest
+
+from src.shipping_rates import DEFAULT_RATES, ShippingRateTable
+
+
+def branching_shipping_cost(total_weight, shipping_method):
+    """The original if-chain shipping rules."""
+    if shipping_method == "standard":
+        if total_weight <= 5:
+            return 10
+        if 5 < total_weight <= 10:
+            return 15
+        return 20
+    if total_weight <= 5:
+        return 20
+    if 5 < total_weight <= 10:
+        return 30
+    return 40
+
+
+class TestShippingRateTable(unittest.TestCase):
+    """Unittest class - ShippingRateTable."""
+
+    def test_default_rates_match_branching_rules(self):
+        """Check the default table matches the original rules."""
+        weights = [-1, 0, 0.5, 4.99, 5, 5.01, 7, 9.99, 10, 10.01, 11, 1000]
+        for method in ("standard", "express"):
+            for weight in weights:
+                with self.subTest(method=method, weight=weight):
+                    self.assertEqual(
+                        DEFAULT_RATES.cost(weight, method),
+                        branching_shipping_cost(weight, method),
+                    )
+
+    def test_invalid_method(self):
+        """Check unknown shipping methods raise ValueError."""
+        with self.assertRaisesRegex(ValueError, "Invalid shipping method"):
+            DEFAULT_RATES.cost(1, "overnight")
+        with self.assertRaisesRegex(ValueError, "Invalid shipping method"):
+            DEFAULT_RATES.batch_costs([], "overnight")
+
+    def test_batch_costs(self):
+        """Check batch costs match the per-order costs."""
+        orders = [[], [{"weight": 3}, {"weight": 5}], [{"weight": 11}]]
+        self.assertEqual(
+            DEFAULT_RATES.batch_costs(orders, "express"),
+            [DEFAULT_RATES.items_cost(items, "express") for items in orders],
+        )
+
+    def test_from_file(self):
+        """Check custom carriers and tiers are loaded from a JSON file."""
+        methods = {"freight": {"breakpoints": [1, 50, 500], "rates": [5, 8, 60, 300]}}
+        with tempfile.NamedTemporaryFile(
+            "w", suffix=".json", delete=False, encoding="utf-8"
+        ) as rates_file:
+            json.dump(methods, rates_file)
+        self.addCleanup(os.remove, rates_file.name)
+
+        table = ShippingRateTable.from_file(rates_file.name)
+        self.assertEqual(
+            [table.cost(weight, "freight") for weight in (1, 2, 50, 499, 501)],
+            [5, 8, 8, 60, 300],
+        )
+
+    def test_invalid_tables(self):
+        """Check malformed tables are rejected."""
+        with self.assertRaises(ValueError):
+            ShippingRateTable({"bad": {"breakpoints": [10, 5], "rates": [1, 2, 3]}})
+        with self.assertRaises(ValueError):
+            ShippingRateTable({"bad": {"breakpoints": [5, 10], "rates": [1, 2]}})
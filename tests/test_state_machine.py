@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+
+"""
+State machine engine unit tests.
+"""
+import inspect
+import unittest
+
+from src.state_machine import (
+    INVALID_TRANSITION,
+    MAX_FLEET_STATES,
+    MachineFleet,
+    StateMachine,
+    StateTable,
+)
+
+_TURNSTILE = StateTable(("Locked", "Unlocked"), "Locked")
+
+
+class Turnstile(StateMachine):
+    """Turnstile used by the tests."""
+
+    __slots__ = ()
+    TABLE = _TURNSTILE
+
+    coin = _TURNSTILE.event("coin", {"Locked": "Unlocked"}, "Unlocked", "Refund")
+    push = _TURNSTILE.event(
+        "push", {"Unlocked": "Locked"}, "Locked", "Blocked", doc="Push the arm."
+    )
+
+
+class TestStateTable(unittest.TestCase):
+    """Unittest class - state table."""
+
+    def test_state_ids(self):
+        """Check states are numbered in order."""
+        self.assertEqual(_TURNSTILE.states, ("Locked", "Unlocked"))
+        self.assertEqual(_TURNSTILE.state_id("Unlocked"), 1)
+        self.assertEqual(_TURNSTILE.initial, 0)
+
+    def test_transition_rows(self):
+        """Check each event is compiled to a row of next state ids."""
+        self.assertEqual(_TURNSTILE.events["coin"], (1, INVALID_TRANSITION))
+        self.assertEqual(_TURNSTILE.events["push"], (INVALID_TRANSITION, 0))
+
+    def test_event_method_metadata(self):
+        """Check generated methods carry the event name and docstring."""
+        self.assertEqual(Turnstile.push.__name__, "push")
+        self.assertEqual(Turnstile.push.__doc__, "Push the arm.")
+
+    def test_event_method_takes_no_arguments(self):
+        """Check extra arguments are refused rather than used as tables."""
+        turnstile = Turnstile()
+        self.assertEqual(str(inspect.signature(Turnstile.coin)), "(machine)")
+        with self.assertRaisesRegex(TypeError, "positional argument"):
+            turnstile.coin(25)  # pylint: disable=too-many-function-args
+        self.assertEqual(turnstile.state, "Locked")
+
+    def test_invalid_tables(self):
+        """Check unknown or duplicate states and events are rejected."""
+        with self.assertRaises(ValueError):
+            StateTable(("A", "A"), "A")
+        with self.assertRaises(ValueError):
+            StateTable(("A", "B"), "C")
+        table = StateTable(("A", "B"), "A")
+        with self.assertRaises(ValueError):
+            table.event("go", {"A": "C"})
+        table.event("go", {"A": "B"})
+        with self.assertRaises(ValueError):
+            table.event("go", {"B": "A"})
+
+
+class TestStateMachine(unittest.TestCase):
+    """Unittest class - table-driven state machine."""
+
+    def test_transitions(self):
+        """Check events move between states and return their messages."""
+        turnstile = Turnstile()
+        self.assertEqual(turnstile.state, "Locked")
+        self.assertEqual(turnstile.push(), "Blocked")
+        self.assertEqual(turnstile.coin(), "Unlocked")
+        self.assertEqual(turnstile.state, "Unlocked")
+        self.assertEqual(turnstile.coin(), "Refund")
+        self.assertEqual(turnstile.push(), "Locked")
+        self.assertEqual(turnstile.state, "Locked")
+
+    def test_state_setter(self):
+        """Check the state can be set by name, and unknown names fail."""
+        turnstile = Turnstile()
+        turnstile.state = "Unlocked"
+        self.assertEqual(turnstile.state_id, 1)
+        with self.assertRaises(ValueError):
+            turnstile.state = "Open"
+
+    def test_slots(self):
+        """Check machines only store their state id."""
+        turnstile = Turnstile()
+        self.assertFalse(hasattr(turnstile, "__dict__"))
+        with self.assertRaises(AttributeError):
+            setattr(turnstile, "other", 1)
+
+    def test_replay(self):
+        """Check an event log is applied in order."""
+        turnstile = Turnstile()
+        accepted = turnstile.replay(["push", "coin", "coin", "push", "coin"])
+        self.assertEqual(accepted, 3)
+        self.assertEqual(turnstile.state, "Unlocked")
+        with self.assertRaises(KeyError):
+            turnstile.replay(["kick"])
+
+    def test_replay_matches_methods(self):
+        """Check replaying a log ends where calling the methods does."""
+        log = ["coin", "push", "push", "coin", "coin", "push", "coin"]
+        replayed, called = Turnstile(), Turnstile()
+        replayed.replay(log)
+        for event in log:
+            getattr(called, event)()
+        self.assertEqual(replayed.state, called.state)
+
+
+class TestMachineFleet(unittest.TestCase):
+    """Unittest class - fleet of table-driven state machines."""
+
+    def test_translation(self):
+        """Check an event row becomes a translate table."""
+        step = _TURNSTILE.translation("coin")
+        self.assertEqual(len(step), 256)
+        self.assertEqual(step[0], 1)
+        self.assertEqual(step[1], 1)
+        self.assertEqual(step[200], 200)
+
+    def test_fire_all(self):
+        """Check an event is fired on every machine."""
+        fleet = MachineFleet(_TURNSTILE, 4)
+        fleet.set_state(1, "Unlocked")
+        fleet.fire("coin")
+        self.assertEqual(bytes(fleet.states), bytes([1, 1, 1, 1]))
+        fleet.fire("push")
+        self.assertEqual(fleet.counts(), {"Locked": 4, "Unlocked": 0})
+
+    def test_fire_masked(self):
+        """Check only the masked machines change state."""
+        fleet = MachineFleet(_TURNSTILE, 5)
+        fleet.set_state(4, "Unlocked")
+        fleet.fire("coin", bytes([1, 0, 7, 0, 1]))
+        self.assertEqual(list(fleet.states), [1, 0, 1, 0, 1])
+        fleet.fire("push", [False, True, True, False, False])
+        self.assertEqual(list(fleet.states), [1, 0, 0, 0, 1])
+        with self.assertRaises(ValueError):
+            fleet.fire("push", [True])
+
+    def test_fire_matches_machines(self):
+        """Check masked fleet steps match stepping single machines."""
+        fleet = MachineFleet(_TURNSTILE, 50)
+        machines = [Turnstile() for _ in range(50)]
+        for step in range(1, 8):
+            mask = [index % step == 0 for index in range(50)]
+            event = "coin" if step % 2 else "push"
+            fleet.fire(event, mask)
+            for machine, selected in zip(machines, mask):
+                if selected:
+                    getattr(machine, event)()
+            self.assertEqual(
+                [fleet.state(index) for index in range(50)],
+                [machine.state for machine in machines],
+            )
+
+    def test_fire_one(self):
+        """Check a single machine can be stepped."""
+        fleet = MachineFleet(_TURNSTILE, 3)
+        fleet.fire_one(2, "coin")
+        self.assertEqual(fleet.state(2), "Unlocked")
+        self.assertEqual(fleet.state(0), "Locked")
+        self.assertEqual(len(fleet), 3)
+
+    def test_too_many_states(self):
+        """Check tables that do not fit the byte encoding are rejected."""
+        table = StateTable(range(MAX_FLEET_STATES + 1), 0)
+        with self.assertRaises(ValueError):
+            MachineFleet(table, 1)
+        self.assertEqual(len(MachineFleet(StateTable(range(128), 0), 2)), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
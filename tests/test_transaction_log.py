@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+
+"""
+Transaction log unit tests.
+"""
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from src.transaction_log import (
+    LOG_REFUND,
+    LOG_RESTOCK,
+    LOG_VEND,
+    RECORD,
+    REFUND_SLOT,
+    SlotTotals,
+    Transaction,
+    TransactionLog,
+    aggregate,
+    replay,
+)
+
+
+class TestTransactionLog(unittest.TestCase):
+    """Unittest class - append-only transaction log."""
+
+    def setUp(self):
+        """Create a temporary log path."""
+        handle, self.path = tempfile.mkstemp(suffix=".log")
+        os.close(handle)
+        self.addCleanup(os.remove, self.path)
+
+    def test_append_and_replay(self):
+        """Check records are replayed in order."""
+        with TransactionLog(self.path, clock=lambda: 5.0) as log:
+            log.append(LOG_RESTOCK, 2, 10)
+            log.append(LOG_VEND, 2, 125, 150, timestamp=6.5)
+        self.assertEqual(
+            list(replay(self.path)),
+            [
+                Transaction(5.0, LOG_RESTOCK, 2, 10, 0),
+                Transaction(6.5, LOG_VEND, 2, 125, 150),
+            ],
+        )
+
+    def test_batches(self):
+        """Check records are written and fsynced once per batch."""
+        with mock.patch("src.transaction_log.os.fsync") as fsync:
+            log = TransactionLog(self.path, batch_size=3)
+            log.append(LOG_VEND, 0, 100, 100)
+            log.append(LOG_VEND, 0, 100, 100)
+            self.assertEqual(os.path.getsize(self.path), 0)
+            log.append(LOG_VEND, 0, 100, 100)
+            self.assertEqual(os.path.getsize(self.path), 3 * RECORD.size)
+            self.assertEqual(fsync.call_count, 1)
+            log.append(LOG_VEND, 0, 100, 100)
+            log.close()
+            log.close()
+        self.assertEqual(fsync.call_count, 2)
+        self.assertEqual(os.path.getsize(self.path), 4 * RECORD.size)
+
+    def test_no_fsync(self):
+        """Check fsync can be turned off."""
+        with mock.patch("src.transaction_log.os.fsync") as fsync:
+            with TransactionLog(self.path, batch_size=1, fsync=False) as log:
+                log.append(LOG_VEND, 0, 100, 100)
+        fsync.assert_not_called()
+        self.assertEqual(len(list(replay(self.path))), 1)
+
+    def test_append_only(self):
+        """Check reopening a log appends to it."""
+        for _ in range(2):
+            with TransactionLog(self.path) as log:
+                log.append(LOG_VEND, 1, 50, 50, timestamp=1.0)
+        self.assertEqual(len(list(replay(self.path))), 2)
+
+    def test_partial_record_is_ignored(self):
+        """Check an interrupted write at the end of the log is skipped."""
+        with TransactionLog(self.path) as log:
+            log.append(LOG_VEND, 1, 50, 50, timestamp=1.0)
+        with open(self.path, "ab") as log_file:
+            log_file.write(b"\x00" * (RECORD.size - 1))
+        self.assertEqual(len(list(replay(self.path))), 1)
+
+    def test_replay_across_chunks(self):
+        """Check logs larger than one read chunk are replayed fully."""
+        with mock.patch("src.transaction_log._REPLAY_RECORDS", 4):
+            with TransactionLog(self.path, batch_size=5) as log:
+                for index in range(10):
+                    log.append(LOG_VEND, index, index, index, timestamp=0.0)
+            self.assertEqual(
+                [record.slot for record in replay(self.path)], list(range(10))
+            )
+
+    def test_aggregate(self):
+        """Check per-slot totals."""
+        with TransactionLog(self.path) as log:
+            log.append(LOG_RESTOCK, 1, 10)
+            log.append(LOG_VEND, 1, 125, 200)
+            log.append(LOG_VEND, 1, 125, 125)
+            log.append(LOG_VEND, 2, 90, 100)
+            log.append(LOG_VEND, 0, 50, 50)
+            log.append(LOG_REFUND, REFUND_SLOT, 35)
+        self.assertEqual(
+            aggregate(self.path),
+            {
+                0: SlotTotals(1, 50, 0, 0),
+                1: SlotTotals(2, 250, 0, 10),
+                2: SlotTotals(1, 90, 0, 0),
+                REFUND_SLOT: SlotTotals(0, 0, 35, 0),
+            },
+        )
+
+    def test_invalid_batch_size(self):
+        """Check the batch size must be positive."""
+        with self.assertRaises(ValueError):
+            TransactionLog(self.path, batch_size=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
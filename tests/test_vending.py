@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+
+"""
+Inventory vending machine unit tests.
+"""
+import os
+import tempfile
+import unittest
+
+from src.transaction_log import (
+    LOG_REFUND,
+    LOG_RESTOCK,
+    LOG_VEND,
+    REFUND_SLOT,
+    TransactionLog,
+    replay,
+)
+from src.vending import (
+    VEND_INSUFFICIENT_CREDIT,
+    VEND_NO_CHANGE,
+    VEND_NOT_READY,
+    VEND_OK,
+    VEND_SOLD_OUT,
+    VEND_UNKNOWN_SLOT,
+    CoinChanger,
+    InventoryVendingMachine,
+)
+from src.white_box import VendingMachine
+
+
+class TestCoinChanger(unittest.TestCase):
+    """Unittest class - coin change table."""
+
+    def test_table(self):
+        """Check the table holds the fewest coins for each amount."""
+        changer = CoinChanger((1, 3, 4), max_amount=10)
+        self.assertEqual(list(changer.table), [0, 1, 2, 1, 1, 2, 2, 2, 2, 3, 3])
+        self.assertEqual(changer.make_change(6), {3: 2})
+
+    def test_make_change(self):
+        """Check change from the table."""
+        changer = CoinChanger()
+        self.assertEqual(changer.make_change(0), {})
+        self.assertEqual(changer.make_change(140), {100: 1, 25: 1, 10: 1, 5: 1})
+        self.assertIsNone(changer.make_change(3))
+        with self.assertRaises(ValueError):
+            changer.make_change(-5)
+
+    def test_make_change_with_limited_coins(self):
+        """Check change is made from the coins available."""
+        changer = CoinChanger()
+        self.assertEqual(
+            changer.make_change(30, {5: 10, 10: 3, 25: 0, 100: 0}), {10: 3}
+        )
+        self.assertEqual(changer.make_change(30, {5: 2, 10: 2, 25: 1}), {25: 1, 5: 1})
+        self.assertIsNone(changer.make_change(30, {25: 4, 100: 1}))
+
+    def test_make_change_above_table(self):
+        """Check amounts above the table are still paid."""
+        changer = CoinChanger(max_amount=50)
+        self.assertEqual(changer.make_change(215), {100: 2, 10: 1, 5: 1})
+        self.assertEqual(changer.make_change(215, {25: 9}), None)
+        self.assertEqual(changer.make_change(200, {25: 9}), {25: 8})
+
+    def test_invalid_denominations(self):
+        """Check denominations must be positive."""
+        with self.assertRaises(ValueError):
+            CoinChanger(())
+        with self.assertRaises(ValueError):
+            CoinChanger((0, 5))
+
+
+class TestInventoryVendingMachine(unittest.TestCase):
+    """Unittest class - vending machine with inventory and coins."""
+
+    def setUp(self):
+        """Create a machine with two slots and some change."""
+        self.machine = InventoryVendingMachine()
+        self.cola = self.machine.add_slot("Cola", 125, quantity=2)
+        self.water = self.machine.add_slot("Water", 90)
+        self.machine.load_coins({5: 4, 10: 4, 25: 4})
+
+    def test_plain_vending_machine_behavior(self):
+        """Check calls without arguments flip the state of an empty machine."""
+        machine = InventoryVendingMachine()
+        self.assertIsInstance(machine, VendingMachine)
+        self.assertEqual(machine.insert_coin(), "Coin Inserted. Select your drink.")
+        self.assertEqual(machine.state, "Dispensing")
+        self.assertEqual(machine.select_drink(), "Drink Dispensed. Thank you!")
+        self.assertEqual(machine.state, "Ready")
+
+    def test_plain_calls_refused_with_slots_or_credit(self):
+        """Check calls without arguments cannot bypass stock or payment."""
+        self.assertEqual(self.machine.insert_coin(), "Invalid coin.")
+        self.assertEqual(self.machine.state, "Ready")
+        self.machine.insert_coin(100)
+        self.assertEqual(self.machine.select_drink(), "Invalid selection.")
+        self.assertEqual(self.machine.credit, 100)
+        self.assertEqual(self.machine.stock[self.cola], 2)
+        self.assertEqual(self.machine.state, "Dispensing")
+
+        machine = InventoryVendingMachine()
+        machine.load_coins({25: 4})
+        machine.insert_coin(25)
+        self.assertEqual(machine.select_drink(), "Invalid selection.")
+        self.assertEqual(machine.insert_coin(), "Invalid coin.")
+        self.assertEqual(machine.credit, 25)
+
+    def test_vend_with_change(self):
+        """Check a vend takes the price and returns the change."""
+        self.machine.insert_coin(100)
+        self.machine.insert_coin(100)
+        self.assertEqual(self.machine.credit, 200)
+        result = self.machine.vend(self.cola)
+        self.assertEqual(result.status, VEND_OK)
+        self.assertEqual(result.change, {25: 3})
+        self.assertEqual(self.machine.credit, 0)
+        self.assertEqual(self.machine.state, "Ready")
+        self.assertEqual(self.machine.stock[self.cola], 1)
+        self.assertEqual(self.machine.coins, {5: 4, 10: 4, 25: 1, 100: 2})
+
+    def test_vend_failures_keep_credit(self):
+        """Check failed vends report why and keep the credit."""
+        self.assertEqual(self.machine.vend(self.cola).status, VEND_NOT_READY)
+        self.assertEqual(self.machine.insert_coin(3), "Invalid coin.")
+        self.machine.insert_coin(100)
+        self.assertEqual(self.machine.vend(7).status, VEND_UNKNOWN_SLOT)
+        self.assertEqual(self.machine.vend(self.water).status, VEND_SOLD_OUT)
+        self.assertEqual(self.machine.vend(self.cola).status, VEND_INSUFFICIENT_CREDIT)
+        self.assertEqual(self.machine.credit, 100)
+        self.assertEqual(self.machine.state, "Dispensing")
+
+    def test_vend_without_change(self):
+        """Check a vend is refused when the change cannot be paid."""
+        machine = InventoryVendingMachine()
+        slot = machine.add_slot("Water", 90, quantity=1)
+        machine.insert_coin(100)
+        self.assertEqual(machine.select_drink(slot), "Exact change only.")
+        machine.insert_coin(5)
+        machine.insert_coin(5)
+        self.assertEqual(machine.vend(slot).status, VEND_NO_CHANGE)
+        machine.load_coins({10: 1})
+        self.assertEqual(machine.vend(slot).change, {10: 1, 5: 2})
+
+    def test_select_drink_messages(self):
+        """Check select_drink reports the vend outcome."""
+        self.machine.insert_coin(100)
+        self.assertEqual(self.machine.select_drink(self.cola), "Insufficient credit.")
+        self.machine.insert_coin(25)
+        self.assertEqual(
+            self.machine.select_drink(self.cola), "Drink Dispensed. Thank you!"
+        )
+        self.assertEqual(
+            self.machine.select_drink(self.cola),
+            "Invalid operation in current state.",
+        )
+
+    def test_refund(self):
+        """Check the credit is given back."""
+        self.machine.insert_coin(25)
+        self.machine.insert_coin(10)
+        self.assertEqual(self.machine.refund(), {25: 1, 10: 1})
+        self.assertEqual(self.machine.credit, 0)
+        self.assertEqual(self.machine.state, "Ready")
+        self.assertEqual(self.machine.refund(), {})
+
+    def test_refund_slot_is_reserved(self):
+        """Check no slot can take the slot number reserved for refunds."""
+        machine = InventoryVendingMachine()
+        machine.names = ["Filler"] * REFUND_SLOT
+        with self.assertRaises(ValueError):
+            machine.add_slot("Cola", 125)
+
+    def test_load_invalid_coins(self):
+        """Check unknown coins cannot be loaded."""
+        with self.assertRaises(ValueError):
+            self.machine.load_coins({3: 1})
+
+    def test_transaction_log(self):
+        """Check restocks, vends and refunds are logged."""
+        handle, path = tempfile.mkstemp(suffix=".log")
+        os.close(handle)
+        self.addCleanup(os.remove, path)
+        with TransactionLog(path, clock=lambda: 1.0) as log:
+            machine = InventoryVendingMachine(log=log)
+            slot = machine.add_slot("Cola", 125, quantity=3)
+            machine.insert_coin(100)
+            machine.insert_coin(25)
+            machine.select_drink(slot)
+            machine.insert_coin(10)
+            machine.refund()
+        self.assertEqual(
+            [(record.kind, record.slot, record.amount) for record in replay(path)],
+            [(LOG_RESTOCK, 0, 3), (LOG_VEND, 0, 125), (LOG_REFUND, REFUND_SLOT, 10)],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,23 +7,31 @@ import io
 import unittest
 from unittest import mock
 
+from src.credentials import CredentialStore
+from src.money import MONEY_CENTS, get_money_mode, set_money_mode
 from src.white_box import (
+    PRODUCT_CATEGORIES,
     BankAccount,
     BankingSystem,
     DocumentEditingSystem,
     ElevatorSystem,
     Product,
+    ProductCatalog,
     ShoppingCart,
     TrafficLight,
+    TrafficLightFleet,
+    TransferResult,
     UserAuthentication,
     VendingMachine,
     authenticate_user,
     calculate_items_shipping_cost,
     calculate_order_total,
+    calculate_order_totals,
     calculate_quantity_discount,
     calculate_shipping_cost,
     calculate_total_discount,
     categorize_product,
+    categorize_products,
     celsius_to_fahrenheit,
     check_file_size,
     check_flight_eligibility,
@@ -40,6 +48,7 @@ from src.white_box import (
     validate_email,
     validate_login,
     validate_password,
+    validate_passwords,
     validate_url,
     verify_age,
 )
@@ -224,6 +233,43 @@ class TestWhiteBoxValidatePass(unittest.TestCase):
         """Checks if a password with special characters not in the required set returns False."""
         self.assertFalse(validate_password("Password1*"))
 
+    def test_validate_password_unicode_digit(self):
+        """Checks that any Unicode decimal digit counts as a digit."""
+        self.assertTrue(validate_password("Password\u0663!"))
+
+
+class TestWhiteBoxValidatePasswords(unittest.TestCase):
+    """White-box unittest class - #2 validate_passwords."""
+
+    def test_validate_passwords_matches_scalar(self):
+        """Checks the batch results match validate_password one by one."""
+        passwords = ["Password1!", "Pa1!", "password1!", "PASSWORD1!", "Password1*"]
+        self.assertEqual(
+            validate_passwords(passwords),
+            [validate_password(password) for password in passwords],
+        )
+
+    def test_validate_passwords_empty(self):
+        """Checks an empty batch returns an empty list."""
+        self.assertEqual(validate_passwords([]), [])
+
+    def test_validate_passwords_accepts_generator(self):
+        """Checks any iterable of passwords is accepted."""
+        self.assertEqual(
+            validate_passwords(p for p in ("Password1!", "x")), [True, False]
+        )
+
+    def test_validate_passwords_with_reasons(self):
+        """Checks the failed rules are reported for each password."""
+        results, reasons = validate_passwords(
+            ["Password1!", "pa1", "PASSWORD1*"], with_reasons=True
+        )
+        self.assertEqual(results, [True, False, False])
+        self.assertEqual(
+            reasons,
+            [(), ("length", "uppercase", "special"), ("lowercase", "special")],
+        )
+
 
 class TestWhiteBoxCalculatorTotalDiscount(unittest.TestCase):
     """White-box unittest class - #3 Calculator_total_discount."""
@@ -261,6 +307,20 @@ class TestWhiteBoxCalculatorTotalDiscount(unittest.TestCase):
         """Checks handling of negative amounts."""
         self.assertEqual(calculate_total_discount(-100), 0)
 
+    def test_calculate_total_discount_cents(self):
+        """Checks the integer cents mode uses the same thresholds in cents."""
+        self.assertEqual(calculate_total_discount(9999, money="cents"), 0)
+        self.assertEqual(calculate_total_discount(10000, money="cents"), 1000)
+        self.assertEqual(calculate_total_discount(50000, money="cents"), 5000)
+        self.assertEqual(calculate_total_discount(50001, money="cents"), 10000)
+        self.assertEqual(calculate_total_discount(33333, money="cents"), 3333)
+
+    def test_calculate_total_discount_global_cents(self):
+        """Checks the global money mode applies when none is given."""
+        self.addCleanup(set_money_mode, get_money_mode())
+        set_money_mode(MONEY_CENTS)
+        self.assertEqual(calculate_total_discount(12345), 1235)
+
 
 class TestWhiteBoxCalculateOrderTotal(unittest.TestCase):
     """White-box unittest class - #4 calculate_order_total."""
@@ -290,6 +350,80 @@ class TestWhiteBoxCalculateOrderTotal(unittest.TestCase):
         items = [{"quantity": 0, "price": 10}]
         self.assertEqual(calculate_order_total(items), 0)
 
+    def test_calculate_order_total_cents(self):
+        """Checks integer cents totals are exact and rounded per line."""
+        items = [
+            {"quantity": 3, "price": 1000},
+            {"quantity": 7, "price": 1999},
+            {"quantity": 11, "price": 333},
+        ]
+        total = calculate_order_total(items, money="cents")
+        self.assertEqual(total, 3000 + 13293 + 3297)
+        self.assertIsInstance(total, int)
+
+
+class TestWhiteBoxCalculateOrderTotals(unittest.TestCase):
+    """White-box unittest class - #4 calculate_order_totals."""
+
+    def test_calculate_order_totals_matches_scalar(self):
+        """Checks every columnar total is identical to the scalar one."""
+        orders = [
+            [],
+            [{"quantity": 3, "price": 10}],
+            [{"quantity": 8, "price": 10}],
+            [{"quantity": 15, "price": 10}],
+            [{"quantity": 0, "price": 10}],
+            [
+                {"quantity": 7, "price": 0.1},
+                {"quantity": 12, "price": 19.99},
+                {"quantity": 2, "price": 3.3},
+            ],
+            [{"quantity": 2.5, "price": 4}, {"quantity": 5.5, "price": 4}],
+            [{"quantity": -1, "price": 4}, {"quantity": 7.0, "price": 1.1}],
+        ]
+        quantities = [item["quantity"] for order in orders for item in order]
+        prices = [item["price"] for order in orders for item in order]
+        offsets = [0]
+        for order in orders:
+            offsets.append(offsets[-1] + len(order))
+
+        totals = calculate_order_totals(quantities, prices, offsets)
+        expected = [calculate_order_total(order) for order in orders]
+        self.assertEqual([repr(total) for total in totals], list(map(repr, expected)))
+
+    def test_calculate_order_totals_dict_of_columns(self):
+        """Checks the columns can be passed as a dict."""
+        columns = {
+            "quantities": [1, 6, 11],
+            "prices": [10, 10, 10],
+            "offsets": [0, 1, 3],
+        }
+        self.assertEqual(calculate_order_totals(**columns), [10, 0.95 * 6 * 10 + 99.0])
+
+    def test_calculate_order_totals_no_orders(self):
+        """Checks that no orders give no totals."""
+        self.assertEqual(calculate_order_totals([], [], [0]), [])
+
+    def test_calculate_order_totals_uses_offsets(self):
+        """Checks orders are read from their offsets, not from the first line."""
+        self.assertEqual(calculate_order_totals([1, 1, 1], [1, 2, 3], [1, 3]), [5])
+        self.assertEqual(
+            calculate_order_totals([1, 1, 1, 1], [1, 2, 3, 4], [0, 1, 1, 3]),
+            [1, 0, 5],
+        )
+
+    def test_calculate_order_totals_invalid_columns(self):
+        """Checks mismatched columns and bad offsets are rejected."""
+        for quantities, prices, offsets in (
+            ([1, 1], [1], [0, 1]),
+            ([1, 1], [1, 2], [0, 3]),
+            ([1, 1], [1, 2], [2, 1]),
+            ([1, 1], [1, 2], [-1, 1]),
+        ):
+            with self.subTest(offsets=offsets):
+                with self.assertRaises(ValueError):
+                    calculate_order_totals(quantities, prices, offsets)
+
 
 class TestWhiteBoxCalculateItemsShipingCost(unittest.TestCase):
     """White-box unittest class - #5 calculate_items_shipping_cost."""
@@ -329,6 +463,11 @@ class TestWhiteBoxCalculateItemsShipingCost(unittest.TestCase):
         """Check shipping cost for an empty items list"""
         self.assertEqual(calculate_items_shipping_cost([], "standard"), 10)
 
+    def test_calculate_items_shipping_cost_invalid_method(self):
+        """Check an unknown shipping method raises ValueError"""
+        with self.assertRaises(ValueError):
+            calculate_items_shipping_cost([{"weight": 1}], "overnight")
+
 
 class TestWhiteBoxValidateLogin(unittest.TestCase):
     """White-box unittest class - #6 validate_login."""
@@ -438,6 +577,24 @@ class TestWhiteBoxCategorizeProduct(unittest.TestCase):
         """Checks if price above upper boundary of Category D (201) returns 'Category D'."""
         self.assertEqual(categorize_product(201), "Category D")
 
+    def test_categorize_product_no_gaps(self):
+        """Checks prices between the integer boundaries fall in a bucket."""
+        self.assertEqual(categorize_product(50.5), "Category B")
+        self.assertEqual(categorize_product(100.5), "Category C")
+        self.assertEqual(categorize_product(200.01), "Category D")
+        self.assertEqual(categorize_product(9.99), "Category D")
+
+    def test_categorize_products_codes(self):
+        """Checks a price column is categorized into small-int codes."""
+        prices = [9, 10, 50, 50.5, 100, 100.5, 200, 201]
+        codes = categorize_products(prices)
+        self.assertEqual(codes.typecode, "b")
+        self.assertEqual(list(codes), [3, 0, 0, 1, 1, 2, 2, 3])
+        self.assertEqual(
+            [PRODUCT_CATEGORIES[code] for code in codes],
+            [categorize_product(price) for price in prices],
+        )
+
 
 class TestWhiteBoxValidateEmail(unittest.TestCase):
     """White-box unittest class - #9 validate_email."""
@@ -606,6 +763,20 @@ class TestWhiteBoxValidateDate(unittest.TestCase):
         """Checks if day at upper boundary (31) returns 'Valid Date."""
         self.assertEqual(validate_date(2000, 5, 31), "Valid Date")
 
+    def test_validate_date_short_months(self):
+        """Checks days past the end of 30-day months are rejected."""
+        self.assertEqual(validate_date(2000, 4, 30), "Valid Date")
+        self.assertEqual(validate_date(2000, 4, 31), "Invalid Date")
+        self.assertEqual(validate_date(2000, 11, 31), "Invalid Date")
+
+    def test_validate_date_leap_years(self):
+        """Checks February 29th only exists in leap years."""
+        self.assertEqual(validate_date(2000, 2, 29), "Valid Date")
+        self.assertEqual(validate_date(2024, 2, 29), "Valid Date")
+        self.assertEqual(validate_date(1900, 2, 29), "Invalid Date")
+        self.assertEqual(validate_date(2023, 2, 29), "Invalid Date")
+        self.assertEqual(validate_date(2024, 2, 30), "Invalid Date")
+
 
 class TestWhiteBoxCheckFlightEligibility(unittest.TestCase):
     """White-box unittest class - #13 check_flight_eligibility(age, frequent_flyer)."""
@@ -667,6 +838,11 @@ class TestWhiteBoxValidateURL(unittest.TestCase):
         long_url = "http://" + "a" * 250 + ".com"
         self.assertEqual(validate_url(long_url), "Invalid URL")
 
+    def test_validate_url_too_long_https(self):
+        """Checks the length limit also applies to HTTPS URLs."""
+        long_url = "https://" + "a" * 250 + ".com"
+        self.assertEqual(validate_url(long_url), "Invalid URL")
+
     def test_validate_url_max_lenght(self):
         """Checks if URL at maximum length (255) returns 'Valid URL'."""
         max_url = "http://" + "a" * 244 + ".com"
@@ -811,6 +987,19 @@ class TestWhiteBoxAuthenticateUser(unittest.TestCase):
         """Checks authentication with invalid credentials."""
         self.assertEqual(authenticate_user("user", "pass"), "Invalid")
 
+    def test_authenticate_user_with_custom_admin_store(self):
+        """Checks administrators come from the given credential store."""
+        admins = CredentialStore({"root": "s3cret-pass"}, iterations=1)
+        self.assertEqual(authenticate_user("root", "s3cret-pass", admins), "Admin")
+        self.assertEqual(authenticate_user("admin", "admin123", admins), "User")
+
+    def test_authenticate_user_skips_hash_for_non_admins(self):
+        """Checks ordinary users are not run through the admin password hash."""
+        admins = CredentialStore({"root": "s3cret-pass"}, iterations=1)
+        with mock.patch.object(admins, "verify") as verify:
+            self.assertEqual(authenticate_user("johndoe", "password1", admins), "User")
+        verify.assert_not_called()
+
 
 class TestWhiteBoxGetWeatherAdvisory(unittest.TestCase):
     """White-box unittest class - #21 get_weather_advisory(temperature, humidity)."""
@@ -898,6 +1087,49 @@ class TestWhiteBoxTrafficLight(unittest.TestCase):
         self.assertEqual(light.get_current_state(), "Red")
 
 
+class TestWhiteBoxTrafficLightFleet(unittest.TestCase):
+    """White-box unittest class - #23 TrafficLightFleet."""
+
+    def test_traffic_light_fleet_initial_state(self):
+        """Check every light of a new fleet is 'Red'."""
+        fleet = TrafficLightFleet(3)
+        self.assertEqual(len(fleet), 3)
+        self.assertEqual(fleet.counts(), {"Red": 3, "Green": 0, "Yellow": 0})
+
+    def test_traffic_light_fleet_change_state(self):
+        """Check the whole fleet cycles like a single TrafficLight."""
+        fleet = TrafficLightFleet(2)
+        light = TrafficLight()
+        for _ in range(4):
+            fleet.change_state()
+            light.change_state()
+            self.assertEqual(fleet.get_current_state(0), light.get_current_state())
+            self.assertEqual(fleet.get_current_state(1), light.get_current_state())
+
+    def test_traffic_light_fleet_masked_change_state(self):
+        """Check a masked step only changes the selected lights."""
+        fleet = TrafficLightFleet(4)
+        fleet.change_state(bytes([1, 0, 1, 0]))
+        fleet.change_state([True, True, False, False])
+        self.assertEqual(
+            [fleet.get_current_state(index) for index in range(4)],
+            ["Yellow", "Green", "Green", "Red"],
+        )
+
+    def test_traffic_light_fleet_views(self):
+        """Check views read and step a single light of the fleet."""
+        fleet = TrafficLightFleet(3)
+        view = fleet[-1]
+        view.change_state()
+        self.assertEqual(view.get_current_state(), "Green")
+        self.assertEqual(fleet[2].get_current_state(), "Green")
+        self.assertEqual(fleet[0].get_current_state(), "Red")
+        fleet.change_state()
+        self.assertEqual(view.get_current_state(), "Yellow")
+        with self.assertRaises(IndexError):
+            fleet[3]  # pylint: disable=pointless-statement
+
+
 class TestWhiteBoxUserAuthentication(unittest.TestCase):
     """White-box unittest class - #24 UserAuthentication."""
 
@@ -1125,6 +1357,185 @@ class TestWhiteBoxBankingSystem(unittest.TestCase):
                 "Money transfer of $100 (regular transfer)", fake_stdout.getvalue()
             )
 
+    def test_banking_system_transfer_result(self):
+        """Check transfer returns the status, fee and reason code."""
+        self.banking_system.logged_in_users.add("user123")
+        with mock.patch("sys.stdout", new=io.StringIO()):
+            self.assertEqual(
+                self.banking_system.transfer("user123", "user456", 100, "express"),
+                TransferResult(True, 5.0, "ok"),
+            )
+            self.assertEqual(
+                self.banking_system.transfer("user123", "user456", 100, "invalid"),
+                TransferResult(False, None, "invalid_type"),
+            )
+
+    def test_banking_system_quiet_mode_prints_nothing(self):
+        """Check quiet mode without a sink writes nothing to stdout."""
+        banking_system = BankingSystem(quiet=True)
+        with mock.patch("sys.stdout", new=io.StringIO()) as fake_stdout:
+            self.assertTrue(banking_system.authenticate("user123", "pass123"))
+            result = banking_system.transfer("user123", "user456", 100, "scheduled")
+            self.assertEqual(fake_stdout.getvalue(), "")
+        self.assertEqual(result, TransferResult(True, 1.0, "ok"))
+
+    def test_banking_system_quiet_mode_logs(self):
+        """Check quiet mode without a sink reports to the module logger."""
+        banking_system = BankingSystem(quiet=True)
+        with self.assertLogs("src.white_box", level="INFO") as logs:
+            banking_system.authenticate("wrong_user", "wrong_pass")
+        self.assertEqual(logs.output, ["INFO:src.white_box:Authentication failed."])
+
+    def test_banking_system_quiet_mode_sink(self):
+        """Check quiet mode sends formatted messages to the sink."""
+        messages = []
+        banking_system = BankingSystem(quiet=True, sink=messages.append)
+        banking_system.authenticate("user123", "pass123")
+        self.mock_account.return_value.balance = 50
+        result = banking_system.transfer("user123", "user456", 100, "regular")
+        self.assertEqual(result, TransferResult(False, 2.0, "insufficient_funds"))
+        self.assertEqual(
+            messages,
+            ["User user123 authenticated successfully.", "Insufficient funds."],
+        )
+
+    def test_banking_system_custom_credentials(self):
+        """Check users are authenticated against the given credential store."""
+        credentials = CredentialStore({"user456": "pass456"}, iterations=1)
+        banking_system = BankingSystem(quiet=True, credentials=credentials)
+        self.assertFalse(banking_system.authenticate("user123", "pass123"))
+        self.assertTrue(banking_system.authenticate("user456", "pass456"))
+
+
+class TestWhiteBoxBankingSystemLedger(unittest.TestCase):
+    """White-box unittest class - #28 BankingSystem ledger."""
+
+    def setUp(self):
+        """Setup a quiet BankingSystem with a logged in user."""
+        self.banking_system = BankingSystem(quiet=True)
+        self.banking_system.logged_in_users.add("user123")
+
+    def balances(self):
+        """Current balance of every ledger account."""
+        return {
+            number: account.balance
+            for number, account in self.banking_system.accounts.items()
+        }
+
+    def test_banking_system_transfer_updates_balances(self):
+        """Check a transfer debits the sender and credits receiver and fees."""
+        self.banking_system.open_account("user456", 0)
+        self.assertTrue(
+            self.banking_system.transfer_money("user123", "user456", 100, "regular")
+        )
+        self.assertEqual(
+            self.balances(), {"fees": 2.0, "user123": 898.0, "user456": 100}
+        )
+
+    def test_banking_system_balance_runs_out(self):
+        """Check balances persist between transfers until funds run out."""
+        for _ in range(9):
+            self.assertTrue(
+                self.banking_system.transfer_money("user123", "user456", 100, "express")
+            )
+        self.assertEqual(
+            self.banking_system.transfer("user123", "user456", 100, "express").reason,
+            "insufficient_funds",
+        )
+        self.assertEqual(self.balances()["user123"], 55)
+
+    def test_banking_system_failed_transfer_keeps_balances(self):
+        """Check failed transfers leave every balance untouched."""
+        self.banking_system.open_account("user123", 50)
+        self.banking_system.transfer("user123", "user456", 100, "regular")
+        self.banking_system.transfer("user123", "user456", 10, "invalid")
+        self.assertEqual(self.balances(), {"fees": 0, "user123": 50})
+
+    def test_banking_system_transfer_batch(self):
+        """Check a batch returns one result per transfer, applied in order."""
+        self.banking_system.open_account("user123", 200)
+        results = self.banking_system.transfer_batch(
+            [
+                ("user123", "user456", 100, "scheduled"),
+                ("user456", "user123", 100, "regular"),
+                ("user123", "user456", 100, "scheduled"),
+            ]
+        )
+        self.assertEqual(
+            [result.reason for result in results],
+            ["ok", "not_authenticated", "insufficient_funds"],
+        )
+        self.assertEqual(
+            self.balances(), {"fees": 1.0, "user123": 99.0, "user456": 100}
+        )
+
+    def test_banking_system_money_is_conserved(self):
+        """Check successful transfers never create or destroy money."""
+        self.banking_system.logged_in_users.add("user456")
+        before = sum(self.balances().values()) + 1000
+        self.banking_system.transfer_batch(
+            [("user123", "user456", 10 * i, "regular") for i in range(5)]
+            + [("user456", "user123", 7 * i, "express") for i in range(5)]
+        )
+        self.assertAlmostEqual(sum(self.balances().values()), before)
+
+    def test_banking_system_cents(self):
+        """Check the cents mode charges exact integer fees."""
+        banking_system = BankingSystem(quiet=True, money="cents")
+        banking_system.logged_in_users.add("user123")
+        result = banking_system.transfer("user123", "user456", 12345, "regular")
+        self.assertEqual(result, TransferResult(True, 247, "ok"))
+        self.assertEqual(banking_system.accounts["user123"].balance, 100000 - 12592)
+        self.assertEqual(banking_system.accounts["user456"].balance, 12345)
+
+    def test_banking_system_receiver_opens_empty(self):
+        """Check a receiver opened by a transfer only holds the amount sent."""
+        self.banking_system.transfer("user123", "user456", 100, "scheduled")
+        self.assertEqual(
+            self.balances(), {"fees": 1.0, "user123": 899.0, "user456": 100}
+        )
+
+    def test_banking_system_rejects_non_positive_amounts(self):
+        """Check zero and negative amounts are refused without side effects."""
+        messages = []
+        banking_system = BankingSystem(quiet=True, sink=messages.append)
+        banking_system.logged_in_users.add("user123")
+        for amount in (0, -500):
+            with self.subTest(amount=amount):
+                self.assertEqual(
+                    banking_system.transfer("user123", "user456", amount, "regular"),
+                    TransferResult(False, None, "invalid_amount"),
+                )
+        self.assertEqual(messages, ["Invalid transfer amount."] * 2)
+        self.assertEqual(banking_system.accounts["fees"].balance, 0)
+        self.assertNotIn("user456", banking_system.accounts)
+
+    def test_banking_system_cents_message(self):
+        """Check the cents mode reports amounts in dollars."""
+        messages = []
+        banking_system = BankingSystem(quiet=True, sink=messages.append, money="cents")
+        banking_system.logged_in_users.add("user123")
+        banking_system.transfer("user123", "user456", 10050, "express")
+        self.assertIn("Money transfer of $100.50 (express transfer)", messages[0])
+
+    def test_banking_system_cents_rejects_non_int_amounts(self):
+        """Check the cents mode refuses fractional amounts before any change."""
+        banking_system = BankingSystem(quiet=True, money="cents")
+        banking_system.logged_in_users.add("user123")
+        result = banking_system.transfer("user123", "bob", 12345.0, "regular")
+        self.assertEqual(result, TransferResult(False, None, "invalid_amount"))
+        self.assertEqual(banking_system.accounts["fees"].balance, 0)
+        self.assertNotIn("user123", banking_system.accounts)
+        self.assertNotIn("bob", banking_system.accounts)
+
+    def test_banking_system_quiet_skips_formatting(self):
+        """Check amounts are not formatted when nobody is listening."""
+        banking_system = BankingSystem(quiet=True, money="cents")
+        banking_system.logged_in_users.add("user123")
+        with mock.patch("src.white_box.format_cents") as format_cents:
+            banking_system.transfer("user123", "user456", 10050, "express")
+        format_cents.assert_not_called()
+
 
 class TestWhiteBoxProduct(unittest.TestCase):
     """White-box unittest class - #29 Product."""
@@ -1146,6 +1557,56 @@ class TestWhiteBoxProduct(unittest.TestCase):
             )
             self.assertEqual(return_value, "The product Phone has a price of 500")
 
+    def test_product_has_no_instance_dict(self):
+        """Check products are slotted and reject unknown attributes."""
+        product = Product("Phone", 500)
+        self.assertFalse(hasattr(product, "__dict__"))
+        with self.assertRaises(AttributeError):
+            setattr(product, "color", "black")
+
+
+class TestWhiteBoxProductCatalog(unittest.TestCase):
+    """White-box unittest class - #29 ProductCatalog."""
+
+    def test_product_catalog_add_product(self):
+        """Check products are stored as columns."""
+        catalog = ProductCatalog()
+        self.assertEqual(catalog.add_product("Laptop", 1000), 0)
+        self.assertEqual(catalog.add_product("Phone", 49.5), 1)
+        self.assertEqual(len(catalog), 2)
+        self.assertEqual(catalog.names, ["Laptop", "Phone"])
+        self.assertEqual(list(catalog.prices), [1000.0, 49.5])
+        self.assertEqual(catalog.prices.typecode, "d")
+
+    def test_product_catalog_keeps_int_prices(self):
+        """Check int prices read back as ints until a float price is added."""
+        catalog = ProductCatalog([Product("Laptop", 1000)])
+        price = catalog[0].price
+        self.assertEqual(price, 1000)
+        self.assertIsInstance(price, int)
+        self.assertEqual(catalog.prices.typecode, "q")
+        catalog.add_product("Phone", 49.5)
+        self.assertEqual(list(catalog.prices), [1000.0, 49.5])
+        self.assertIsInstance(catalog[0].price, float)
+
+    def test_product_catalog_from_products(self):
+        """Check a catalog can be built from products and read back."""
+        catalog = ProductCatalog([Product("Laptop", 1000), Product("Phone", 500)])
+        product = catalog[1]
+        self.assertIsInstance(product, Product)
+        self.assertEqual(product.name, "Phone")
+        self.assertEqual(product.price, 500)
+
+    def test_product_catalog_index_error(self):
+        """Check reading past the end raises IndexError."""
+        with self.assertRaises(IndexError):
+            ProductCatalog()[0]  # pylint: disable=expression-not-assigned
+
+    def test_product_catalog_category_codes(self):
+        """Check the price column is categorized in one call."""
+        catalog = ProductCatalog([Product("Pen", 5), Product("Phone", 75.5)])
+        self.assertEqual(list(catalog.category_codes()), [3, 1])
+
 
 class TestWhiteBoxShoppingCart(unittest.TestCase):
     """White-box unittest class - #30 ShoppingCart."""
@@ -1207,3 +1668,83 @@ class TestWhiteBoxShoppingCart(unittest.TestCase):
             output = fake_stdout.getvalue()
             self.assertIn("Total: $1100", output)
             self.assertIn("Checkout completed", output)
+
+    def test_shopping_cart_cents(self):
+        """Check the cents mode prints totals as dollars."""
+        cart = ShoppingCart(money="cents")
+        cart.add_product(Product("Pen", 10), 3)
+        cart.add_product(Product("Pencil", 20))
+        with mock.patch("sys.stdout", new=io.StringIO()) as fake_stdout:
+            cart.view_cart()
+            cart.checkout()
+            output = fake_stdout.getvalue()
+        self.assertIn("3 x Pen - $0.30", output)
+        self.assertIn("Total: $0.50", output)
+        self.assertEqual(cart.total, 50)
+
+    def test_shopping_cart_running_totals(self):
+        """Check the total and item count follow adds and removes."""
+        self.cart.add_product(self.product1, 2)
+        self.cart.add_product(self.product2, 3)
+        self.assertEqual(self.cart.total, 2150)
+        self.assertEqual(self.cart.item_count, 5)
+        self.cart.remove_product(self.product2, 1)
+        self.assertEqual(self.cart.total, 2100)
+        self.assertEqual(self.cart.item_count, 4)
+        self.cart.remove_product(self.product1, 5)
+        self.assertEqual(self.cart.total, 100)
+        self.assertEqual(self.cart.item_count, 2)
+
+    def test_shopping_cart_remove_missing_product(self):
+        """Check removing a product that is not in the cart does nothing."""
+        self.cart.add_product(self.product1)
+        self.cart.remove_product(self.product2)
+        self.assertEqual(len(self.cart.items), 1)
+        self.assertEqual(self.cart.total, 1000)
+
+    def test_shopping_cart_keeps_order(self):
+        """Check the items keep the order in which they were added."""
+        product3 = Product("Tablet", 300)
+        self.cart.add_product(self.product1)
+        self.cart.add_product(self.product2)
+        self.cart.add_product(product3)
+        self.cart.remove_product(self.product1)
+        self.cart.add_product(self.product2)
+        self.cart.add_product(self.product1)
+        self.assertEqual(
+            [item["product"] for item in self.cart.items],
+            [self.product2, product3, self.product1],
+        )
+
+    def test_shopping_cart_price_change(self):
+        """Check lines keep the price they were added at."""
+        product = Product("A", 10)
+        self.cart.add_product(product, 2)
+        product.price = 12
+        self.cart.add_product(Product("B", 1))
+        self.cart.remove_product(product)
+        with mock.patch("sys.stdout", new=io.StringIO()) as fake_stdout:
+            self.cart.view_cart()
+            self.cart.checkout()
+            output = fake_stdout.getvalue()
+        self.assertIn("1 x A - $10", output)
+        self.assertIn("1 x B - $1", output)
+        self.assertIn("Total: $11", output)
+
+    def test_shopping_cart_readd_reprices_line(self):
+        """Check adding a product again reprices its line."""
+        product = Product("A", 10)
+        self.cart.add_product(product, 2)
+        product.price = 12
+        self.cart.add_product(product)
+        self.assertEqual(self.cart.total, 36)
+        self.assertEqual(self.cart.items[0]["price"], 12)
+
+    def test_shopping_cart_empty_resets_total(self):
+        """Check emptying the cart drops float rounding from the total."""
+        product = Product("Pen", 0.1)
+        self.cart.add_product(product)
+        self.cart.add_product(Product("Pencil", 0.2))
+        self.cart.remove_product(product)
+        self.cart.remove_product(self.cart.items[0]["product"])
+        self.assertEqual(self.cart.total, 0)